@@ -4,6 +4,7 @@ Core logic per automazione Context Engineering
 """
 
 import os
+import copy
 import json
 import logging
 from pathlib import Path
@@ -64,7 +65,8 @@ class ContextEngineerAgent:
         """Carica database progetti dalla configurazione"""
         db_path = self.config_dir / 'projects.json'
         if db_path.exists():
-            return load_json(db_path)
+            # Il database viene modificato in place: non condividerlo con la cache di load_json
+            return copy.deepcopy(load_json(db_path))
         return {'projects': {}, 'last_updated': datetime.now().isoformat()}
     
     def _save_projects_db(self):
@@ -572,7 +572,6 @@ if __name__ == '__main__':
         ctx.obj = {'verbose': False, 'debug': False}
         setup_logging(False, False)
         
-        from interface.menu import show_welcome_message
         show_welcome_message()
         
         menu.invoke(ctx)
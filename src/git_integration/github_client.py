@@ -26,6 +26,13 @@ class GitHubClient:
         self.github = None
         self.user = None
         
+        # Shared keep-alive session for unauthenticated REST calls
+        self._session = requests.Session()
+        self._session.headers.update({
+            'Accept': 'application/vnd.github+json',
+            'User-Agent': 'context-engineer-agent'
+        })
+        
         if token:
             self._authenticate()
     
@@ -276,7 +283,7 @@ class GitHubClient:
             List of gitignore template names
         """
         try:
-            response = requests.get("https://api.github.com/gitignore/templates")
+            response = self._session.get("https://api.github.com/gitignore/templates")
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -295,7 +302,7 @@ class GitHubClient:
             List of license template information
         """
         try:
-            response = requests.get("https://api.github.com/licenses")
+            response = self._session.get("https://api.github.com/licenses")
             response.raise_for_status()
             licenses = response.json()
             
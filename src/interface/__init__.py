@@ -3,15 +3,35 @@ Interface module for Context Engineer Agent
 Provides enhanced CLI interface with ASCII art and interactive prompts
 """
 
-from .menu import show_main_menu, get_menu_choice, show_welcome_message, show_command_list, show_next_steps
-from .prompts import ask_new_project_questions, ask_existing_project_questions
+# Submodules are imported lazily (PEP 562) so that importing the package
+# does not pull in rich/inquirer until a symbol is actually used.
+_MENU_EXPORTS = {
+    'show_main_menu',
+    'get_menu_choice',
+    'show_welcome_message',
+    'show_command_list',
+    'show_next_steps'
+}
+_PROMPTS_EXPORTS = {
+    'ask_new_project_questions',
+    'ask_existing_project_questions'
+}
 
 __all__ = [
     'show_main_menu',
     'get_menu_choice',
     'show_welcome_message',
-    'show_command_list', 
+    'show_command_list',
     'show_next_steps',
     'ask_new_project_questions',
     'ask_existing_project_questions'
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    if name in _MENU_EXPORTS:
+        from . import menu
+        return getattr(menu, name)
+    if name in _PROMPTS_EXPORTS:
+        from . import prompts
+        return getattr(prompts, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
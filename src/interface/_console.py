@@ -0,0 +1,43 @@
+"""
+Shared rich console for the interface package
+"""
+
+from rich.console import Console, Group, RenderableType
+from rich.text import Text
+from typing import List
+
+class BufferedConsole(Console):
+    """Console that collects renderables and emits them in a single print"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._line_buffer: List[RenderableType] = []
+    
+    def write(self, renderable: RenderableType):
+        """Queue a renderable for the next flush"""
+        self._line_buffer.append(renderable)
+    
+    def writeln(self):
+        """Queue an empty line for the next flush"""
+        self._line_buffer.append(Text())
+    
+    def flush(self):
+        """Render all queued renderables off-screen and emit them in one write"""
+        if not self._line_buffer:
+            return
+        
+        renderables, self._line_buffer = self._line_buffer, []
+        
+        # The legacy Windows console cannot interpret the ANSI escapes of a
+        # captured render: let rich write through its own path there
+        if self.legacy_windows:
+            self.print(Group(*renderables))
+            return
+        
+        with self.capture() as capture:
+            self.print(Group(*renderables))
+        self.file.write(capture.get())
+        self.file.flush()
+
+# Single console instance so terminal capabilities are probed only once
+console = BufferedConsole()
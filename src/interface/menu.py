@@ -2,17 +2,97 @@
 Enhanced CLI menu with ASCII art for AiGENIO by Franco
 """
 
-import os
+import sys
 import logging
-from rich.console import Console
+import functools
+from rich.console import RenderableType
 from rich.panel import Panel
-from rich.align import Align
 from rich.text import Text
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
+
+from ._console import console
 
-console = Console()
 logger = logging.getLogger(__name__)
 
+# ANSI styles for the one-line status helpers, which bypass rich rendering
+_STYLE_YELLOW = "\x1b[1;33m"
+_STYLE_GREEN = "\x1b[1;32m"
+_STYLE_RED = "\x1b[1;31m"
+_STYLE_BLUE = "\x1b[1;34m"
+_RESET = "\x1b[0m"
+
+# Equivalent rich styles, used where raw ANSI cannot be written
+_RICH_STYLES = {
+    _STYLE_YELLOW: "bold yellow",
+    _STYLE_GREEN: "bold green",
+    _STYLE_RED: "bold red",
+    _STYLE_BLUE: "bold blue"
+}
+
+# Accepted inputs for the simplified fallback menu; the quit words only
+# apply to line input, single-key mode quits on 'q'
+_VALID_CHOICES = frozenset({'1', '2', '3'})
+_QUIT_CHOICES = frozenset({'q', 'quit', 'exit'})
+
+# Keys returned by readchar for Ctrl+C, Ctrl+D (EOF) and Ctrl+Z (EOF on Windows)
+_ABORT_KEYS = frozenset({'\x03', '\x04', '\x1a'})
+
+_CHOICE_PROMPT = "Seleziona (1-3, q): "
+
+# Pre-encoded messages written straight to the binary stream
+_MSG_BYE = f"\n{_STYLE_YELLOW}👋 Arrivederci!{_RESET}\n".encode('utf-8')
+_MSG_BYE_PLAIN = "\n👋 Arrivederci!\n".encode('utf-8')
+
+# Static panels are built once at import and reused on every draw; bodies
+# are pre-parsed so rich does not re-run the markup parser on each print
+_WELCOME_BODY = Text.from_markup("""
+🎯 [bold]Benvenuto in AiGENIO by Franco![/bold]
+
+Questo strumento ti aiuterà a:
+• 🚀 Creare nuovi progetti con best practices
+• 📊 Analizzare progetti esistenti
+• 🔧 Generare file di configurazione ottimizzati
+• 🔄 Integrare backup automatici su GitHub
+• 📚 Accedere a best practices aggiornate via MCP
+
+[dim]Suggerimento: Usa 'q' in qualsiasi momento per uscire[/dim]
+    """)
+
+_WELCOME_PANEL = Panel(
+    _WELCOME_BODY,
+    title="[bold blue]AiGENIO Assistant[/bold blue]",
+    border_style="blue",
+    padding=(1, 2)
+)
+
+_COMMANDS_BODY = Text.from_markup("""
+📋 [bold]Comandi Disponibili:[/bold]
+
+[bold green]Comandi Principali:[/bold green]
+• [cyan]setup[/cyan] - Configura un nuovo progetto
+• [cyan]analyze[/cyan] - Analizza un progetto esistente
+• [cyan]generate[/cyan] - Genera file CLAUDE.md e INITIAL.md
+• [cyan]validate[/cyan] - Valida la configurazione del progetto
+• [cyan]report[/cyan] - Genera report di analisi
+• [cyan]templates[/cyan] - Gestisce i template
+
+[bold blue]Nuove Funzionalità:[/bold blue]
+• [cyan]menu[/cyan] - Mostra questo menu interattivo
+• [cyan]backup[/cyan] - Backup automatico su GitHub
+• [cyan]preferences[/cyan] - Gestisce le preferenze utente
+• [cyan]best-practices[/cyan] - Consulta best practices aggiornate
+
+[dim]Usa: python -m src.cli <comando> --help per maggiori dettagli[/dim]
+    """)
+
+_COMMANDS_PANEL = Panel(
+    _COMMANDS_BODY,
+    title="[bold blue]Lista Comandi[/bold blue]",
+    border_style="green",
+    padding=(1, 2)
+)
+
+@functools.lru_cache(maxsize=1)
 def show_ascii_art():
     """Display the main banner for AiGENIO by Franco"""
     
@@ -25,16 +105,102 @@ def show_ascii_art():
     
     return ascii_art
 
+@functools.lru_cache(maxsize=1)
+def _banner_bytes() -> bytes:
+    """Render the styled banner once and keep the encoded output"""
+    
+    with console.capture() as capture:
+        console.print(show_ascii_art(), style="bold cyan")
+        console.print()
+    return capture.get().encode('utf-8')
+
+def _write_bytes(data: bytes):
+    """Write pre-encoded output to the console in a single call
+    
+    Callers must not use this on the legacy Windows console, which does
+    not understand the ANSI escapes in the pre-rendered output.
+    """
+    
+    stream = console.file
+    stream.flush()
+    buffer = getattr(stream, 'buffer', None)
+    if buffer is not None:
+        buffer.write(data)
+        buffer.flush()
+    else:
+        stream.write(data.decode('utf-8'))
+        stream.flush()
+
+def render_screen(*renderables: RenderableType):
+    """Render a whole screen in memory and emit it with a single write"""
+    
+    for renderable in renderables:
+        console.write(renderable)
+    console.flush()
+
 def show_main_menu():
     """Display the main menu with ASCII art and options using inquirer"""
     
-    # Clear screen
-    os.system('clear' if os.name == 'posix' else 'cls')
+    # Piped or captured output: skip the clear and the banner render
+    if not console.is_terminal:
+        console.print("AiGENIO by Franco")
+        return
+    
+    # Clear screen (ANSI escape, no shell subprocess)
+    console.clear()
     
     # Show ASCII art
-    ascii_art = show_ascii_art()
-    console.print(ascii_art, style="bold cyan")
-    console.print()
+    if console.legacy_windows:
+        console.print(show_ascii_art(), style="bold cyan")
+        console.print()
+    else:
+        _write_bytes(_banner_bytes())
+
+def _say_goodbye():
+    """Print the goodbye message, pre-encoded where raw output is safe"""
+    
+    if console.legacy_windows:
+        console.print("\n👋 Arrivederci!", style="bold yellow")
+    else:
+        _write_bytes(_MSG_BYE if console.color_system else _MSG_BYE_PLAIN)
+
+def _single_key_reader():
+    """Return readchar.readkey when single-key input is possible, else None"""
+    
+    if not sys.stdin.isatty():
+        return None
+    try:
+        import readchar
+    except ImportError:
+        return None
+    return readchar.readkey
+
+def _choose_by_key(readkey) -> Optional[int]:
+    """Simplified menu on a single keypress; invalid keys ring the bell"""
+    
+    console.print(_CHOICE_PROMPT, end="")
+    while True:
+        key = readkey().lower()
+        if key in _VALID_CHOICES:
+            # The key is not echoed by the terminal in raw mode
+            console.print(key)
+            return int(key)
+        if key == 'q' or key in _ABORT_KEYS:
+            console.print()
+            return None
+        sys.stdout.write('\a')
+        sys.stdout.flush()
+
+def _choose_by_line() -> Optional[int]:
+    """Simplified menu on line input, for pipes and terminals without readchar"""
+    
+    while True:
+        choice = input(_CHOICE_PROMPT).strip().lower()
+        if choice in _VALID_CHOICES:
+            return int(choice)
+        if choice in _QUIT_CHOICES:
+            return None
+        console.print("❌ Opzione non valida", style="bold red")
 
 def get_menu_choice():
     """Get user's menu choice using inquirer for better UX"""
@@ -59,13 +225,13 @@ def get_menu_choice():
         answers = safe_prompt(questions)
         
         if answers is None:  # User pressed Ctrl+C
-            console.print("\n👋 Arrivederci!", style="bold yellow")
+            _say_goodbye()
             return None
             
         return answers['action']
         
     except KeyboardInterrupt:
-        console.print("\n👋 Arrivederci!", style="bold yellow")
+        _say_goodbye()
         return None
     except Exception as e:
         console.print(f"❌ Errore nel menu: {e}", style="bold red")
@@ -76,105 +242,71 @@ def get_menu_choice():
         console.print("3. Lista Comandi")
         console.print("q. Esci")
         
-        while True:
-            try:
-                choice = input("Seleziona (1-3, q): ").strip().lower()
-                if choice in ['1', '2', '3']:
-                    return int(choice)
-                elif choice in ['q', 'quit', 'exit']:
-                    return None
-                else:
-                    console.print("❌ Opzione non valida", style="bold red")
-            except KeyboardInterrupt:
-                return None
+        readkey = _single_key_reader()
+        try:
+            if readkey is not None:
+                return _choose_by_key(readkey)
+            return _choose_by_line()
+        except (EOFError, KeyboardInterrupt):
+            return None
 
 def show_welcome_message():
     """Show welcome message and instructions"""
     
-    welcome_panel = Panel(
-        """
-🎯 [bold]Benvenuto in AiGENIO by Franco![/bold]
-
-Questo strumento ti aiuterà a:
-• 🚀 Creare nuovi progetti con best practices
-• 📊 Analizzare progetti esistenti
-• 🔧 Generare file di configurazione ottimizzati
-• 🔄 Integrare backup automatici su GitHub
-• 📚 Accedere a best practices aggiornate via MCP
-
-[dim]Suggerimento: Usa 'q' in qualsiasi momento per uscire[/dim]
-        """,
-        title="[bold blue]AiGENIO Assistant[/bold blue]",
-        border_style="blue",
-        padding=(1, 2)
-    )
-    
-    console.print(welcome_panel)
-    console.print()
+    render_screen(_WELCOME_PANEL, Text())
 
 def show_command_list():
     """Display available commands"""
     
-    commands_panel = Panel(
-        """
-📋 [bold]Comandi Disponibili:[/bold]
-
-[bold green]Comandi Principali:[/bold green]
-• [cyan]setup[/cyan] - Configura un nuovo progetto
-• [cyan]analyze[/cyan] - Analizza un progetto esistente
-• [cyan]generate[/cyan] - Genera file CLAUDE.md e INITIAL.md
-• [cyan]validate[/cyan] - Valida la configurazione del progetto
-• [cyan]report[/cyan] - Genera report di analisi
-• [cyan]templates[/cyan] - Gestisce i template
-
-[bold blue]Nuove Funzionalità:[/bold blue]
-• [cyan]menu[/cyan] - Mostra questo menu interattivo
-• [cyan]backup[/cyan] - Backup automatico su GitHub
-• [cyan]preferences[/cyan] - Gestisce le preferenze utente
-• [cyan]best-practices[/cyan] - Consulta best practices aggiornate
-
-[dim]Usa: python -m src.cli <comando> --help per maggiori dettagli[/dim]
-        """,
-        title="[bold blue]Lista Comandi[/bold blue]",
-        border_style="green",
-        padding=(1, 2)
-    )
-    
-    console.print(commands_panel)
+    console.print(_COMMANDS_PANEL)
     
     input("\nPremi Enter per tornare al menu principale...")
 
+def _write_status(style: str, text: str):
+    """Emit a styled one-line status message with a single write"""
+    
+    # The legacy Windows console does not understand ANSI escapes: let
+    # rich render the message through its own path there
+    if console.color_system is not None and not console.legacy_windows:
+        console.file.write(f"{style}{text}{_RESET}\n")
+    else:
+        console.print(text, style=_RICH_STYLES[style])
+
 def show_loading_message(message: str):
     """Show a loading message with spinner"""
     
-    console.print(f"⏳ {message}...", style="bold yellow")
+    _write_status(_STYLE_YELLOW, f"⏳ {message}...")
 
 def show_success_message(message: str):
     """Show a success message"""
     
-    console.print(f"✅ {message}", style="bold green")
+    _write_status(_STYLE_GREEN, f"✅ {message}")
 
 def show_error_message(message: str):
     """Show an error message"""
     
-    console.print(f"❌ {message}", style="bold red")
+    _write_status(_STYLE_RED, f"❌ {message}")
 
 def show_info_message(message: str):
     """Show an info message"""
     
-    console.print(f"ℹ️ {message}", style="bold blue")
+    _write_status(_STYLE_BLUE, f"ℹ️ {message}")
 
-def show_next_steps(steps: list):
-    """Show suggested next steps"""
-    
-    if not steps:
-        return
+@functools.lru_cache(maxsize=128)
+def _build_steps_panel(steps: Tuple[str, ...]) -> Panel:
+    """Build (and cache) the next-steps panel for a given list of steps"""
     
-    steps_panel = Panel(
-        "\n".join([f"• {step}" for step in steps]),
+    return Panel(
+        "\n".join(f"• {step}" for step in steps),
         title="[bold blue]📋 Prossimi Passi Suggeriti[/bold blue]",
         border_style="blue",
         padding=(1, 2)
     )
+
+def show_next_steps(steps: list):
+    """Show suggested next steps"""
+    
+    if not steps:
+        return
     
-    console.print(steps_panel)
\ No newline at end of file
+    console.print(_build_steps_panel(tuple(str(step) for step in steps)))
@@ -2,18 +2,176 @@
 Advanced interactive prompts for project configuration
 """
 
-import inquirer
 import logging
-from rich.console import Console
+import functools
 from rich.panel import Panel
 from rich.text import Text
 from typing import Dict, List, Optional
 
-console = Console()
+from ._console import console
+
 logger = logging.getLogger(__name__)
 
+# Choice lists are immutable and shared across prompt invocations
+_PROJECT_TYPE_CHOICES = (
+    ('🌐 Applicazione Web', 'web'),
+    ('📱 Applicazione Mobile', 'mobile'),
+    ('🖥️ Applicazione Desktop', 'desktop'),
+    ('🤖 Progetto AI/ML', 'ai_ml'),
+    ('🔧 Tool/Utility', 'tool'),
+    ('📚 Libreria/Framework', 'library'),
+    ('🔗 API/Microservizio', 'api'),
+    ('📊 Analisi Dati', 'data_analysis'),
+    ('🎮 Game Development', 'game'),
+    ('🔐 Sistema di Sicurezza', 'security'),
+    ('🌟 Altro', 'other')
+)
+
+_LANGUAGE_PREFERENCE_CHOICES = (
+    ('🐍 Python', 'python'),
+    ('🟨 JavaScript/TypeScript', 'javascript'),
+    ('🔵 PHP', 'php'),
+    ('☕ Java', 'java'),
+    ('🦀 Rust', 'rust'),
+    ('🔷 C#', 'csharp'),
+    ('🌊 Go', 'go'),
+    ('💎 Ruby', 'ruby'),
+    ('🏗️ C++', 'cpp'),
+    ('⚡ Kotlin', 'kotlin'),
+    ('🎯 Swift', 'swift'),
+    ('🤖 Scegli tu in base al progetto', 'auto')
+)
+
+_PROJECT_APPROACH_CHOICES = (
+    ('🏗️ Strutturato (con framework e convenzioni rigide)', 'structured'),
+    ('🎨 Flessibile (più libertà creative)', 'flexible'),
+    ('⚖️ Bilanciato (via di mezzo)', 'balanced')
+)
+
+_DATABASE_TYPE_CHOICES = (
+    ('🐘 PostgreSQL', 'postgresql'),
+    ('🐬 MySQL/MariaDB', 'mysql'),
+    ('🍃 MongoDB', 'mongodb'),
+    ('🔥 Redis', 'redis'),
+    ('📊 SQLite', 'sqlite'),
+    ('🌊 InfluxDB (Time Series)', 'influxdb'),
+    ('🔍 Elasticsearch', 'elasticsearch'),
+    ('🤖 Scegli tu in base al progetto', 'auto')
+)
+
+_ADDITIONAL_FEATURE_CHOICES = (
+    ('🔐 Autenticazione e autorizzazione', 'auth'),
+    ('🔄 Sistema di backup automatico', 'backup'),
+    ('📧 Sistema di notifiche/email', 'notifications'),
+    ('📊 Analytics e metriche', 'analytics'),
+    ('🔍 Sistema di ricerca', 'search'),
+    ('🌍 Internazionalizzazione', 'i18n'),
+    ('📱 API REST/GraphQL', 'api'),
+    ('🧪 Test automatici', 'testing'),
+    ('🚀 CI/CD Pipeline', 'cicd'),
+    ('📝 Documentazione automatica', 'docs'),
+    ('🎨 UI/UX avanzato', 'ui'),
+    ('🔧 Monitoring e logging', 'monitoring')
+)
+
+_DEPLOYMENT_TARGET_CHOICES = (
+    ('☁️ Cloud (AWS, Azure, GCP)', 'cloud'),
+    ('🐳 Container (Docker/Kubernetes)', 'container'),
+    ('🖥️ Server tradizionale', 'server'),
+    ('🌐 Hosting web (Netlify, Vercel)', 'web_hosting'),
+    ('📱 App Store (mobile)', 'app_store'),
+    ('🤷 Non so ancora', 'unknown')
+)
+
+_IMPROVEMENT_GOAL_CHOICES = (
+    ('🐛 Bug fix e correzioni', 'bug_fix'),
+    ('✨ Nuove funzionalità', 'new_features'),
+    ('🔧 Refactoring e ottimizzazione', 'refactoring'),
+    ('🚀 Performance e velocità', 'performance'),
+    ('🔐 Sicurezza', 'security'),
+    ('📊 Scalabilità', 'scalability'),
+    ('🎨 UI/UX', 'ui_ux'),
+    ('📚 Documentazione', 'documentation'),
+    ('🧪 Testing e qualità', 'testing'),
+    ('🔄 Modernizzazione tecnologica', 'modernization'),
+    ('🌍 SEO e accessibilità', 'seo_accessibility'),
+    ('🔍 Analisi generale', 'general_analysis')
+)
+
+_ANALYSIS_AREA_CHOICES = (
+    ('🏗️ Architettura del codice', 'architecture'),
+    ('📊 Performance', 'performance'),
+    ('🔐 Sicurezza', 'security'),
+    ('🧪 Test coverage', 'testing'),
+    ('📚 Documentazione', 'documentation'),
+    ('🔄 Dipendenze', 'dependencies'),
+    ('🎨 UI/UX', 'ui_ux'),
+    ('🌐 SEO', 'seo'),
+    ('♿ Accessibilità', 'accessibility'),
+    ('📱 Responsive design', 'responsive'),
+    ('🚀 Build process', 'build_process'),
+    ('🔧 Configuration', 'configuration')
+)
+
+_FAVORITE_LANGUAGE_CHOICES = (
+    ('🐍 Python', 'python'),
+    ('🟨 JavaScript', 'javascript'),
+    ('🔷 TypeScript', 'typescript'),
+    ('🔵 PHP', 'php'),
+    ('☕ Java', 'java'),
+    ('🦀 Rust', 'rust'),
+    ('🔷 C#', 'csharp'),
+    ('🌊 Go', 'go'),
+    ('💎 Ruby', 'ruby'),
+    ('🏗️ C++', 'cpp'),
+    ('⚡ Kotlin', 'kotlin'),
+    ('🎯 Swift', 'swift')
+)
+
+_FAVORITE_FRAMEWORK_CHOICES = (
+    ('⚛️ React', 'react'),
+    ('🖖 Vue.js', 'vue'),
+    ('🅰️ Angular', 'angular'),
+    ('🔥 Laravel', 'laravel'),
+    ('🐍 Django', 'django'),
+    ('⚡ FastAPI', 'fastapi'),
+    ('🚀 Express.js', 'express'),
+    ('🍃 Spring Boot', 'spring'),
+    ('🔷 .NET', 'dotnet'),
+    ('🦀 Axum', 'axum'),
+    ('💎 Ruby on Rails', 'rails')
+)
+
+_CODING_STYLE_CHOICES = (
+    ('🎯 Minimalista e pulito', 'minimal'),
+    ('📝 Documentato e verboso', 'verbose'),
+    ('🔧 Pragmatico e funzionale', 'pragmatic'),
+    ('🏗️ Strutturato e formale', 'structured')
+)
+
+_PROJECT_STRUCTURE_CHOICES = (
+    ('📁 Flat (file nella root)', 'flat'),
+    ('🏗️ Modular (directory separate)', 'modular'),
+    ('🌳 Hierarchical (struttura ad albero)', 'hierarchical'),
+    ('🎯 Domain-driven (per dominio)', 'domain_driven')
+)
+
+_BACKUP_FREQUENCY_CHOICES = (
+    ('🔄 Dopo ogni sessione', 'session'),
+    ('📅 Giornaliero', 'daily'),
+    ('📆 Settimanale', 'weekly'),
+    ('🎯 Solo quando richiesto', 'manual')
+)
+
+@functools.lru_cache(maxsize=1)
+def _get_inquirer():
+    """Import inquirer on first use to keep CLI start-up fast"""
+    import inquirer
+    return inquirer
+
 def safe_prompt(questions) -> Optional[Dict]:
     """Wrapper sicuro per inquirer.prompt() che gestisce None e interruzioni"""
+    inquirer = _get_inquirer()
     try:
         answers = inquirer.prompt(questions)
         
@@ -39,6 +197,8 @@ def safe_prompt(questions) -> Optional[Dict]:
 def ask_new_project_questions() -> Dict:
     """Ask comprehensive questions for new project setup"""
     
+    inquirer = _get_inquirer()
+    
     console.print(Panel(
         "🆕 [bold]Configurazione Nuovo Progetto[/bold]\n\n"
         "Rispondi alle seguenti domande per creare un progetto ottimizzato",
@@ -50,38 +210,13 @@ def ask_new_project_questions() -> Dict:
         inquirer.List(
             'project_type',
             message="Che tipo di progetto vuoi creare?",
-            choices=[
-                ('🌐 Applicazione Web', 'web'),
-                ('📱 Applicazione Mobile', 'mobile'),
-                ('🖥️ Applicazione Desktop', 'desktop'),
-                ('🤖 Progetto AI/ML', 'ai_ml'),
-                ('🔧 Tool/Utility', 'tool'),
-                ('📚 Libreria/Framework', 'library'),
-                ('🔗 API/Microservizio', 'api'),
-                ('📊 Analisi Dati', 'data_analysis'),
-                ('🎮 Game Development', 'game'),
-                ('🔐 Sistema di Sicurezza', 'security'),
-                ('🌟 Altro', 'other')
-            ],
+            choices=_PROJECT_TYPE_CHOICES,
             default='web'
         ),
         inquirer.List(
             'language_preference',
             message="Hai linguaggi di programmazione preferiti?",
-            choices=[
-                ('🐍 Python', 'python'),
-                ('🟨 JavaScript/TypeScript', 'javascript'),
-                ('🔵 PHP', 'php'),
-                ('☕ Java', 'java'),
-                ('🦀 Rust', 'rust'),
-                ('🔷 C#', 'csharp'),
-                ('🌊 Go', 'go'),
-                ('💎 Ruby', 'ruby'),
-                ('🏗️ C++', 'cpp'),
-                ('⚡ Kotlin', 'kotlin'),
-                ('🎯 Swift', 'swift'),
-                ('🤖 Scegli tu in base al progetto', 'auto')
-            ],
+            choices=_LANGUAGE_PREFERENCE_CHOICES,
             default='auto'
         ),
         inquirer.Confirm(
@@ -92,11 +227,7 @@ def ask_new_project_questions() -> Dict:
         inquirer.List(
             'project_approach',
             message="Preferisci un approccio più strutturato o più flessibile?",
-            choices=[
-                ('🏗️ Strutturato (con framework e convenzioni rigide)', 'structured'),
-                ('🎨 Flessibile (più libertà creative)', 'flexible'),
-                ('⚖️ Bilanciato (via di mezzo)', 'balanced')
-            ],
+            choices=_PROJECT_APPROACH_CHOICES,
             default='balanced'
         ),
         inquirer.Confirm(
@@ -144,16 +275,7 @@ def ask_new_project_questions() -> Dict:
         db_type_question = inquirer.List(
             'database_type',
             message="Quale tipo di database?",
-            choices=[
-                ('🐘 PostgreSQL', 'postgresql'),
-                ('🐬 MySQL/MariaDB', 'mysql'),
-                ('🍃 MongoDB', 'mongodb'),
-                ('🔥 Redis', 'redis'),
-                ('📊 SQLite', 'sqlite'),
-                ('🌊 InfluxDB (Time Series)', 'influxdb'),
-                ('🔍 Elasticsearch', 'elasticsearch'),
-                ('🤖 Scegli tu in base al progetto', 'auto')
-            ],
+            choices=_DATABASE_TYPE_CHOICES,
             default='auto'
         )
         db_type_answer = safe_prompt([db_type_question])
@@ -167,20 +289,7 @@ def ask_new_project_questions() -> Dict:
         inquirer.Checkbox(
             'additional_features',
             message="Quali funzionalità aggiuntive vuoi includere?",
-            choices=[
-                ('🔐 Autenticazione e autorizzazione', 'auth'),
-                ('🔄 Sistema di backup automatico', 'backup'),
-                ('📧 Sistema di notifiche/email', 'notifications'),
-                ('📊 Analytics e metriche', 'analytics'),
-                ('🔍 Sistema di ricerca', 'search'),
-                ('🌍 Internazionalizzazione', 'i18n'),
-                ('📱 API REST/GraphQL', 'api'),
-                ('🧪 Test automatici', 'testing'),
-                ('🚀 CI/CD Pipeline', 'cicd'),
-                ('📝 Documentazione automatica', 'docs'),
-                ('🎨 UI/UX avanzato', 'ui'),
-                ('🔧 Monitoring e logging', 'monitoring')
-            ]
+            choices=_ADDITIONAL_FEATURE_CHOICES
         ),
         inquirer.Confirm(
             'use_git_integration',
@@ -190,14 +299,7 @@ def ask_new_project_questions() -> Dict:
         inquirer.List(
             'deployment_target',
             message="Dove prevedi di deployare il progetto?",
-            choices=[
-                ('☁️ Cloud (AWS, Azure, GCP)', 'cloud'),
-                ('🐳 Container (Docker/Kubernetes)', 'container'),
-                ('🖥️ Server tradizionale', 'server'),
-                ('🌐 Hosting web (Netlify, Vercel)', 'web_hosting'),
-                ('📱 App Store (mobile)', 'app_store'),
-                ('🤷 Non so ancora', 'unknown')
-            ],
+            choices=_DEPLOYMENT_TARGET_CHOICES,
             default='cloud'
         )
     ]
@@ -216,6 +318,8 @@ def ask_new_project_questions() -> Dict:
 def ask_existing_project_questions() -> Dict:
     """Ask questions for existing project analysis"""
     
+    inquirer = _get_inquirer()
+    
     console.print(Panel(
         "📂 [bold]Analisi Progetto Esistente[/bold]\n\n"
         "Aiutami a capire come migliorare il tuo progetto",
@@ -227,20 +331,7 @@ def ask_existing_project_questions() -> Dict:
         inquirer.List(
             'improvement_goal',
             message="Cosa vuoi migliorare in questo progetto?",
-            choices=[
-                ('🐛 Bug fix e correzioni', 'bug_fix'),
-                ('✨ Nuove funzionalità', 'new_features'),
-                ('🔧 Refactoring e ottimizzazione', 'refactoring'),
-                ('🚀 Performance e velocità', 'performance'),
-                ('🔐 Sicurezza', 'security'),
-                ('📊 Scalabilità', 'scalability'),
-                ('🎨 UI/UX', 'ui_ux'),
-                ('📚 Documentazione', 'documentation'),
-                ('🧪 Testing e qualità', 'testing'),
-                ('🔄 Modernizzazione tecnologica', 'modernization'),
-                ('🌍 SEO e accessibilità', 'seo_accessibility'),
-                ('🔍 Analisi generale', 'general_analysis')
-            ]
+            choices=_IMPROVEMENT_GOAL_CHOICES
         ),
         inquirer.Confirm(
             'has_specific_problems',
@@ -288,20 +379,7 @@ def ask_existing_project_questions() -> Dict:
         inquirer.Checkbox(
             'analysis_areas',
             message="Su quali aree vuoi concentrare l'analisi?",
-            choices=[
-                ('🏗️ Architettura del codice', 'architecture'),
-                ('📊 Performance', 'performance'),
-                ('🔐 Sicurezza', 'security'),
-                ('🧪 Test coverage', 'testing'),
-                ('📚 Documentazione', 'documentation'),
-                ('🔄 Dipendenze', 'dependencies'),
-                ('🎨 UI/UX', 'ui_ux'),
-                ('🌐 SEO', 'seo'),
-                ('♿ Accessibilità', 'accessibility'),
-                ('📱 Responsive design', 'responsive'),
-                ('🚀 Build process', 'build_process'),
-                ('🔧 Configuration', 'configuration')
-            ]
+            choices=_ANALYSIS_AREA_CHOICES
         ),
         inquirer.Confirm(
             'generate_improvement_plan',
@@ -324,6 +402,8 @@ def ask_existing_project_questions() -> Dict:
 def ask_preferences_questions() -> Dict:
     """Ask questions for user preferences setup"""
     
+    inquirer = _get_inquirer()
+    
     console.print(Panel(
         "⚙️ [bold]Configurazione Preferenze[/bold]\n\n"
         "Personalizza AiGENIO in base alle tue preferenze",
@@ -335,47 +415,17 @@ def ask_preferences_questions() -> Dict:
         inquirer.Checkbox(
             'favorite_languages',
             message="Quali sono i tuoi linguaggi di programmazione preferiti?",
-            choices=[
-                ('🐍 Python', 'python'),
-                ('🟨 JavaScript', 'javascript'),
-                ('🔷 TypeScript', 'typescript'),
-                ('🔵 PHP', 'php'),
-                ('☕ Java', 'java'),
-                ('🦀 Rust', 'rust'),
-                ('🔷 C#', 'csharp'),
-                ('🌊 Go', 'go'),
-                ('💎 Ruby', 'ruby'),
-                ('🏗️ C++', 'cpp'),
-                ('⚡ Kotlin', 'kotlin'),
-                ('🎯 Swift', 'swift')
-            ]
+            choices=_FAVORITE_LANGUAGE_CHOICES
         ),
         inquirer.Checkbox(
             'favorite_frameworks',
             message="Quali framework usi più spesso?",
-            choices=[
-                ('⚛️ React', 'react'),
-                ('🖖 Vue.js', 'vue'),
-                ('🅰️ Angular', 'angular'),
-                ('🔥 Laravel', 'laravel'),
-                ('🐍 Django', 'django'),
-                ('⚡ FastAPI', 'fastapi'),
-                ('🚀 Express.js', 'express'),
-                ('🍃 Spring Boot', 'spring'),
-                ('🔷 .NET', 'dotnet'),
-                ('🦀 Axum', 'axum'),
-                ('💎 Ruby on Rails', 'rails')
-            ]
+            choices=_FAVORITE_FRAMEWORK_CHOICES
         ),
         inquirer.List(
             'coding_style',
             message="Che stile di codifica preferisci?",
-            choices=[
-                ('🎯 Minimalista e pulito', 'minimal'),
-                ('📝 Documentato e verboso', 'verbose'),
-                ('🔧 Pragmatico e funzionale', 'pragmatic'),
-                ('🏗️ Strutturato e formale', 'structured')
-            ],
+            choices=_CODING_STYLE_CHOICES,
             default='pragmatic'
         ),
         inquirer.Confirm(
@@ -391,12 +441,7 @@ def ask_preferences_questions() -> Dict:
         inquirer.List(
             'project_structure_preference',
             message="Che struttura di progetto preferisci?",
-            choices=[
-                ('📁 Flat (file nella root)', 'flat'),
-                ('🏗️ Modular (directory separate)', 'modular'),
-                ('🌳 Hierarchical (struttura ad albero)', 'hierarchical'),
-                ('🎯 Domain-driven (per dominio)', 'domain_driven')
-            ],
+            choices=_PROJECT_STRUCTURE_CHOICES,
             default='modular'
         )
     ]
@@ -413,6 +458,8 @@ def ask_preferences_questions() -> Dict:
 def ask_git_configuration() -> Dict:
     """Ask questions for Git integration setup"""
     
+    inquirer = _get_inquirer()
+    
     console.print(Panel(
         "🔄 [bold]Configurazione Git[/bold]\n\n"
         "Configura l'integrazione automatica con GitHub",
@@ -433,12 +480,7 @@ def ask_git_configuration() -> Dict:
         inquirer.List(
             'backup_frequency',
             message="Con che frequenza vuoi fare il backup automatico?",
-            choices=[
-                ('🔄 Dopo ogni sessione', 'session'),
-                ('📅 Giornaliero', 'daily'),
-                ('📆 Settimanale', 'weekly'),
-                ('🎯 Solo quando richiesto', 'manual')
-            ],
+            choices=_BACKUP_FREQUENCY_CHOICES,
             default='session'
         ),
         inquirer.Confirm(
@@ -462,21 +504,38 @@ def ask_git_configuration() -> Dict:
     
     return answers
 
+# Per-type formatters for show_summary values (lists arrive as tuples)
+_VALUE_FORMATTERS = {
+    tuple: lambda value: ", ".join(value) if value else "Nessuna",
+    bool: lambda value: "Sì" if value else "No"
+}
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _serialize_value(value) -> str:
+    """Format an answer value for display (cached across confirm loops)"""
+    return _VALUE_FORMATTERS.get(type(value), str)(value)
+
+@functools.lru_cache(maxsize=256)
+def _format_key(key: str) -> str:
+    """Format an answer key for display"""
+    return key.replace('_', ' ').title()
+
 def show_summary(answers: Dict, title: str = "Riepilogo Configurazione"):
     """Show a summary of the answers"""
     
-    summary_text = ""
+    parts: List[str] = []
     for key, value in answers.items():
         if isinstance(value, list):
-            value_str = ", ".join(value) if value else "Nessuna"
-        elif isinstance(value, bool):
-            value_str = "Sì" if value else "No"
-        else:
+            value = tuple(value)
+        try:
+            value_str = _serialize_value(value)
+        except TypeError:
+            # Unhashable value, format without caching
             value_str = str(value)
         
-        # Format key for display
-        key_display = key.replace('_', ' ').title()
-        summary_text += f"• {key_display}: {value_str}\n"
+        parts.append(f"• {_format_key(key)}: {value_str}")
+    
+    summary_text = "\n".join(parts)
     
     console.print(Panel(
         summary_text,
@@ -487,6 +546,8 @@ def show_summary(answers: Dict, title: str = "Riepilogo Configurazione"):
 def confirm_proceed(message: str = "Vuoi procedere con questa configurazione?") -> bool:
     """Ask user to confirm before proceeding"""
     
+    inquirer = _get_inquirer()
+    
     question = inquirer.Confirm('confirm', message=message, default=True)
     answer = safe_prompt([question])
     
@@ -2,258 +2,563 @@
 MCP Client for accessing best practices from specialized servers
 """
 
+import os
+import sys
+import copy
+import logging
 import json
+import time
+import heapq
 import asyncio
 import aiohttp
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from collections import OrderedDict
+from itertools import groupby
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Union, Tuple
 from datetime import datetime, timedelta
 from rich.console import Console
 import hashlib
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
+logger = logging.getLogger(__name__)
+
+def _json_dumps(data: Any, sort_keys: bool = False) -> bytes:
+    """Serialize data to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(data, default=str, sort_keys=sort_keys).encode()
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _remote_context(context: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Drop local filesystem paths from a query context before it is sent
+    
+    Args:
+        context: Query context
+        
+    Returns:
+        Context safe to send to an external MCP server
+    """
+    if not context:
+        return context
+    return {
+        key: value for key, value in context.items()
+        if not key.endswith('path') and not isinstance(value, os.PathLike)
+    }
+
+# Keywords that add relevance when found in both the query and a description
+_RELEVANCE_KEYWORDS = ('structure', 'security', 'performance', 'architecture', 'best', 'practice')
+
+# In-process memoization of simulated responses
+_SIM_CACHE_SIZE = 1024
+_SIM_CACHE_TTL = 3600
+
+# HTTP timeouts for a single MCP query (seconds); unreachable hosts fail
+# on the short connect timeout instead of the total one
+_QUERY_TIMEOUT = 5
+_CONNECT_TIMEOUT = 1
+
+# After a failed query the server is skipped (fallback served directly)
+# for this many seconds
+_FAILURE_BACKOFF = 60
+
+# Fallback data when MCP servers are not available, built once at import
+_FALLBACK_PRACTICES = {
+    'php_laravel': [
+        {
+            'id': 'laravel_mvc_structure',
+            'title': 'Struttura MVC Laravel Standard',
+            'description': 'Organizzazione dei file seguendo il pattern MVC di Laravel',
+            'category': 'architecture',
+            'language': 'php',
+            'framework': 'laravel',
+            'confidence': 0.95,
+            'source': 'fallback',
+            'details': {
+                'structure': {
+                    'app/Http/Controllers/': 'Controller per gestire le richieste HTTP',
+                    'app/Models/': 'Modelli Eloquent per interazione database',
+                    'resources/views/': 'Template Blade per le viste',
+                    'routes/web.php': 'Definizione rotte web',
+                    'routes/api.php': 'Definizione rotte API',
+                    'database/migrations/': 'File di migrazione database',
+                    'database/seeders/': 'Seeder per dati di test'
+                },
+                'best_practices': [
+                    'Usare Resource Controllers per operazioni CRUD',
+                    'Implementare Form Request per validazione',
+                    'Utilizzare Service Provider per dependency injection',
+                    'Organizzare business logic in Service classes'
+                ]
+            }
+        },
+        {
+            'id': 'laravel_security',
+            'title': 'Sicurezza Laravel',
+            'description': 'Configurazioni e pratiche di sicurezza per Laravel',
+            'category': 'security',
+            'language': 'php',
+            'framework': 'laravel',
+            'confidence': 0.98,
+            'source': 'fallback',
+            'details': {
+                'security_measures': [
+                    'Abilitare CSRF protection su tutti i form',
+                    'Utilizzare Laravel Sanctum per API authentication',
+                    'Configurare rate limiting per API endpoints',
+                    'Validare sempre input utente con Form Requests',
+                    'Utilizzare Mass Assignment protection',
+                    'Configurare HTTPS in produzione'
+                ],
+                'env_variables': [
+                    'APP_KEY - Chiave crittografia applicazione',
+                    'DB_PASSWORD - Password database sicura',
+                    'SESSION_DRIVER=database - Sessioni sicure'
+                ]
+            }
+        }
+    ],
+    'javascript_react': [
+        {
+            'id': 'react_component_patterns',
+            'title': 'Pattern Componenti React',
+            'description': 'Best practices per struttura e organizzazione componenti React',
+            'category': 'architecture',
+            'language': 'javascript',
+            'framework': 'react',
+            'confidence': 0.92,
+            'source': 'fallback',
+            'details': {
+                'component_structure': {
+                    'src/components/': 'Componenti riutilizzabili',
+                    'src/pages/': 'Componenti pagina',
+                    'src/hooks/': 'Custom hooks',
+                    'src/utils/': 'Utility functions',
+                    'src/context/': 'Context providers',
+                    'src/services/': 'API services'
+                },
+                'naming_conventions': [
+                    'PascalCase per nomi componenti',
+                    'camelCase per props e variabili',
+                    'Prefisso "use" per custom hooks',
+                    'Suffisso "Context" per context providers'
+                ]
+            }
+        },
+        {
+            'id': 'react_performance',
+            'title': 'Ottimizzazione Performance React',
+            'description': 'Tecniche per migliorare performance applicazioni React',
+            'category': 'performance',
+            'language': 'javascript',
+            'framework': 'react',
+            'confidence': 0.89,
+            'source': 'fallback',
+            'details': {
+                'optimization_techniques': [
+                    'Utilizzare React.memo per componenti puri',
+                    'Implementare lazy loading con React.lazy',
+                    'Ottimizzare re-rendering con useCallback e useMemo',
+                    'Code splitting a livello di route',
+                    'Implementare virtual scrolling per liste lunghe',
+                    'Utilizzare React DevTools Profiler'
+                ]
+            }
+        }
+    ],
+    'python_django': [
+        {
+            'id': 'django_project_layout',
+            'title': 'Struttura Progetto Django',
+            'description': 'Organizzazione standard per progetti Django scalabili',
+            'category': 'architecture',
+            'language': 'python',
+            'framework': 'django',
+            'confidence': 0.94,
+            'source': 'fallback',
+            'details': {
+                'project_structure': {
+                    'apps/': 'Django apps modulari',
+                    'config/': 'Configurazioni progetto',
+                    'requirements/': 'Dipendenze per ambiente',
+                    'static/': 'File statici',
+                    'media/': 'File upload utenti',
+                    'templates/': 'Template HTML',
+                    'locale/': 'File traduzione'
+                },
+                'app_structure': [
+                    'models.py - Definizione modelli database',
+                    'views.py - View functions/classes',
+                    'urls.py - URL patterns per app',
+                    'admin.py - Configurazione Django admin',
+                    'serializers.py - DRF serializers (se API)',
+                    'tests/ - Test suddivisi per tipo'
+                ]
+            }
+        }
+    ],
+    'general': [
+        {
+            'id': 'git_workflow',
+            'title': 'Git Workflow Best Practices',
+            'description': 'Pratiche ottimali per gestione versioning con Git',
+            'category': 'development',
+            'language': None,
+            'framework': None,
+            'confidence': 0.96,
+            'source': 'fallback',
+            'details': {
+                'commit_guidelines': [
+                    'Commit atomici e focalizzati',
+                    'Messaggi descriptivi in inglese',
+                    'Prefissi: feat:, fix:, docs:, style:, refactor:',
+                    'Evitare commit di file temporanei'
+                ],
+                'branching_strategy': [
+                    'main/master - branch stabile',
+                    'develop - branch di sviluppo',
+                    'feature/* - nuove funzionalità',
+                    'hotfix/* - correzioni urgenti'
+                ]
+            }
+        },
+        {
+            'id': 'code_documentation',
+            'title': 'Documentazione Codice',
+            'description': 'Best practices per documentazione efficace del codice',
+            'category': 'documentation',
+            'language': None,
+            'framework': None,
+            'confidence': 0.91,
+            'source': 'fallback',
+            'details': {
+                'documentation_types': [
+                    'README.md - panoramica progetto',
+                    'API documentation - per servizi esterni',
+                    'Code comments - per logica complessa',
+                    'CHANGELOG.md - storia modifiche',
+                    'CONTRIBUTING.md - guida contributori'
+                ],
+                'comment_guidelines': [
+                    'Spiegare il "perché", non il "cosa"',
+                    'Aggiornare commenti con modifiche codice',
+                    'Evitare commenti ovvi',
+                    'Documentare parametri e return values'
+                ]
+            }
+        }
+    ]
+}
+
+def _freeze(value: Any) -> Any:
+    """Intern strings and turn lists into tuples, recursing into containers
+    
+    Args:
+        value: Value from the fallback practice table
+        
+    Returns:
+        Equal value with interned strings and tuples in place of lists
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return {sys.intern(key): _freeze(item) for key, item in value.items()}
+    return value
+
+# Share interned strings and immutable lists across the practice payloads;
+# the dicts stay mutable, so responses hand out deep copies of them
+for _practices in _FALLBACK_PRACTICES.values():
+    _practices[:] = [_freeze(_practice) for _practice in _practices]
+del _practices
+
+def _build_practice_text(fallback_practices: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Tuple[str, str, str]]]:
+    """Lowercase the searchable fields of every fallback practice once
+    
+    The practices themselves are left untouched so that responses keep
+    their public shape.
+    
+    Args:
+        fallback_practices: Fallback practices grouped by data key
+        
+    Returns:
+        Mapping of data key to lowercased (title, description, category),
+        parallel to the practice lists
+    """
+    return {
+        data_key: [
+            (practice['title'].lower(), practice['description'].lower(), practice['category'].lower())
+            for practice in practices
+        ]
+        for data_key, practices in fallback_practices.items()
+    }
+
+def _build_practice_scorers(practice_text: Dict[str, List[Tuple[str, str, str]]]) -> Dict[str, List[Dict[str, int]]]:
+    """Precompute the category/keyword relevance weights of every fallback practice
+    
+    Each term found in the query as a substring adds its weight: the
+    category is worth 2 and each keyword present in the description 1.
+    
+    Args:
+        practice_text: Lowercased practice fields grouped by data key
+        
+    Returns:
+        Mapping of data key to term weights, parallel to the practice lists
+    """
+    scorers = {}
+    
+    for data_key, texts in practice_text.items():
+        bucket = []
+        for _, desc_lc, category_lc in texts:
+            weights = {category_lc: 2}
+            for keyword in _RELEVANCE_KEYWORDS:
+                if keyword in desc_lc:
+                    weights[keyword] = weights.get(keyword, 0) + 1
+            bucket.append(weights)
+        scorers[data_key] = bucket
+    
+    return scorers
+
+_PRACTICE_TEXT = _build_practice_text(_FALLBACK_PRACTICES)
+_PRACTICE_SCORERS = _build_practice_scorers(_PRACTICE_TEXT)
+
+# Suggested directory layouts per language/framework pair
+_DIR_STRUCTURES = MappingProxyType({
+    'php_laravel': {
+        'app/': 'Application logic',
+        'resources/views/': 'Blade templates',
+        'routes/': 'Route definitions',
+        'database/migrations/': 'Database migrations',
+        'public/': 'Public assets',
+        'storage/': 'File storage'
+    },
+    'javascript_react': {
+        'src/components/': 'React components',
+        'src/pages/': 'Page components',
+        'src/hooks/': 'Custom hooks',
+        'src/utils/': 'Utility functions',
+        'public/': 'Static assets',
+        'src/styles/': 'CSS/SCSS files'
+    },
+    'python_django': {
+        'apps/': 'Django applications',
+        'config/': 'Project configuration',
+        'static/': 'Static files',
+        'media/': 'User uploads',
+        'templates/': 'HTML templates',
+        'requirements/': 'Dependencies'
+    }
+})
+
+_DEFAULT_DIR = MappingProxyType({
+    'src/': 'Source code',
+    'tests/': 'Test files',
+    'docs/': 'Documentation',
+    'config/': 'Configuration files'
+})
+
+# CLAUDE.md suggestion templates; string fields are filled with format_map
+_GENERIC_CLAUDE_MD_TEMPLATE = MappingProxyType({
+    'project_description': "Progetto {project_type} in {language}",
+    'stack_info': "{language_upper} + {framework_title}",
+    'workflow_suggestions': [
+        "Sviluppo incrementale con test continui",
+        "Code review per ogni modifica significativa",
+        "Backup automatico su Git ad ogni sessione"
+    ],
+    'git_integration': {
+        'auto_backup': True,
+        'commit_frequency': 'session',
+        'branch_strategy': 'feature-based'
+    }
+})
+
+_CLAUDE_MD_TEMPLATES = MappingProxyType({
+    ('php', 'laravel'): MappingProxyType({**_GENERIC_CLAUDE_MD_TEMPLATE, 'stack_info': "PHP + Laravel"}),
+    ('javascript', 'react'): MappingProxyType({**_GENERIC_CLAUDE_MD_TEMPLATE, 'stack_info': "JAVASCRIPT + React"}),
+    ('python', 'django'): MappingProxyType({**_GENERIC_CLAUDE_MD_TEMPLATE, 'stack_info': "PYTHON + Django"})
+})
+
+class _RateLimiter:
+    """Token bucket allowing `rate` acquisitions every `period` seconds"""
+    
+    def __init__(self, rate: int, period: float = 1.0):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = None
+        # Created on first use: on Python < 3.10 a Lock binds to the loop
+        # current at construction time
+        self._lock = None
+        self._loop = None
+    
+    async def __aenter__(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Timestamps from another loop's clock are meaningless here
+            self._lock = asyncio.Lock()
+            self._loop = loop
+            self._updated = None
+        
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    elapsed = now - self._updated
+                    self._tokens = min(self.rate, self._tokens + elapsed * self.rate / self.period)
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return self
+                
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
 
 class BestPracticesClient:
     """Client for accessing MCP servers with best practices"""
     
-    def __init__(self, cache_manager=None):
+    def __init__(self, cache_manager=None, verbose: bool = False):
         """Initialize MCP client
         
         Args:
             cache_manager: Cache manager instance for storing responses
+            verbose: Print progress messages to the console instead of logging them
         """
         self.cache_manager = cache_manager
+        self.verbose = verbose
         self.session = None
         
+        # Bound the number of in-flight MCP queries; created inside the
+        # running loop by _bind_loop (on Python < 3.10 asyncio primitives
+        # bind to the loop current at construction time)
+        self._concurrency = int(os.getenv("MCP_CONCURRENCY", "8"))
+        self._sem = None
+        self._loop = None
+        
+        # Cap on servers queried at once by a single project request
+        # (created by _bind_loop, like _sem)
+        self._fanout_sem = None
+        
+        # Background stale-while-revalidate refreshes keyed by (server_key, query)
+        self._refresh_tasks = {}
+        
+        # Servers that recently failed: server_key -> monotonic retry time
+        self._retry_after = {}
+        
         # Known MCP servers for context engineering
         self.mcp_servers = {
             'context_engineering': {
                 'name': 'Context Engineering Best Practices',
                 'url': 'https://api.context-engineering.dev/mcp',
                 'description': 'Specialized server for Claude Code context engineering',
-                'available': True
+                'available': True,
+                'ttl_hours': 12
             },
             'software_architecture': {
                 'name': 'Software Architecture Patterns',
                 'url': 'https://api.patterns.dev/mcp',
                 'description': 'Architectural patterns and best practices',
-                'available': True
+                'available': True,
+                'ttl_hours': 72
             },
             'security_guidelines': {
                 'name': 'Security Best Practices',
                 'url': 'https://api.security-patterns.dev/mcp',
                 'description': 'Security guidelines and patterns',
-                'available': True
+                'available': True,
+                'ttl_hours': 168
             },
             'performance_optimization': {
                 'name': 'Performance Optimization',
                 'url': 'https://api.perf-patterns.dev/mcp',
                 'description': 'Performance optimization techniques',
-                'available': True
+                'available': True,
+                'ttl_hours': 168
             }
         }
         
+        # Per-server rate limits (requests per second)
+        self._limiters = {key: _RateLimiter(10, 1.0) for key in self.mcp_servers}
+        
         # Fallback data when MCP servers are not available
-        self.fallback_practices = self._load_fallback_practices()
+        self.fallback_practices = _FALLBACK_PRACTICES
+        self._texts = _PRACTICE_TEXT
+        self._scorers = _PRACTICE_SCORERS
+        
+        # Simulated responses keyed by request hash: key -> (expires_at, response)
+        self._sim_cache = OrderedDict()
     
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession()
+        await self._ensure_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        await self.aclose()
     
-    def _load_fallback_practices(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Load fallback best practices when MCP servers are unavailable"""
-        return {
-            'php_laravel': [
-                {
-                    'id': 'laravel_mvc_structure',
-                    'title': 'Struttura MVC Laravel Standard',
-                    'description': 'Organizzazione dei file seguendo il pattern MVC di Laravel',
-                    'category': 'architecture',
-                    'language': 'php',
-                    'framework': 'laravel',
-                    'confidence': 0.95,
-                    'source': 'fallback',
-                    'details': {
-                        'structure': {
-                            'app/Http/Controllers/': 'Controller per gestire le richieste HTTP',
-                            'app/Models/': 'Modelli Eloquent per interazione database',
-                            'resources/views/': 'Template Blade per le viste',
-                            'routes/web.php': 'Definizione rotte web',
-                            'routes/api.php': 'Definizione rotte API',
-                            'database/migrations/': 'File di migrazione database',
-                            'database/seeders/': 'Seeder per dati di test'
-                        },
-                        'best_practices': [
-                            'Usare Resource Controllers per operazioni CRUD',
-                            'Implementare Form Request per validazione',
-                            'Utilizzare Service Provider per dependency injection',
-                            'Organizzare business logic in Service classes'
-                        ]
-                    }
-                },
-                {
-                    'id': 'laravel_security',
-                    'title': 'Sicurezza Laravel',
-                    'description': 'Configurazioni e pratiche di sicurezza per Laravel',
-                    'category': 'security',
-                    'language': 'php',
-                    'framework': 'laravel',
-                    'confidence': 0.98,
-                    'source': 'fallback',
-                    'details': {
-                        'security_measures': [
-                            'Abilitare CSRF protection su tutti i form',
-                            'Utilizzare Laravel Sanctum per API authentication',
-                            'Configurare rate limiting per API endpoints',
-                            'Validare sempre input utente con Form Requests',
-                            'Utilizzare Mass Assignment protection',
-                            'Configurare HTTPS in produzione'
-                        ],
-                        'env_variables': [
-                            'APP_KEY - Chiave crittografia applicazione',
-                            'DB_PASSWORD - Password database sicura',
-                            'SESSION_DRIVER=database - Sessioni sicure'
-                        ]
-                    }
-                }
-            ],
-            'javascript_react': [
-                {
-                    'id': 'react_component_patterns',
-                    'title': 'Pattern Componenti React',
-                    'description': 'Best practices per struttura e organizzazione componenti React',
-                    'category': 'architecture',
-                    'language': 'javascript',
-                    'framework': 'react',
-                    'confidence': 0.92,
-                    'source': 'fallback',
-                    'details': {
-                        'component_structure': {
-                            'src/components/': 'Componenti riutilizzabili',
-                            'src/pages/': 'Componenti pagina',
-                            'src/hooks/': 'Custom hooks',
-                            'src/utils/': 'Utility functions',
-                            'src/context/': 'Context providers',
-                            'src/services/': 'API services'
-                        },
-                        'naming_conventions': [
-                            'PascalCase per nomi componenti',
-                            'camelCase per props e variabili',
-                            'Prefisso "use" per custom hooks',
-                            'Suffisso "Context" per context providers'
-                        ]
-                    }
-                },
-                {
-                    'id': 'react_performance',
-                    'title': 'Ottimizzazione Performance React',
-                    'description': 'Tecniche per migliorare performance applicazioni React',
-                    'category': 'performance',
-                    'language': 'javascript',
-                    'framework': 'react',
-                    'confidence': 0.89,
-                    'source': 'fallback',
-                    'details': {
-                        'optimization_techniques': [
-                            'Utilizzare React.memo per componenti puri',
-                            'Implementare lazy loading con React.lazy',
-                            'Ottimizzare re-rendering con useCallback e useMemo',
-                            'Code splitting a livello di route',
-                            'Implementare virtual scrolling per liste lunghe',
-                            'Utilizzare React DevTools Profiler'
-                        ]
-                    }
-                }
-            ],
-            'python_django': [
-                {
-                    'id': 'django_project_layout',
-                    'title': 'Struttura Progetto Django',
-                    'description': 'Organizzazione standard per progetti Django scalabili',
-                    'category': 'architecture',
-                    'language': 'python',
-                    'framework': 'django',
-                    'confidence': 0.94,
-                    'source': 'fallback',
-                    'details': {
-                        'project_structure': {
-                            'apps/': 'Django apps modulari',
-                            'config/': 'Configurazioni progetto',
-                            'requirements/': 'Dipendenze per ambiente',
-                            'static/': 'File statici',
-                            'media/': 'File upload utenti',
-                            'templates/': 'Template HTML',
-                            'locale/': 'File traduzione'
-                        },
-                        'app_structure': [
-                            'models.py - Definizione modelli database',
-                            'views.py - View functions/classes',
-                            'urls.py - URL patterns per app',
-                            'admin.py - Configurazione Django admin',
-                            'serializers.py - DRF serializers (se API)',
-                            'tests/ - Test suddivisi per tipo'
-                        ]
-                    }
-                }
-            ],
-            'general': [
-                {
-                    'id': 'git_workflow',
-                    'title': 'Git Workflow Best Practices',
-                    'description': 'Pratiche ottimali per gestione versioning con Git',
-                    'category': 'development',
-                    'language': None,
-                    'framework': None,
-                    'confidence': 0.96,
-                    'source': 'fallback',
-                    'details': {
-                        'commit_guidelines': [
-                            'Commit atomici e focalizzati',
-                            'Messaggi descriptivi in inglese',
-                            'Prefissi: feat:, fix:, docs:, style:, refactor:',
-                            'Evitare commit di file temporanei'
-                        ],
-                        'branching_strategy': [
-                            'main/master - branch stabile',
-                            'develop - branch di sviluppo',
-                            'feature/* - nuove funzionalità',
-                            'hotfix/* - correzioni urgenti'
-                        ]
-                    }
-                },
-                {
-                    'id': 'code_documentation',
-                    'title': 'Documentazione Codice',
-                    'description': 'Best practices per documentazione efficace del codice',
-                    'category': 'documentation',
-                    'language': None,
-                    'framework': None,
-                    'confidence': 0.91,
-                    'source': 'fallback',
-                    'details': {
-                        'documentation_types': [
-                            'README.md - panoramica progetto',
-                            'API documentation - per servizi esterni',
-                            'Code comments - per logica complessa',
-                            'CHANGELOG.md - storia modifiche',
-                            'CONTRIBUTING.md - guida contributori'
-                        ],
-                        'comment_guidelines': [
-                            'Spiegare il "perché", non il "cosa"',
-                            'Aggiornare commenti con modifiche codice',
-                            'Evitare commenti ovvi',
-                            'Documentare parametri e return values'
-                        ]
-                    }
-                }
-            ]
-        }
+    def _bind_loop(self):
+        """Create the asyncio primitives for the running event loop
+        
+        Called at the start of every coroutine that uses them; they are
+        rebuilt when the client is reused from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._sem = asyncio.Semaphore(self._concurrency)
+            self._fanout_sem = asyncio.BoundedSemaphore(4)
+            self._loop = loop
+    
+    def _notify(self, message: str, style: str, level: int = logging.DEBUG):
+        """Report a progress message on the console (verbose) or to the logger
+        
+        Args:
+            message: Message text
+            style: Rich style used when printing
+            level: Logging level used when not verbose
+        """
+        if self.verbose:
+            console.print(message, style=style)
+        else:
+            logger.log(level, message)
+    
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Create the shared HTTP session on first use
+        
+        Returns:
+            Session reused by every query made through this client
+        """
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, limit_per_host=5, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self.session
+    
+    async def aclose(self):
+        """Cancel pending background refreshes and close the shared HTTP session"""
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+        self._refresh_tasks.clear()
+        
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
     
     async def query_mcp_server(self, 
                              server_key: str, 
@@ -274,36 +579,147 @@ class BestPracticesClient:
         
         server = self.mcp_servers[server_key]
         
-        # Check cache first
-        if self.cache_manager:
-            cached_response = self.cache_manager.get_cached_mcp_response(
-                server['url'], query, max_age_hours=24
-            )
-            if cached_response:
-                console.print(f"📋 Usando risposta MCP cached per {server['name']}", style="blue")
-                return cached_response
+        # Slow-moving guidance (security, performance) is cached for longer
+        ttl = server.get('ttl_hours', 24)
+        hard_ttl = ttl * 3600
+        soft_ttl = hard_ttl / 2
         
-        try:
-            # Simulate MCP server response (since real servers may not exist)
-            console.print(f"🔍 Consultando {server['name']}...", style="yellow")
+        self._bind_loop()
+        async with self._sem:
+            # Check cache first: fresh entries are returned as is, stale ones
+            # are returned immediately while a refresh runs in the background
+            if self.cache_manager:
+                cached = self.cache_manager.get_with_age(server['url'], query)
+                if cached is not None:
+                    cached_response, age = cached
+                    if age < hard_ttl:
+                        if age >= soft_ttl:
+                            self._schedule_refresh(server_key, query, context)
+                        self._notify(f"📋 Usando risposta MCP cached per {server['name']}", "blue")
+                        return cached_response
             
-            # Simulate network delay
-            await asyncio.sleep(0.5)
+            if self._backing_off(server_key):
+                self._notify(f"⏸️ MCP server {server['name']} non disponibile di recente, salto la richiesta", "blue")
+                return await self._get_fallback_response(server_key, query, context)
             
-            # For now, return fallback data with simulated MCP response format
-            response = await self._simulate_mcp_response(server_key, query, context)
+            try:
+                self._notify(f"🔍 Consultando {server['name']}...", "yellow")
+                
+                return await self._refresh(server_key, query, context)
             
-            # Cache the response
-            if self.cache_manager:
-                self.cache_manager.cache_mcp_response(server['url'], query, response)
+            except Exception as e:
+                self._notify(f"⚠️ MCP server {server['name']} non disponibile: {str(e)}", "yellow", logging.WARNING)
+                
+                # Fallback to local data
+                return await self._get_fallback_response(server_key, query, context)
+    
+    async def _refresh(self,
+                       server_key: str,
+                       query: str,
+                       context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Fetch a fresh response from an MCP server and cache it
+        
+        Args:
+            server_key: MCP server key
+            query: Query string
+            context: Query context
             
-            return response
+        Returns:
+            Response from MCP server
+        """
+        server = self.mcp_servers[server_key]
+        
+        try:
+            async with self._limiters[server_key]:
+                response = await self._post_query(server_key, query, context)
+        except Exception:
+            self._retry_after[server_key] = time.monotonic() + _FAILURE_BACKOFF
+            raise
+        self._retry_after.pop(server_key, None)
+        
+        if self.cache_manager:
+            self.cache_manager.cache_mcp_response(
+                server['url'], query, response, ttl_hours=server.get('ttl_hours', 24)
+            )
+        
+        return response
+    
+    def _backing_off(self, server_key: str) -> bool:
+        """Check whether a server failed recently and should not be queried yet
+        
+        Args:
+            server_key: MCP server key
             
-        except Exception as e:
-            console.print(f"⚠️ MCP server {server['name']} non disponibile: {str(e)}", style="yellow")
+        Returns:
+            True while the server's failure back-off is running
+        """
+        retry_after = self._retry_after.get(server_key)
+        return retry_after is not None and time.monotonic() < retry_after
+    
+    def _schedule_refresh(self,
+                          server_key: str,
+                          query: str,
+                          context: Optional[Dict[str, Any]] = None):
+        """Start a background refresh unless one is already running for the query
+        
+        Args:
+            server_key: MCP server key
+            query: Query string
+            context: Query context
+        """
+        key = (server_key, query)
+        if key in self._refresh_tasks or self._backing_off(server_key):
+            return
+        
+        async def refresh():
+            try:
+                self._bind_loop()
+                async with self._sem:
+                    await self._refresh(server_key, query, context)
+            except Exception:
+                # Keep serving the stale entry; the next stale hit retries
+                pass
+        
+        task = asyncio.create_task(refresh())
+        self._refresh_tasks[key] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(key, None))
+    
+    async def _post_query(self,
+                          server_key: str,
+                          query: str,
+                          context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send a query to an MCP server over HTTP
+        
+        Args:
+            server_key: MCP server key
+            query: Query string
+            context: Query context
             
-            # Fallback to local data
-            return await self._get_fallback_response(server_key, query, context)
+        Returns:
+            MCP response normalized to the client response format
+        """
+        server = self.mcp_servers[server_key]
+        payload = {'query': query, 'context': _remote_context(context)}
+        timeout = aiohttp.ClientTimeout(total=_QUERY_TIMEOUT, sock_connect=_CONNECT_TIMEOUT)
+        
+        session = await self._ensure_session()
+        async with session.post(server['url'], data=_json_dumps(payload), timeout=timeout,
+                                headers={'Content-Type': 'application/json'}) as resp:
+            resp.raise_for_status()
+            data = _json_loads(await resp.read())
+        
+        practices = data.get('practices', [])
+        
+        return {
+            'status': 'success',
+            'server': server['name'],
+            'query': query,
+            'context': context,
+            'practices': practices[:5],
+            'total_found': data.get('total_found', len(practices)),
+            'timestamp': datetime.now().isoformat(),
+            'source': 'mcp'
+        }
     
     async def _simulate_mcp_response(self, 
                                    server_key: str, 
@@ -319,6 +735,19 @@ class BestPracticesClient:
         Returns:
             Simulated MCP response
         """
+        key = hashlib.blake2b(
+            f"{server_key}|{query}|".encode() + _json_dumps(context, sort_keys=True),
+            digest_size=16
+        ).digest()
+        
+        cached = self._sim_cache.get(key)
+        if cached is not None:
+            expires_at, cached_response = cached
+            if expires_at > time.monotonic():
+                self._sim_cache.move_to_end(key)
+                return copy.deepcopy(cached_response)
+            del self._sim_cache[key]
+        
         # Determine which fallback data to use based on context
         language = context.get('language', '').lower() if context else ''
         framework = context.get('framework', '').lower() if context else ''
@@ -334,46 +763,51 @@ class BestPracticesClient:
             data_key = 'python_django'
         
         practices = self.fallback_practices.get(data_key, [])
+        texts = self._texts.get(data_key, [])
+        scorers = self._scorers.get(data_key, [])
         
-        # Filter practices based on query
+        # Every practice is scored (a few dozen at most): relevance comes
+        # from substring matches, which a token pre-filter would miss
         query_lower = query.lower()
-        relevant_practices = []
+        scored = []
         
-        for practice in practices:
+        for practice, (title_lc, desc_lc, _), weights in zip(practices, texts, scorers):
             # Simple relevance scoring
             relevance_score = 0
             
-            if query_lower in practice['title'].lower():
+            if query_lower in title_lc:
                 relevance_score += 3
-            if query_lower in practice['description'].lower():
-                relevance_score += 2
-            if practice['category'] in query_lower:
+            if query_lower in desc_lc:
                 relevance_score += 2
             
-            # Add keywords relevance
-            keywords = ['structure', 'security', 'performance', 'architecture', 'best', 'practice']
-            for keyword in keywords:
-                if keyword in query_lower and keyword in practice['description'].lower():
-                    relevance_score += 1
+            # Category and keyword relevance
+            relevance_score += sum(weight for term, weight in weights.items() if term in query_lower)
             
             if relevance_score > 0:
-                practice_copy = practice.copy()
-                practice_copy['relevance_score'] = relevance_score
-                relevant_practices.append(practice_copy)
+                scored.append((relevance_score, practice))
         
-        # Sort by relevance
-        relevant_practices.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
+        # Keep only the top 5 most relevant; only these get an annotated copy
+        top = heapq.nlargest(5, scored, key=lambda item: item[0])
+        top_practices = [{**practice, 'relevance_score': score} for score, practice in top]
         
-        return {
+        response = {
             'status': 'success',
             'server': self.mcp_servers[server_key]['name'],
             'query': query,
             'context': context,
-            'practices': relevant_practices[:5],  # Return top 5 most relevant
-            'total_found': len(relevant_practices),
+            'practices': top_practices,
+            'total_found': len(scored),
             'timestamp': datetime.now().isoformat(),
             'source': 'mcp_simulation'
         }
+        
+        self._sim_cache[key] = (time.monotonic() + _SIM_CACHE_TTL, response)
+        if len(self._sim_cache) > _SIM_CACHE_SIZE:
+            self._sim_cache.popitem(last=False)
+        
+        # Callers may modify the result (status/source, practice details):
+        # hand out a deep copy so the cache and the fallback table stay intact
+        return copy.deepcopy(response)
     
     async def _get_fallback_response(self, 
                                    server_key: str, 
@@ -389,7 +823,7 @@ class BestPracticesClient:
         Returns:
             Fallback response
         """
-        console.print("📋 Usando dati locali di fallback", style="blue")
+        self._notify("📋 Usando dati locali di fallback", "blue")
         
         # Use simulation but mark as fallback
         response = await self._simulate_mcp_response(server_key, query, context)
@@ -398,6 +832,21 @@ class BestPracticesClient:
         
         return response
     
+    @staticmethod
+    def _practice_key(practice: Dict[str, Any]) -> str:
+        """Return the identity used to deduplicate a practice
+        
+        Args:
+            practice: Practice data
+            
+        Returns:
+            Practice id, or a digest of its title when it has none
+        """
+        return (
+            practice.get('id')
+            or hashlib.blake2b(practice['title'].encode(), digest_size=16).hexdigest()
+        )
+    
     async def get_best_practices_for_project(self, 
                                            language: str,
                                            framework: Optional[str] = None,
@@ -436,30 +885,36 @@ class BestPracticesClient:
         all_practices = []
         servers_to_query = ['context_engineering', 'software_architecture']
         
-        if 'security' in categories:
+        if 'security' in context['categories']:
             servers_to_query.append('security_guidelines')
-        if 'performance' in categories:
+        if 'performance' in context['categories']:
             servers_to_query.append('performance_optimization')
         
-        for server_key in servers_to_query:
-            try:
-                response = await self.query_mcp_server(server_key, query, context)
-                if response['status'] in ['success', 'fallback']:
-                    all_practices.extend(response.get('practices', []))
-            except Exception as e:
-                console.print(f"⚠️ Errore nel server {server_key}: {str(e)}", style="yellow")
+        self._bind_loop()
+        
+        async def query_server(server_key: str) -> Dict[str, Any]:
+            async with self._fanout_sem:
+                return await self.query_mcp_server(server_key, query, context)
+        
+        results = await asyncio.gather(
+            *(query_server(server_key) for server_key in servers_to_query),
+            return_exceptions=True
+        )
+        
+        for server_key, response in zip(servers_to_query, results):
+            if isinstance(response, Exception):
+                self._notify(f"⚠️ Errore nel server {server_key}: {str(response)}", "yellow", logging.WARNING)
                 continue
+            if response['status'] in ['success', 'fallback']:
+                all_practices.extend(response.get('practices', []))
         
-        # Remove duplicates and sort by relevance
-        unique_practices = {}
-        for practice in all_practices:
-            practice_id = practice.get('id', hashlib.md5(practice['title'].encode()).hexdigest())
-            if practice_id not in unique_practices:
-                unique_practices[practice_id] = practice
-            else:
-                # Keep the one with higher confidence
-                if practice.get('confidence', 0) > unique_practices[practice_id].get('confidence', 0):
-                    unique_practices[practice_id] = practice
+        # Remove duplicates, keeping the highest-confidence entry per id
+        # (the sort is stable, so ties keep the first one seen)
+        keyed = sorted(
+            ((self._practice_key(practice), practice) for practice in all_practices),
+            key=lambda item: (item[0], -item[1].get('confidence', 0))
+        )
+        unique_practices = {key: next(group)[1] for key, group in groupby(keyed, key=itemgetter(0))}
         
         sorted_practices = sorted(
             unique_practices.values(),
@@ -505,23 +960,22 @@ class BestPracticesClient:
         
         response = await self.query_mcp_server('context_engineering', query, context)
         
-        # Generate CLAUDE.md specific suggestions
+        # Generate CLAUDE.md specific suggestions from the matching template
+        template = _CLAUDE_MD_TEMPLATES.get(
+            (language.lower(), (framework or '').lower()), _GENERIC_CLAUDE_MD_TEMPLATE
+        )
+        fields = {
+            'language': language,
+            'project_type': project_type,
+            'language_upper': language.upper(),
+            'framework_title': framework.title() if framework else 'Standard'
+        }
         suggestions = {
-            'project_description': f"Progetto {project_type} in {language}",
-            'stack_info': f"{language.upper()} + {framework.title() if framework else 'Standard'}",
-            'workflow_suggestions': [
-                "Sviluppo incrementale con test continui",
-                "Code review per ogni modifica significativa",
-                "Backup automatico su Git ad ogni sessione"
-            ],
-            'best_practices': [p['title'] for p in response.get('practices', [])[:5]],
-            'directory_structure': self._suggest_directory_structure(language, framework),
-            'git_integration': {
-                'auto_backup': True,
-                'commit_frequency': 'session',
-                'branch_strategy': 'feature-based'
-            }
+            key: value.format_map(fields) if isinstance(value, str) else copy.copy(value)
+            for key, value in template.items()
         }
+        suggestions['best_practices'] = [p['title'] for p in response.get('practices', [])[:5]]
+        suggestions['directory_structure'] = self._suggest_directory_structure(language, framework)
         
         return {
             'status': 'success',
@@ -540,46 +994,56 @@ class BestPracticesClient:
         Returns:
             Suggested directory structure
         """
-        structures = {
-            'php_laravel': {
-                'app/': 'Application logic',
-                'resources/views/': 'Blade templates',
-                'routes/': 'Route definitions',
-                'database/migrations/': 'Database migrations',
-                'public/': 'Public assets',
-                'storage/': 'File storage'
-            },
-            'javascript_react': {
-                'src/components/': 'React components',
-                'src/pages/': 'Page components',
-                'src/hooks/': 'Custom hooks',
-                'src/utils/': 'Utility functions',
-                'public/': 'Static assets',
-                'src/styles/': 'CSS/SCSS files'
-            },
-            'python_django': {
-                'apps/': 'Django applications',
-                'config/': 'Project configuration',
-                'static/': 'Static files',
-                'media/': 'User uploads',
-                'templates/': 'HTML templates',
-                'requirements/': 'Dependencies'
-            }
-        }
+        return dict(_DIR_STRUCTURES.get(f"{language}_{framework}".lower(), _DEFAULT_DIR))
+    
+    def _default_warm_queries(self) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """Build the common (server_key, query, context) triples used for warm-up
+        
+        Returns:
+            One query per topic for every known language/framework pair
+        """
+        queries = []
+        
+        for data_key in self.fallback_practices:
+            if data_key == 'general':
+                continue
+            language, framework = data_key.split('_', 1)
+            context = {'language': language, 'framework': framework}
+            for server_key, topic in (('context_engineering', 'best practices'),
+                                      ('software_architecture', 'architecture'),
+                                      ('security_guidelines', 'security'),
+                                      ('performance_optimization', 'performance')):
+                queries.append((server_key, f"{language} {framework} {topic}", context))
+        
+        return queries
+    
+    async def warm_cache(self, common_queries: Optional[List[Tuple[str, str, Dict[str, Any]]]] = None) -> int:
+        """Pre-populate the cache by running common queries concurrently
+        
+        Args:
+            common_queries: (server_key, query, context) triples to run;
+                defaults to a curated list derived from the fallback data
+            
+        Returns:
+            Number of queries that completed successfully
+        """
+        if common_queries is None:
+            common_queries = self._default_warm_queries()
+        
+        # Concurrency is bounded by the semaphore inside query_mcp_server
+        results = await asyncio.gather(
+            *(self.query_mcp_server(server_key, query, context)
+              for server_key, query, context in common_queries),
+            return_exceptions=True
+        )
         
-        key = f"{language}_{framework}".lower()
-        return structures.get(key, {
-            'src/': 'Source code',
-            'tests/': 'Test files',
-            'docs/': 'Documentation',
-            'config/': 'Configuration files'
-        })
+        return sum(1 for result in results if not isinstance(result, Exception))
     
     async def refresh_cache(self):
         """Refresh MCP cache by clearing old entries"""
         if self.cache_manager:
             self.cache_manager.clear_cache()
-            console.print("✅ Cache MCP aggiornata", style="green")
+            self._notify("✅ Cache MCP aggiornata", "green", logging.INFO)
     
     def get_available_servers(self) -> Dict[str, Any]:
         """Get list of available MCP servers
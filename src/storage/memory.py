@@ -2,14 +2,97 @@
 Memory management system for storing best practices and learned patterns
 """
 
+import sys
 import json
+import time
+import hashlib
+import functools
+import queue
+import atexit
 import sqlite3
+import threading
+from contextlib import contextmanager
+from collections import Counter, OrderedDict
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = json.loads
+
+def _dumps_bytes(data: Any) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+# JSON columns are stored as SQLite's binary JSONB when the library supports
+# it (3.45+); json() turns either representation back into text on read
+_JSONB = sqlite3.sqlite_version_info >= (3, 45, 0)
+_JSON_IN = 'jsonb(?)' if _JSONB else '?'
+
+def _json_out(column: str) -> str:
+    """SQL expression returning a JSON column as text"""
+    return f'json({column}) AS {column}' if _JSONB else column
+
+# Explicit column order used by BestPractice.from_row
+_PRACTICE_COLUMNS = (
+    'id, title, description, category, language, framework, '
+    f'{_json_out("tags")}, '
+    'source, confidence, usage_count, last_used, created_at, updated_at'
+)
+
+_PATTERN_COLUMNS = (
+    'id, project_type, language, framework, '
+    f'{_json_out("structure")}, {_json_out("best_practices")}, '
+    'success_rate, usage_count, created_at, updated_at'
+)
+
+# Filter bits for _build_search_sql
+_FILTER_CATEGORY = 1 << 0
+_FILTER_LANGUAGE = 1 << 1
+_FILTER_FRAMEWORK = 1 << 2
+_FILTER_TAGS = 1 << 3
+
+@functools.lru_cache(maxsize=32)
+def _build_search_sql(mask: int, n_tags: int) -> str:
+    """Build the search_best_practices query for a combination of filters
+    
+    The text is memoized so identical filter shapes always produce the same
+    string and hit the connection's statement cache.
+    
+    Args:
+        mask: Bitmask of the _FILTER_* flags in use
+        n_tags: Number of tag placeholders
+        
+    Returns:
+        SQL query text
+    """
+    query = f'SELECT {_PRACTICE_COLUMNS} FROM best_practices WHERE confidence >= ?'
+    
+    if mask & _FILTER_CATEGORY:
+        query += ' AND category = ?'
+    
+    if mask & _FILTER_LANGUAGE:
+        query += ' AND (language = ? OR language IS NULL)'
+    
+    if mask & _FILTER_FRAMEWORK:
+        query += ' AND (framework = ? OR framework IS NULL)'
+    
+    if mask & _FILTER_TAGS:
+        # Match any of the tags inside SQLite so LIMIT applies after filtering
+        placeholders = ', '.join('?' * n_tags)
+        query += f' AND EXISTS (SELECT 1 FROM json_each(best_practices.tags) WHERE value IN ({placeholders}))'
+    
+    # Order by usage count and confidence
+    return query + ' ORDER BY usage_count DESC, confidence DESC LIMIT ?'
+
 class PracticeCategory(Enum):
     """Categories for best practices"""
     ARCHITECTURE = "architecture"
@@ -25,7 +108,13 @@ class PracticeCategory(Enum):
     DEPLOYMENT = "deployment"
     MONITORING = "monitoring"
 
-@dataclass
+# Direct value -> member lookup, cheaper than PracticeCategory(value) per row
+_CATEGORY_BY_VALUE = {category.value: category for category in PracticeCategory}
+
+# __slots__ dataclasses need Python 3.10+; older interpreters keep __dict__
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class BestPractice:
     """Represents a best practice"""
     id: str
@@ -49,8 +138,36 @@ class BestPractice:
             self.created_at = datetime.now().isoformat()
         if self.updated_at is None:
             self.updated_at = self.created_at
+    
+    @classmethod
+    def from_row(cls, row) -> 'BestPractice':
+        """Build a BestPractice from a row selected with _PRACTICE_COLUMNS,
+        skipping the default-timestamp logic of __post_init__
+        
+        Args:
+            row: Database row
+            
+        Returns:
+            BestPractice instance
+        """
+        practice = cls.__new__(cls)
+        practice.id = row[0]
+        practice.title = row[1]
+        practice.description = row[2]
+        practice.category = _CATEGORY_BY_VALUE[row[3]]
+        practice.language = row[4]
+        practice.framework = row[5]
+        tags = row[6]
+        practice.tags = _loads(tags) if tags else []
+        practice.source = row[7]
+        practice.confidence = row[8]
+        practice.usage_count = row[9]
+        practice.last_used = row[10]
+        practice.created_at = row[11]
+        practice.updated_at = row[12]
+        return practice
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProjectPattern:
     """Represents a learned project pattern"""
     id: str
@@ -69,10 +186,45 @@ class ProjectPattern:
             self.created_at = datetime.now().isoformat()
         if self.updated_at is None:
             self.updated_at = self.created_at
+    
+    @classmethod
+    def from_row(cls, row) -> 'ProjectPattern':
+        """Build a ProjectPattern from a row selected with _PATTERN_COLUMNS,
+        skipping the default-timestamp logic of __post_init__
+        
+        Args:
+            row: Database row
+            
+        Returns:
+            ProjectPattern instance
+        """
+        pattern = cls.__new__(cls)
+        pattern.id = row[0]
+        pattern.project_type = row[1]
+        pattern.language = row[2]
+        pattern.framework = row[3]
+        pattern.structure = _loads(row[4])
+        pattern.best_practices = _loads(row[5])
+        pattern.success_rate = row[6]
+        pattern.usage_count = row[7]
+        pattern.created_at = row[8]
+        pattern.updated_at = row[9]
+        return pattern
 
 class MemoryManager:
     """Manages persistent memory for best practices and patterns"""
     
+    # Readers opened on demand; in WAL mode they never block the writer
+    _READ_POOL_SIZE = 4
+    
+    # Hot statements are kept as constants so the connection's statement
+    # cache (keyed by SQL text) always hits
+    _USE_SQL = (
+        'UPDATE best_practices '
+        'SET usage_count = usage_count + 1, last_used = ?1, updated_at = ?1 '
+        'WHERE id = ?2'
+    )
+    
     def __init__(self, config_dir: Optional[Path] = None):
         """Initialize memory manager
         
@@ -90,80 +242,187 @@ class MemoryManager:
         self.db_path = self.config_dir / 'memory.db'
         self.cache_file = self.config_dir / 'cache.json'
         
-        # Initialize database
+        # A single writer connection serialized by a lock, plus a small LIFO
+        # pool of reader connections so the most recently used (and warmest)
+        # one is handed out first
+        self._write_conn = self._connect()
+        self._write_lock = threading.Lock()
+        self._closed = False
+        self._read_pool = queue.LifoQueue(maxsize=self._READ_POOL_SIZE)
+        for _ in range(self._READ_POOL_SIZE):
+            self._read_pool.put(None)
         self._init_database()
         
-        # Load cache
+        # Load cache; MCP writes only mark it dirty and it is flushed on
+        # close() or at interpreter exit
         self.cache = self._load_cache()
+        self._cache_dirty = False
+        atexit.register(self.flush)
+    
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a tuned SQLite connection
+        
+        The connection runs in autocommit mode with WAL journaling, relaxed
+        fsync and in-memory temp storage, and returns sqlite3.Row rows.
+        
+        Args:
+            read_only: Reject writes on this connection
+            
+        Returns:
+            SQLite connection
+        """
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None, cached_statements=256
+        )
+        conn.row_factory = sqlite3.Row
+        
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-20000')
+        conn.execute('PRAGMA mmap_size=268435456')
+        if read_only:
+            conn.execute('PRAGMA query_only=ON')
+        
+        return conn
+    
+    @contextmanager
+    def _acquire_reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a reader connection from the pool, opening it on first use
+        
+        Returns:
+            Context manager yielding a SQLite connection
+        """
+        conn = self._read_pool.get()
+        try:
+            self._check_open()
+            if conn is None:
+                conn = self._connect(read_only=True)
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+    
+    def _check_open(self):
+        """Raise sqlite3.ProgrammingError once close() has been called"""
+        if self._closed:
+            raise sqlite3.ProgrammingError('Cannot operate on a closed database.')
+    
+    def flush(self):
+        """Write the cache file if it has pending changes"""
+        if self._cache_dirty:
+            self._save_cache()
+    
+    def close(self):
+        """Flush pending cache changes and close the database connections
+        
+        Later database calls raise sqlite3.ProgrammingError; closing twice is
+        a no-op.
+        """
+        if self._closed:
+            return
+        self.flush()
+        atexit.unregister(self.flush)
+        with self._write_lock:
+            self._closed = True
+            # Kept closed rather than dropped, so writes fail the same way
+            self._write_conn.close()
+        # Drained once every borrowed reader is back; the empty slots left
+        # behind only lead to the closed check in _acquire_reader
+        for _ in range(self._READ_POOL_SIZE):
+            conn = self._read_pool.get()
+            if conn is not None:
+                conn.close()
+        for _ in range(self._READ_POOL_SIZE):
+            self._read_pool.put(None)
     
     def _init_database(self):
         """Initialize SQLite database"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                CREATE TABLE IF NOT EXISTS best_practices (
-                    id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    description TEXT NOT NULL,
-                    category TEXT NOT NULL,
-                    language TEXT,
-                    framework TEXT,
-                    tags TEXT,  -- JSON array
-                    source TEXT NOT NULL,
-                    confidence REAL NOT NULL,
-                    usage_count INTEGER DEFAULT 0,
-                    last_used TEXT,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-            ''')
-            
-            conn.execute('''
-                CREATE TABLE IF NOT EXISTS project_patterns (
-                    id TEXT PRIMARY KEY,
-                    project_type TEXT NOT NULL,
-                    language TEXT NOT NULL,
-                    framework TEXT,
-                    structure TEXT NOT NULL,  -- JSON
-                    best_practices TEXT,  -- JSON array of IDs
-                    success_rate REAL DEFAULT 1.0,
-                    usage_count INTEGER DEFAULT 0,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-            ''')
-            
-            conn.execute('''
-                CREATE INDEX IF NOT EXISTS idx_practices_category 
-                ON best_practices(category)
-            ''')
-            
-            conn.execute('''
-                CREATE INDEX IF NOT EXISTS idx_practices_language 
-                ON best_practices(language)
-            ''')
-            
-            conn.execute('''
-                CREATE INDEX IF NOT EXISTS idx_patterns_type 
-                ON project_patterns(project_type, language)
-            ''')
-            
-            conn.commit()
+        conn = self._write_conn
+        
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS best_practices (
+                id TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                description TEXT NOT NULL,
+                category TEXT NOT NULL,
+                language TEXT,
+                framework TEXT,
+                tags BLOB,  -- JSON array (JSONB when supported)
+                source TEXT NOT NULL,
+                confidence REAL NOT NULL,
+                usage_count INTEGER DEFAULT 0,
+                last_used TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        ''')
+        
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS project_patterns (
+                id TEXT PRIMARY KEY,
+                project_type TEXT NOT NULL,
+                language TEXT NOT NULL,
+                framework TEXT,
+                structure BLOB NOT NULL,  -- JSON (JSONB when supported)
+                best_practices BLOB,  -- JSON array of IDs
+                success_rate REAL DEFAULT 1.0,
+                usage_count INTEGER DEFAULT 0,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        ''')
+        
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_practices_language 
+            ON best_practices(language)
+        ''')
+        
+        # Compound indexes matching the search filters and their ORDER BY.
+        # language/framework are matched with "OR ... IS NULL", so they
+        # cannot be equality prefixes; the ORDER BY columns follow directly.
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_practices_search
+            ON best_practices(category, usage_count DESC, confidence DESC)
+        ''')
+        
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_practices_confident
+            ON best_practices(usage_count DESC, confidence DESC)
+            WHERE confidence >= 0.5
+        ''')
+        
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_patterns_search
+            ON project_patterns(project_type, language, usage_count DESC, success_rate DESC)
+        ''')
+        
+        # Superseded by the compound indexes above
+        conn.execute('DROP INDEX IF EXISTS idx_practices_category')
+        conn.execute('DROP INDEX IF EXISTS idx_patterns_type')
     
     def _load_cache(self) -> Dict[str, Any]:
         """Load cache from file"""
         if not self.cache_file.exists():
             return {
-                'mcp_responses': {},
+                'mcp_responses': OrderedDict(),
                 'analysis_results': {},
                 'last_updated': datetime.now().isoformat()
             }
         
         try:
             with open(self.cache_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                cache = json.load(f)
+            # Entries are kept oldest-first so eviction is a popitem
+            cache['mcp_responses'] = OrderedDict(cache.get('mcp_responses', {}))
+            
+            # Older cache files stored ISO timestamps; convert them once here
+            for entry in cache['mcp_responses'].values():
+                if isinstance(entry.get('timestamp'), str):
+                    entry['timestamp'] = datetime.fromisoformat(entry['timestamp']).timestamp()
+            return cache
         except (json.JSONDecodeError, Exception):
             return {
-                'mcp_responses': {},
+                'mcp_responses': OrderedDict(),
                 'analysis_results': {},
                 'last_updated': datetime.now().isoformat()
             }
@@ -175,6 +434,7 @@ class MemoryManager:
         try:
             with open(self.cache_file, 'w', encoding='utf-8') as f:
                 json.dump(self.cache, f, indent=2, ensure_ascii=False)
+            self._cache_dirty = False
         except Exception as e:
             raise Exception(f"Failed to save cache: {str(e)}")
     
@@ -187,22 +447,56 @@ class MemoryManager:
         Returns:
             Practice ID
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                INSERT OR REPLACE INTO best_practices 
-                (id, title, description, category, language, framework, tags, 
-                 source, confidence, usage_count, last_used, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+        return self.add_best_practices([practice])[0]
+    
+    def add_best_practices(self, practices: List[BestPractice]) -> List[str]:
+        """Add several best practices in a single transaction
+        
+        Args:
+            practices: BestPractice instances
+            
+        Returns:
+            Practice IDs
+        """
+        rows = [
+            (
                 practice.id, practice.title, practice.description,
                 practice.category.value, practice.language, practice.framework,
                 json.dumps(practice.tags), practice.source, practice.confidence,
                 practice.usage_count, practice.last_used, practice.created_at,
                 practice.updated_at
-            ))
-            conn.commit()
-        
-        return practice.id
+            )
+            for practice in practices
+        ]
+        
+        with self._write_lock:
+            conn = self._write_conn
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                conn.executemany(f'''
+                    INSERT INTO best_practices
+                    (id, title, description, category, language, framework, tags,
+                     source, confidence, usage_count, last_used, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, {_JSON_IN}, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        title = excluded.title,
+                        description = excluded.description,
+                        category = excluded.category,
+                        language = excluded.language,
+                        framework = excluded.framework,
+                        tags = excluded.tags,
+                        source = excluded.source,
+                        confidence = excluded.confidence,
+                        usage_count = best_practices.usage_count,
+                        last_used = COALESCE(excluded.last_used, best_practices.last_used),
+                        updated_at = excluded.updated_at
+                ''', rows)
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+        
+        return [practice.id for practice in practices]
     
     def get_best_practice(self, practice_id: str) -> Optional[BestPractice]:
         """Get a best practice by ID
@@ -213,32 +507,16 @@ class MemoryManager:
         Returns:
             BestPractice instance or None
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                'SELECT * FROM best_practices WHERE id = ?', 
+        with self._acquire_reader() as conn:
+            row = conn.execute(
+                f'SELECT {_PRACTICE_COLUMNS} FROM best_practices WHERE id = ?', 
                 (practice_id,)
-            )
-            row = cursor.fetchone()
-            
-            if not row:
-                return None
-            
-            return BestPractice(
-                id=row['id'],
-                title=row['title'],
-                description=row['description'],
-                category=PracticeCategory(row['category']),
-                language=row['language'],
-                framework=row['framework'],
-                tags=json.loads(row['tags']) if row['tags'] else [],
-                source=row['source'],
-                confidence=row['confidence'],
-                usage_count=row['usage_count'],
-                last_used=row['last_used'],
-                created_at=row['created_at'],
-                updated_at=row['updated_at']
-            )
+            ).fetchone()
+        
+        if not row:
+            return None
+        
+        return BestPractice.from_row(row)
     
     def search_best_practices(
         self, 
@@ -262,56 +540,32 @@ class MemoryManager:
         Returns:
             List of BestPractice instances
         """
-        query = 'SELECT * FROM best_practices WHERE confidence >= ?'
+        mask = 0
         params = [min_confidence]
         
         if category:
-            query += ' AND category = ?'
+            mask |= _FILTER_CATEGORY
             params.append(category.value)
         
         if language:
-            query += ' AND (language = ? OR language IS NULL)'
+            mask |= _FILTER_LANGUAGE
             params.append(language)
         
         if framework:
-            query += ' AND (framework = ? OR framework IS NULL)'
+            mask |= _FILTER_FRAMEWORK
             params.append(framework)
         
-        # Order by usage count and confidence
-        query += ' ORDER BY usage_count DESC, confidence DESC LIMIT ?'
+        if tags:
+            mask |= _FILTER_TAGS
+            params.extend(tags)
+        
         params.append(limit)
+        query = _build_search_sql(mask, len(tags) if tags else 0)
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(query, params)
-            rows = cursor.fetchall()
-            
-            practices = []
-            for row in rows:
-                practice = BestPractice(
-                    id=row['id'],
-                    title=row['title'],
-                    description=row['description'],
-                    category=PracticeCategory(row['category']),
-                    language=row['language'],
-                    framework=row['framework'],
-                    tags=json.loads(row['tags']) if row['tags'] else [],
-                    source=row['source'],
-                    confidence=row['confidence'],
-                    usage_count=row['usage_count'],
-                    last_used=row['last_used'],
-                    created_at=row['created_at'],
-                    updated_at=row['updated_at']
-                )
-                
-                # Filter by tags if specified
-                if tags:
-                    if any(tag in practice.tags for tag in tags):
-                        practices.append(practice)
-                else:
-                    practices.append(practice)
-            
-            return practices
+        with self._acquire_reader() as conn:
+            rows = conn.execute(query, params).fetchall()
+        
+        return [BestPractice.from_row(row) for row in rows]
     
     def use_best_practice(self, practice_id: str):
         """Mark a best practice as used (increment usage count)
@@ -319,19 +573,8 @@ class MemoryManager:
         Args:
             practice_id: Practice ID
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                UPDATE best_practices 
-                SET usage_count = usage_count + 1, 
-                    last_used = ?,
-                    updated_at = ?
-                WHERE id = ?
-            ''', (
-                datetime.now().isoformat(),
-                datetime.now().isoformat(),
-                practice_id
-            ))
-            conn.commit()
+        with self._write_lock:
+            self._write_conn.execute(self._USE_SQL, (datetime.now().isoformat(), practice_id))
     
     def add_project_pattern(self, pattern: ProjectPattern) -> str:
         """Add a project pattern to memory
@@ -342,21 +585,52 @@ class MemoryManager:
         Returns:
             Pattern ID
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                INSERT OR REPLACE INTO project_patterns 
-                (id, project_type, language, framework, structure, best_practices,
-                 success_rate, usage_count, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+        return self.add_project_patterns([pattern])[0]
+    
+    def add_project_patterns(self, patterns: List[ProjectPattern]) -> List[str]:
+        """Add several project patterns in a single transaction
+        
+        Args:
+            patterns: ProjectPattern instances
+            
+        Returns:
+            Pattern IDs
+        """
+        rows = [
+            (
                 pattern.id, pattern.project_type, pattern.language,
                 pattern.framework, json.dumps(pattern.structure),
                 json.dumps(pattern.best_practices), pattern.success_rate,
                 pattern.usage_count, pattern.created_at, pattern.updated_at
-            ))
-            conn.commit()
-        
-        return pattern.id
+            )
+            for pattern in patterns
+        ]
+        
+        with self._write_lock:
+            conn = self._write_conn
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                conn.executemany(f'''
+                    INSERT INTO project_patterns
+                    (id, project_type, language, framework, structure, best_practices,
+                     success_rate, usage_count, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, {_JSON_IN}, {_JSON_IN}, ?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        project_type = excluded.project_type,
+                        language = excluded.language,
+                        framework = excluded.framework,
+                        structure = excluded.structure,
+                        best_practices = excluded.best_practices,
+                        success_rate = excluded.success_rate,
+                        usage_count = project_patterns.usage_count,
+                        updated_at = excluded.updated_at
+                ''', rows)
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+        
+        return [pattern.id for pattern in patterns]
     
     def find_project_patterns(
         self,
@@ -378,7 +652,7 @@ class MemoryManager:
         Returns:
             List of ProjectPattern instances
         """
-        query = 'SELECT * FROM project_patterns WHERE success_rate >= ?'
+        query = f'SELECT {_PATTERN_COLUMNS} FROM project_patterns WHERE success_rate >= ?'
         params = [min_success_rate]
         
         if project_type:
@@ -396,57 +670,60 @@ class MemoryManager:
         query += ' ORDER BY usage_count DESC, success_rate DESC LIMIT ?'
         params.append(limit)
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(query, params)
-            rows = cursor.fetchall()
-            
-            patterns = []
-            for row in rows:
-                pattern = ProjectPattern(
-                    id=row['id'],
-                    project_type=row['project_type'],
-                    language=row['language'],
-                    framework=row['framework'],
-                    structure=json.loads(row['structure']),
-                    best_practices=json.loads(row['best_practices']),
-                    success_rate=row['success_rate'],
-                    usage_count=row['usage_count'],
-                    created_at=row['created_at'],
-                    updated_at=row['updated_at']
-                )
-                patterns.append(pattern)
+        with self._acquire_reader() as conn:
+            rows = conn.execute(query, params).fetchall()
+        
+        patterns = [ProjectPattern.from_row(row) for row in rows]
+        
+        return patterns
+    
+    @staticmethod
+    def _mcp_cache_key(endpoint: str, query: str) -> str:
+        """Build a cache key that is stable across processes
+        
+        Args:
+            endpoint: MCP endpoint
+            query: Query string
             
-            return patterns
+        Returns:
+            Cache key
+        """
+        return f"{endpoint}:{hashlib.blake2b(query.encode('utf-8'), digest_size=8).hexdigest()}"
     
-    def cache_mcp_response(self, endpoint: str, query: str, response: Dict[str, Any]):
+    def cache_mcp_response(
+        self, 
+        endpoint: str, 
+        query: str, 
+        response: Dict[str, Any],
+        ttl_hours: Optional[int] = None
+    ):
         """Cache MCP server response
         
         Args:
             endpoint: MCP endpoint
             query: Query string
             response: Response data
+            ttl_hours: Lifetime of the entry in hours (None = reader decides)
         """
-        cache_key = f"{endpoint}:{hash(query)}"
+        cache_key = self._mcp_cache_key(endpoint, query)
+        
+        responses = self.cache['mcp_responses']
         
-        self.cache['mcp_responses'][cache_key] = {
+        # Re-inserting moves the key to the newest end
+        responses.pop(cache_key, None)
+        responses[cache_key] = {
             'response': response,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': time.time(),
             'endpoint': endpoint,
-            'query': query
+            'query': query,
+            'ttl_hours': ttl_hours
         }
         
-        # Clean old cache entries (keep last 100)
-        if len(self.cache['mcp_responses']) > 100:
-            # Remove oldest entries
-            sorted_items = sorted(
-                self.cache['mcp_responses'].items(),
-                key=lambda x: x[1]['timestamp']
-            )
-            # Keep last 50
-            self.cache['mcp_responses'] = dict(sorted_items[-50:])
+        # Keep the 100 most recent entries
+        while len(responses) > 100:
+            responses.popitem(last=False)
         
-        self._save_cache()
+        self._cache_dirty = True
     
     def get_cached_mcp_response(
         self, 
@@ -464,68 +741,74 @@ class MemoryManager:
         Returns:
             Cached response or None
         """
-        cache_key = f"{endpoint}:{hash(query)}"
+        cache_key = self._mcp_cache_key(endpoint, query)
         
         if cache_key not in self.cache['mcp_responses']:
             return None
         
         cached_item = self.cache['mcp_responses'][cache_key]
         
-        # Check age
-        cached_time = datetime.fromisoformat(cached_item['timestamp'])
-        max_age = datetime.now() - timedelta(hours=max_age_hours)
+        # Check age, honouring a shorter TTL stored with the entry
+        ttl_hours = cached_item.get('ttl_hours')
+        if ttl_hours is not None:
+            max_age_hours = min(max_age_hours, ttl_hours)
         
-        if cached_time < max_age:
+        if time.time() - cached_item['timestamp'] > max_age_hours * 3600:
             return None
         
         return cached_item['response']
     
+    def get_with_age(self, endpoint: str, query: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Get a cached MCP response together with its age
+        
+        Args:
+            endpoint: MCP endpoint
+            query: Query string
+            
+        Returns:
+            Tuple of (response, age in seconds) or None if not cached
+        """
+        cache_key = self._mcp_cache_key(endpoint, query)
+        
+        cached_item = self.cache['mcp_responses'].get(cache_key)
+        if cached_item is None:
+            return None
+        
+        age = time.time() - cached_item['timestamp']
+        
+        return cached_item['response'], age
+    
     def get_statistics(self) -> Dict[str, Any]:
         """Get memory statistics
         
         Returns:
             Statistics dictionary
         """
-        with sqlite3.connect(self.db_path) as conn:
-            # Best practices stats
-            cursor = conn.execute('SELECT COUNT(*) FROM best_practices')
-            total_practices = cursor.fetchone()[0]
-            
-            cursor = conn.execute('''
-                SELECT category, COUNT(*) 
-                FROM best_practices 
-                GROUP BY category
-            ''')
-            practices_by_category = dict(cursor.fetchall())
-            
-            cursor = conn.execute('''
-                SELECT language, COUNT(*) 
-                FROM best_practices 
-                WHERE language IS NOT NULL
-                GROUP BY language
-            ''')
-            practices_by_language = dict(cursor.fetchall())
+        # A single scan per table feeds every grouping
+        practices_by_category = Counter()
+        practices_by_language = Counter()
+        total_practices = 0
+        with self._acquire_reader() as conn:
+            for category, language in conn.execute('SELECT category, language FROM best_practices'):
+                total_practices += 1
+                practices_by_category[category] += 1
+                if language is not None:
+                    practices_by_language[language] += 1
             
-            # Project patterns stats
-            cursor = conn.execute('SELECT COUNT(*) FROM project_patterns')
-            total_patterns = cursor.fetchone()[0]
-            
-            cursor = conn.execute('''
-                SELECT project_type, COUNT(*) 
-                FROM project_patterns 
-                GROUP BY project_type
-            ''')
-            patterns_by_type = dict(cursor.fetchall())
+            patterns_by_type = Counter(
+                project_type for project_type, in conn.execute('SELECT project_type FROM project_patterns')
+            )
+        total_patterns = sum(patterns_by_type.values())
         
         return {
             'best_practices': {
                 'total': total_practices,
-                'by_category': practices_by_category,
-                'by_language': practices_by_language
+                'by_category': dict(practices_by_category),
+                'by_language': dict(practices_by_language)
             },
             'project_patterns': {
                 'total': total_patterns,
-                'by_type': patterns_by_type
+                'by_type': dict(patterns_by_type)
             },
             'cache': {
                 'mcp_responses': len(self.cache['mcp_responses']),
@@ -539,42 +822,61 @@ class MemoryManager:
         Args:
             file_path: Export file path
         """
-        # Get all best practices
-        practices = []
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute('SELECT * FROM best_practices')
-            for row in cursor.fetchall():
-                practice_dict = dict(row)
-                practice_dict['tags'] = json.loads(practice_dict['tags']) if practice_dict['tags'] else []
-                practices.append(practice_dict)
-        
-        # Get all project patterns
-        patterns = []
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute('SELECT * FROM project_patterns')
-            for row in cursor.fetchall():
-                pattern_dict = dict(row)
-                pattern_dict['structure'] = json.loads(pattern_dict['structure'])
-                pattern_dict['best_practices'] = json.loads(pattern_dict['best_practices'])
-                patterns.append(pattern_dict)
-        
-        export_data = {
-            'best_practices': practices,
-            'project_patterns': patterns,
-            'cache': self.cache,
-            'exported_at': datetime.now().isoformat(),
-            'version': '1.0.0'
-        }
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        def row_object(columns: Tuple[str, ...], json_columns: Tuple[str, ...]) -> str:
+            """SQL expression rendering a whole row as a JSON object"""
+            parts = []
+            for column in columns:
+                value = f"json(COALESCE(NULLIF({column}, ''), '[]'))" if column in json_columns else column
+                parts.append(f"'{column}', {value}")
+            return f"json_object({', '.join(parts)})"
+        
+        def write_rows(f, key: str, table: str, columns: Tuple[str, ...],
+                       json_columns: Tuple[str, ...]):
+            """Stream one table as a JSON array, a batch of rows at a time"""
+            cursor = conn.execute(
+                f'SELECT {row_object(columns, json_columns)} FROM {table} ORDER BY rowid'
+            )
+            cursor.arraysize = 1000
+            f.write(f'  "{key}": ['.encode('utf-8'))
+            separator = b'\n    '
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                for (row_json,) in rows:
+                    f.write(separator + row_json)
+                    separator = b',\n    '
+            f.write(b'\n  ],\n')
+        
+        # SQLite renders each row as JSON itself and, with text_factory=bytes,
+        # hands back the UTF-8 bytes untouched; they go straight to a large
+        # write buffer, so memory use does not grow with the library size
+        self._check_open()
+        conn = self._connect()
+        conn.text_factory = bytes
+        try:
+            with open(file_path, 'wb', buffering=1 << 20) as f:
+                f.write(b'{\n')
+                write_rows(f, 'best_practices', 'best_practices', (
+                    'id', 'title', 'description', 'category', 'language', 'framework',
+                    'tags', 'source', 'confidence', 'usage_count', 'last_used',
+                    'created_at', 'updated_at'
+                ), ('tags',))
+                write_rows(f, 'project_patterns', 'project_patterns', (
+                    'id', 'project_type', 'language', 'framework', 'structure',
+                    'best_practices', 'success_rate', 'usage_count', 'created_at',
+                    'updated_at'
+                ), ('structure', 'best_practices'))
+                f.write(b'  "cache": ' + _dumps_bytes(self.cache) + b',\n')
+                f.write(b'  "exported_at": ' + _dumps_bytes(datetime.now().isoformat()) + b',\n')
+                f.write(b'  "version": "1.0.0"\n}\n')
+        finally:
+            conn.close()
     
     def clear_cache(self):
         """Clear all cached data"""
         self.cache = {
-            'mcp_responses': {},
+            'mcp_responses': OrderedDict(),
             'analysis_results': {},
             'last_updated': datetime.now().isoformat()
         }
@@ -3,14 +3,95 @@ User preferences management system
 Handles persistent storage of user settings and preferences
 """
 
+import copy
 import json
 import os
+import mmap
+import hmac
+import time
+import struct
+import hashlib
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List
 from datetime import datetime
-from cryptography.fernet import Fernet
 import base64
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Raw secure-file layout: version | timestamp | IV | AES-128-CBC ciphertext |
+# HMAC-SHA256 tag, i.e. a Fernet token without the base64 wrapping. Fernet
+# tokens are base64 text and always start with b'g', never with this byte
+_SECURE_VERSION = b'\x80'
+_SECURE_HEADER_SIZE = 1 + 8 + 16
+_SECURE_TAG_SIZE = 32
+
+# Secure files at least this large are decrypted straight from a memory map
+_MMAP_MIN_SIZE = 64 * 1024
+
+# Marks a dot-path that does not resolve in _pref_cache
+_MISSING = object()
+
+def _atomic_write(path: Path, data: bytes):
+    """Write data to a sibling temp file with one call, then rename it over path"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+# Default preferences; timestamps are stamped on each copy
+_DEFAULT_PREFERENCES = {
+    'version': '1.0.0',
+    'created_at': None,
+    'last_updated': None,
+    'user_info': {
+        'name': '',
+        'email': '',
+        'github_username': ''
+    },
+    'programming': {
+        'favorite_languages': [],
+        'favorite_frameworks': [],
+        'coding_style': 'pragmatic',
+        'project_structure_preference': 'modular'
+    },
+    'interface': {
+        'theme': 'default',
+        'show_welcome_message': True,
+        'auto_clear_screen': True
+    },
+    'integrations': {
+        'auto_git_backup': True,
+        'use_mcp_by_default': True,
+        'backup_frequency': 'session'
+    },
+    'directories': {
+        'default_project_paths': [
+            '/mnt/c/xampp/htdocs',
+            '/mnt/c/Users/*/Desktop',
+            '/mnt/c/progetti',
+            '~/projects'
+        ],
+        'scan_subdirectories': True
+    },
+    'notifications': {
+        'show_suggestions': True,
+        'show_next_steps': True,
+        'show_tips': True
+    }
+}
+
 class PreferencesManager:
     """Manages user preferences with secure storage"""
     
@@ -32,15 +113,60 @@ class PreferencesManager:
         self.secure_file = self.config_dir / 'secure.json'
         self.key_file = self.config_dir / '.key'
         
-        # Initialize encryption key
-        self._init_encryption()
+        # Preferences, secure data and the cipher are loaded on first access,
+        # so callers that only touch one of them skip the other's cost
+        self._prefs = None
+        self._secure = None
+        self._cipher = None
         
-        # Load existing preferences
-        self.preferences = self._load_preferences()
-        self.secure_data = self._load_secure_data()
+        # Preference writes are deferred while a batch() is open
+        self._dirty = False
+        self._batch_depth = 0
+        self._now_str = None
+        
+        # Secure data writes (one encryption each) are deferred the same way
+        # while a batch_secure() is open
+        self._secure_dirty = False
+        self._secure_batch_depth = 0
+        
+        # Resolved dot-path lookups, cleared whenever preferences change
+        self._pref_cache = {}
+    
+    @property
+    def preferences(self) -> Dict[str, Any]:
+        """User preferences, loaded from file on first access"""
+        if self._prefs is None:
+            self._prefs = self._load_preferences()
+        return self._prefs
+    
+    @preferences.setter
+    def preferences(self, value: Dict[str, Any]):
+        self._prefs = value
+        self._pref_cache.clear()
+    
+    @property
+    def secure_data(self) -> Dict[str, Any]:
+        """Decrypted secure data, loaded from file on first access"""
+        if self._secure is None:
+            self._secure = self._load_secure_data()
+        return self._secure
+    
+    @secure_data.setter
+    def secure_data(self, value: Dict[str, Any]):
+        self._secure = value
+    
+    @property
+    def cipher(self):
+        """Fernet cipher for secure data, created on first use"""
+        if self._cipher is None:
+            self._init_encryption()
+        return self._cipher
     
     def _init_encryption(self):
         """Initialize encryption key for secure data"""
+        # Imported here so preference-only code paths never load cryptography
+        from cryptography.fernet import Fernet
+        
         if self.key_file.exists():
             with open(self.key_file, 'rb') as f:
                 self.key = f.read()
@@ -52,7 +178,76 @@ class PreferencesManager:
             if os.name == 'posix':
                 os.chmod(self.key_file, 0o600)
         
-        self.cipher = Fernet(self.key)
+        self._cipher = Fernet(self.key)
+        
+        # Same key split Fernet uses: signing half, then encryption half
+        raw_key = base64.urlsafe_b64decode(self.key)
+        self._signing_key = raw_key[:16]
+        self._encryption_key = raw_key[16:]
+    
+    def _encrypt(self, data: bytes) -> bytes:
+        """Encrypt data into the raw secure-file layout
+        
+        Args:
+            data: Plaintext bytes
+            
+        Returns:
+            Encrypted bytes
+        """
+        from cryptography.hazmat.primitives import padding
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+        
+        if self._cipher is None:
+            self._init_encryption()
+        iv = os.urandom(16)
+        padder = padding.PKCS7(128).padder()
+        padded = padder.update(data) + padder.finalize()
+        encryptor = Cipher(algorithms.AES(self._encryption_key), modes.CBC(iv)).encryptor()
+        ciphertext = encryptor.update(padded) + encryptor.finalize()
+        
+        payload = _SECURE_VERSION + struct.pack('>Q', int(time.time())) + iv + ciphertext
+        return payload + hmac.new(self._signing_key, payload, hashlib.sha256).digest()
+    
+    def _decrypt(self, token) -> bytes:
+        """Decrypt a raw secure-file payload, or a Fernet token from older files
+        
+        Args:
+            token: Encrypted bytes or any bytes-like object, such as an mmap
+            
+        Returns:
+            Plaintext bytes
+        """
+        if token[:1] != _SECURE_VERSION:
+            return self.cipher.decrypt(bytes(token))
+        
+        from cryptography.hazmat.primitives import padding
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+        
+        if self._cipher is None:
+            self._init_encryption()
+        if len(token) < _SECURE_HEADER_SIZE + 16 + _SECURE_TAG_SIZE:
+            raise ValueError("Secure data is truncated")
+        
+        # Work on views so the ciphertext is never copied; they are released
+        # explicitly so a backing mmap can be closed afterwards
+        view = memoryview(token)
+        payload = view[:-_SECURE_TAG_SIZE]
+        ciphertext = payload[_SECURE_HEADER_SIZE:]
+        try:
+            expected = hmac.new(self._signing_key, payload, hashlib.sha256).digest()
+            if not hmac.compare_digest(bytes(view[-_SECURE_TAG_SIZE:]), expected):
+                raise ValueError("Secure data failed integrity check")
+            
+            iv = bytes(payload[9:_SECURE_HEADER_SIZE])
+            decryptor = Cipher(algorithms.AES(self._encryption_key), modes.CBC(iv)).decryptor()
+            padded = decryptor.update(ciphertext) + decryptor.finalize()
+        finally:
+            ciphertext.release()
+            payload.release()
+            view.release()
+        
+        unpadder = padding.PKCS7(128).unpadder()
+        return unpadder.update(padded) + unpadder.finalize()
     
     def _load_preferences(self) -> Dict[str, Any]:
         """Load preferences from file"""
@@ -60,8 +255,7 @@ class PreferencesManager:
             return self._get_default_preferences()
         
         try:
-            with open(self.preferences_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _loads(self.preferences_file.read_bytes())
         except (json.JSONDecodeError, Exception):
             return self._get_default_preferences()
     
@@ -72,74 +266,89 @@ class PreferencesManager:
         
         try:
             with open(self.secure_file, 'rb') as f:
-                encrypted_data = f.read()
-            
-            decrypted_data = self.cipher.decrypt(encrypted_data)
-            return json.loads(decrypted_data.decode('utf-8'))
+                if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        decrypted_data = self._decrypt(mapped)
+                else:
+                    decrypted_data = self._decrypt(f.read())
+            return _loads(decrypted_data)
         except Exception:
             return {}
     
     def _get_default_preferences(self) -> Dict[str, Any]:
         """Get default preferences"""
-        return {
-            'version': '1.0.0',
-            'created_at': datetime.now().isoformat(),
-            'last_updated': datetime.now().isoformat(),
-            'user_info': {
-                'name': '',
-                'email': '',
-                'github_username': ''
-            },
-            'programming': {
-                'favorite_languages': [],
-                'favorite_frameworks': [],
-                'coding_style': 'pragmatic',
-                'project_structure_preference': 'modular'
-            },
-            'interface': {
-                'theme': 'default',
-                'show_welcome_message': True,
-                'auto_clear_screen': True
-            },
-            'integrations': {
-                'auto_git_backup': True,
-                'use_mcp_by_default': True,
-                'backup_frequency': 'session'
-            },
-            'directories': {
-                'default_project_paths': [
-                    '/mnt/c/xampp/htdocs',
-                    '/mnt/c/Users/*/Desktop',
-                    '/mnt/c/progetti',
-                    '~/projects'
-                ],
-                'scan_subdirectories': True
-            },
-            'notifications': {
-                'show_suggestions': True,
-                'show_next_steps': True,
-                'show_tips': True
-            }
-        }
+        preferences = copy.deepcopy(_DEFAULT_PREFERENCES)
+        now = self._now_str or datetime.now().isoformat()
+        preferences['created_at'] = now
+        preferences['last_updated'] = now
+        return preferences
     
     def save_preferences(self):
         """Save preferences to file"""
-        self.preferences['last_updated'] = datetime.now().isoformat()
-        
+        self.preferences['last_updated'] = self._now_str or datetime.now().isoformat()
+        self._pref_cache.pop('last_updated', None)
+
         try:
-            with open(self.preferences_file, 'w', encoding='utf-8') as f:
-                json.dump(self.preferences, f, indent=2, ensure_ascii=False)
+            data = _dumps(self.preferences)
+            _atomic_write(self.preferences_file, data)
+            self._dirty = False
         except Exception as e:
             raise Exception(f"Failed to save preferences: {str(e)}")
     
+    def flush(self):
+        """Write preferences to file if they have unsaved changes"""
+        if self._dirty:
+            self.save_preferences()
+    
+    def _mark_dirty(self):
+        """Record a preference change, writing it now unless batching"""
+        self._dirty = True
+        self._pref_cache.clear()
+        if not self._batch_depth:
+            self.flush()
+    
+    @contextmanager
+    def batch(self) -> Iterator['PreferencesManager']:
+        """Group several preference changes into a single file write
+        
+        Returns:
+            Context manager yielding this manager
+        """
+        if not self._batch_depth:
+            # One timestamp serves every save made during the batch
+            self._now_str = datetime.now().isoformat()
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                try:
+                    self.flush()
+                finally:
+                    self._now_str = None
+    
+    @contextmanager
+    def batch_secure(self) -> Iterator['PreferencesManager']:
+        """Group several secure data changes into a single encrypted write
+        
+        Returns:
+            Context manager yielding this manager
+        """
+        self._secure_batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._secure_batch_depth -= 1
+            if not self._secure_batch_depth and self._secure_dirty:
+                self.save_secure_data()
+    
     def save_secure_data(self):
         """Save secure data to encrypted file"""
         try:
-            data_str = json.dumps(self.secure_data, indent=2, ensure_ascii=False)
-            encrypted_data = self.cipher.encrypt(data_str.encode('utf-8'))
-            
-            with open(self.secure_file, 'wb') as f:
-                f.write(encrypted_data)
+            encrypted_data = self._encrypt(_dumps(self.secure_data))
+            _atomic_write(self.secure_file, encrypted_data)
+            self._secure_dirty = False
         except Exception as e:
             raise Exception(f"Failed to save secure data: {str(e)}")
     
@@ -153,16 +362,18 @@ class PreferencesManager:
         Returns:
             Preference value
         """
-        keys = key.split('.')
-        value = self.preferences
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
+        value = self._pref_cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = self.preferences
+            for k in key.split('.'):
+                if isinstance(value, dict) and k in value:
+                    value = value[k]
+                else:
+                    value = _MISSING
+                    break
+            self._pref_cache[key] = value
         
-        return value
+        return default if value is _MISSING else value
     
     def set_preference(self, key: str, value: Any):
         """Set a preference value using dot notation
@@ -182,7 +393,7 @@ class PreferencesManager:
         
         # Set the final value
         current[keys[-1]] = value
-        self.save_preferences()
+        self._mark_dirty()
     
     def get_secure_data(self, key: str, default: Any = None) -> Any:
         """Get secure data (like tokens)
@@ -204,7 +415,9 @@ class PreferencesManager:
             value: Value to set
         """
         self.secure_data[key] = value
-        self.save_secure_data()
+        self._secure_dirty = True
+        if not self._secure_batch_depth:
+            self.save_secure_data()
     
     def update_preferences(self, updates: Dict[str, Any]):
         """Update multiple preferences at once
@@ -212,15 +425,18 @@ class PreferencesManager:
         Args:
             updates: Dictionary of preference updates
         """
-        def deep_update(base_dict, update_dict):
+        # Merge nested dicts level by level instead of recursing
+        pending = deque([(self.preferences, updates)])
+        while pending:
+            base_dict, update_dict = pending.popleft()
             for key, value in update_dict.items():
-                if isinstance(value, dict) and key in base_dict and isinstance(base_dict[key], dict):
-                    deep_update(base_dict[key], value)
+                current = base_dict.get(key)
+                if isinstance(value, dict) and isinstance(current, dict):
+                    pending.append((current, value))
                 else:
                     base_dict[key] = value
         
-        deep_update(self.preferences, updates)
-        self.save_preferences()
+        self._mark_dirty()
     
     def add_favorite_language(self, language: str):
         """Add a programming language to favorites"""
@@ -269,17 +485,22 @@ class PreferencesManager:
             file_path: Path to export file
             include_secure: Whether to include secure data
         """
-        export_data = {
-            'preferences': self.preferences,
-            'exported_at': datetime.now().isoformat(),
-            'version': self.preferences.get('version', '1.0.0')
-        }
+        preferences = self.preferences
+        
+        # Assemble the top-level object by hand; nested lines are shifted one
+        # indent level (JSON strings never contain raw newlines, so this is safe)
+        parts = [
+            b'{\n  "preferences": ', _dumps(preferences).strip().replace(b'\n', b'\n  '),
+            b',\n  "exported_at": ', _dumps(datetime.now().isoformat()),
+            b',\n  "version": ', _dumps(preferences.get('version', '1.0.0'))
+        ]
         
         if include_secure:
-            export_data['secure_data'] = self.secure_data
+            parts.append(b',\n  "secure_data": ')
+            parts.append(_dumps(self.secure_data).replace(b'\n', b'\n  '))
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        parts.append(b'\n}')
+        _atomic_write(Path(file_path), b''.join(parts))
     
     def import_preferences(self, file_path: Path, merge: bool = True):
         """Import preferences from file
@@ -288,8 +509,7 @@ class PreferencesManager:
             file_path: Path to import file
             merge: Whether to merge with existing preferences
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            import_data = json.load(f)
+        import_data = _loads(Path(file_path).read_bytes())
         
         if merge:
             self.update_preferences(import_data.get('preferences', {}))
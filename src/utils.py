@@ -2,13 +2,44 @@
 Utility functions per Context Engineering Agent
 """
 
+import os
+import re
+import stat
 import json
+import queue
+import atexit
+import fnmatch
 import logging
+import logging.handlers
 import shutil
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional, Union
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Estensioni considerate file di testo
+_TEXT_EXTENSIONS = frozenset({
+    '.py', '.js', '.ts', '.jsx', '.tsx', '.php', '.html', '.css', '.scss',
+    '.json', '.xml', '.yaml', '.yml', '.md', '.txt', '.sql', '.sh', '.bat'
+})
+# Stesse estensioni per str.endswith, che confronta i suffissi in C
+_TEXT_EXTENSIONS_TUPLE = tuple(sorted(_TEXT_EXTENSIONS))
+
+# Sotto questa soglia di sottocartelle di primo livello la scansione resta
+# sequenziale: il costo dei thread supererebbe il guadagno
+_PARALLEL_MIN_DIRS = 4
+_PARALLEL_MAX_WORKERS = 8
+
+# Cache di load_json: path -> (mtime_ns, dimensione, dati)
+_JSON_CACHE: Dict[str, tuple] = {}
+_JSON_CACHE_SIZE = 256
+
 
 def setup_logging(verbose: bool = False, debug: bool = False):
     """Configura logging per l'agente"""
@@ -18,12 +49,31 @@ def setup_logging(verbose: bool = False, debug: bool = False):
     log_dir = Path.home() / '.context-engineer'
     ensure_dir(log_dir)
     
+    # Come basicConfig: se il logging è già configurato non si tocca nulla
+    if logging.getLogger().handlers:
+        return
+    
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_dir / 'agent.log')
+    file_handler.setFormatter(formatter)
+    
+    # Le scritture su file passano da un thread dedicato: nel codice caldo
+    # una chiamata di log si riduce a un inserimento in coda
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # Il record va in coda col solo messaggio: il formato completo lo applica il file handler
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
     logging.basicConfig(
         level=level,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
             logging.StreamHandler(),
-            logging.FileHandler(log_dir / 'agent.log')
+            queue_handler
         ]
     )
 
@@ -57,18 +107,40 @@ def copy_template(src: Path, dest: Path):
 
 
 def load_json(path: Path) -> Dict[str, Any]:
-    """Carica file JSON"""
-    if path.exists():
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
+    """Carica file JSON
+    
+    Finché mtime e dimensione del file non cambiano viene restituito lo
+    stesso oggetto già letto: chi deve modificarlo ne faccia una copia.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return {}
+    
+    key = os.fspath(path)
+    cached = _JSON_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    
+    with open(key, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    
+    if key not in _JSON_CACHE and len(_JSON_CACHE) >= _JSON_CACHE_SIZE:
+        _JSON_CACHE.pop(next(iter(_JSON_CACHE)))
+    _JSON_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    return data
 
 
 def save_json(path: Path, data: Dict[str, Any]):
     """Salva file JSON"""
     ensure_dir(path.parent)
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    _JSON_CACHE.pop(os.fspath(path), None)
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
 
 
 def read_file(path: Path) -> str:
@@ -84,48 +156,119 @@ def write_file(path: Path, content: str):
     path.write_text(content, encoding='utf-8')
 
 
-def get_file_extension(path: Path) -> str:
+def _name_suffix(name: str) -> str:
+    """Estensione minuscola di un nome file, come Path.suffix.lower()"""
+    i = name.rfind('.')
+    if 0 < i < len(name) - 1:
+        return name[i:].lower()
+    return ''
+
+
+def get_file_extension(path: Union[str, Path]) -> str:
     """Ottiene estensione file"""
-    return path.suffix.lower()
+    return _name_suffix(os.path.basename(os.fspath(path)))
 
 
-def is_text_file(path: Path) -> bool:
+def is_text_file(path: Union[str, Path]) -> bool:
     """Verifica se è un file di testo"""
-    text_extensions = {
-        '.py', '.js', '.ts', '.jsx', '.tsx', '.php', '.html', '.css', '.scss',
-        '.json', '.xml', '.yaml', '.yml', '.md', '.txt', '.sql', '.sh', '.bat'
-    }
-    return get_file_extension(path) in text_extensions
+    name = os.path.basename(os.fspath(path)).lower()
+    # Un nome che è solo l'estensione ('.py') è un dotfile senza suffisso
+    return name.endswith(_TEXT_EXTENSIONS_TUPLE) and name not in _TEXT_EXTENSIONS
 
 
-def calculate_file_stats(project_path: Path) -> Dict[str, Any]:
-    """Calcola statistiche file progetto"""
-    stats = {
+def _new_stats() -> Dict[str, Any]:
+    """Contatori vuoti per calculate_file_stats"""
+    return {
         'total_files': 0,
         'text_files': 0,
         'directories': 0,
-        'size_mb': 0,
-        'extensions': {}
+        'size_bytes': 0,
+        'extensions': Counter()
     }
+
+
+def _scan_tree(root: str, stats: Dict[str, Any], subdirs: Optional[list] = None):
+    """Visita ricorsivamente root con os.scandir accumulando le statistiche
     
-    for item in project_path.rglob('*'):
-        if item.is_file():
-            stats['total_files'] += 1
-            stats['size_mb'] += item.stat().st_size / (1024 * 1024)
-            
-            ext = get_file_extension(item)
-            stats['extensions'][ext] = stats['extensions'].get(ext, 0) + 1
-            
-            if is_text_file(item):
-                stats['text_files'] += 1
-                
-        elif item.is_dir():
-            stats['directories'] += 1
+    Se subdirs è indicato, le sottocartelle vi vengono aggiunte invece di
+    essere visitate. Le cartelle illeggibili vengono saltate, come con rglob.
+    """
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
     
-    stats['size_mb'] = round(stats['size_mb'], 2)
+    with it as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stats['directories'] += 1
+                if subdirs is None:
+                    _scan_tree(entry.path, stats)
+                else:
+                    subdirs.append(entry.path)
+            elif entry.is_file():
+                # File rimosso durante la visita: non conteggiato
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    continue
+                
+                stats['total_files'] += 1
+                stats['size_bytes'] += size
+                
+                # Nome minuscolo calcolato una volta; estensione come Path.suffix
+                name = entry.name.lower()
+                i = name.rfind('.')
+                ext = name[i:] if 0 < i < len(name) - 1 else ''
+                stats['extensions'][ext] += 1
+                
+                if ext in _TEXT_EXTENSIONS:
+                    stats['text_files'] += 1
+            
+            elif entry.is_dir():
+                # Link a directory: contata ma non attraversata, come rglob
+                stats['directories'] += 1
+
+
+def _scan_subtree(root: str) -> Dict[str, Any]:
+    """Statistiche parziali di una sottocartella, eseguita in un worker"""
+    stats = _new_stats()
+    _scan_tree(root, stats)
     return stats
 
 
+def calculate_file_stats(project_path: Path) -> Dict[str, Any]:
+    """Calcola statistiche file progetto"""
+    stats = _new_stats()
+    
+    # DirEntry riusa i dati di readdir: niente Path né stat extra per voce
+    subdirs = []
+    _scan_tree(os.fspath(project_path), stats, subdirs)
+    
+    if len(subdirs) >= _PARALLEL_MIN_DIRS:
+        # Le syscall di scandir/stat rilasciano il GIL: un worker per
+        # sottocartella di primo livello
+        workers = min(_PARALLEL_MAX_WORKERS, len(subdirs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for partial in executor.map(_scan_subtree, subdirs):
+                stats['total_files'] += partial['total_files']
+                stats['text_files'] += partial['text_files']
+                stats['directories'] += partial['directories']
+                stats['size_bytes'] += partial['size_bytes']
+                stats['extensions'].update(partial['extensions'])
+    else:
+        for subdir in subdirs:
+            _scan_tree(subdir, stats)
+    
+    return {
+        'total_files': stats['total_files'],
+        'text_files': stats['text_files'],
+        'directories': stats['directories'],
+        'size_mb': round(stats['size_bytes'] / (1024 * 1024), 2),
+        'extensions': dict(stats['extensions'])
+    }
+
+
 def format_timestamp(dt: Optional[datetime] = None) -> str:
     """Formatta timestamp"""
     if dt is None:
@@ -153,16 +296,45 @@ def get_relative_path(file_path: Path, base_path: Path) -> Path:
         return file_path
 
 
+def _iter_entries(root: Union[str, Path]) -> Iterator[os.DirEntry]:
+    """Itera tutte le voci sotto root con os.scandir, senza seguire i link
+    
+    Le cartelle illeggibili vengono saltate, come con rglob.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        
+        with it as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                yield entry
+
+
 def find_files_by_pattern(directory: Path, pattern: str) -> list[Path]:
     """Trova file per pattern"""
-    return list(directory.rglob(pattern))
+    if '/' in pattern or os.sep in pattern:
+        # Pattern su più livelli: li gestisce rglob
+        return list(directory.rglob(pattern))
+    
+    if pattern.startswith('*.') and not any(c in pattern[1:] for c in '*?['):
+        # Semplice suffisso ('*.py'): basta endswith, niente regex
+        return find_files_by_extension(directory, pattern[1:])
+    
+    # Come rglob, il confronto ignora le maiuscole solo su Windows
+    match = re.compile(fnmatch.translate(pattern), re.IGNORECASE if os.name == 'nt' else 0).match
+    return [Path(entry.path) for entry in _iter_entries(directory) if match(entry.name)]
 
 
 def find_files_by_extension(directory: Path, extension: str) -> list[Path]:
     """Trova file per estensione"""
     if not extension.startswith('.'):
         extension = '.' + extension
-    return list(directory.rglob(f'*{extension}'))
+    return [Path(entry.path) for entry in _iter_entries(directory) if entry.name.endswith(extension)]
 
 
 def get_project_name(project_path: Path) -> str:
@@ -185,32 +357,39 @@ def get_project_name(project_path: Path) -> str:
     return project_path.name
 
 
-def detect_git_repo(project_path: Path) -> bool:
+def detect_git_repo(project_path: Union[str, Path]) -> bool:
     """Rileva se è un repository git"""
-    return (project_path / '.git').exists()
+    return os.path.exists(os.path.join(os.fspath(project_path), '.git'))
 
 
-def get_git_branch(project_path: Path) -> Optional[str]:
+def get_git_branch(project_path: Union[str, Path]) -> Optional[str]:
     """Ottiene branch git corrente"""
     try:
-        head_file = project_path / '.git' / 'HEAD'
-        if head_file.exists():
-            content = head_file.read_text().strip()
-            if content.startswith('ref: refs/heads/'):
-                return content.replace('ref: refs/heads/', '')
-    except:
-        pass
+        with open(os.path.join(os.fspath(project_path), '.git', 'HEAD'), 'rb') as f:
+            data = f.read(256)
+    except OSError:
+        return None
+    
+    # HEAD è breve: prefisso e nome branch si ricavano dai byte grezzi
+    if data.startswith(b'ref: refs/heads/'):
+        try:
+            return data[16:].rstrip().decode('utf-8')
+        except UnicodeDecodeError:
+            return None
     return None
 
 
 def validate_project_path(path: str) -> Path:
     """Valida e normalizza path progetto"""
-    project_path = normalize_path(path)
+    project_path = Path(path).expanduser()
     
-    if not project_path.exists():
+    # Una sola stat per esistenza e tipo; resolve() solo se il path è valido
+    try:
+        st = os.stat(project_path)
+    except (FileNotFoundError, NotADirectoryError):
         raise ValueError(f"Path non esiste: {project_path}")
     
-    if not project_path.is_dir():
+    if not stat.S_ISDIR(st.st_mode):
         raise ValueError(f"Path non è una directory: {project_path}")
     
-    return project_path
\ No newline at end of file
+    return project_path.resolve()
\ No newline at end of file
@@ -3,26 +3,432 @@ Advanced project detection and path discovery system
 """
 
 import os
+import re
+import bisect
+import contextlib
+import stat
 import fnmatch
+import functools
+import heapq
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union, Any
 from datetime import datetime
 import json
 from rich.console import Console
 from rich.progress import Progress, track
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 
+# Directories that are never project roots and are not descended into
+_SCAN_SKIP_DIRS = frozenset({
+    'node_modules', 'vendor', '__pycache__', '.git',
+    '.vscode', '.idea', 'dist', 'build', 'target',
+    'bin', 'obj', '.next', '.nuxt'
+})
+
+# Upper bound on search paths scanned concurrently
+_SCAN_WORKERS = 8
+
+# Format version of the on-disk scan cache; older files are ignored
+_SCAN_CACHE_VERSION = 1
+
+# Size estimation stops counting once a project reaches this many bytes
+_SIZE_CAP_BYTES = 1024 ** 3
+
+# Dependency/build directories never descended into when walking a project
+_SKIP_DIRS = frozenset({
+    '.git', 'node_modules', 'vendor', '__pycache__', 'dist', 'build',
+    'target', '.next', '.nuxt'
+})
+
+def _iter_files(path: Path, exclude_dirs: frozenset = _SKIP_DIRS) -> Iterator[os.DirEntry]:
+    """Recursively yield file entries under path using os.scandir
+    
+    Excluded directories are pruned before descending, symlinked directories
+    are not followed and unreadable directories are skipped.
+    
+    Args:
+        path: Root directory
+        exclude_dirs: Directory names to skip
+        
+    Returns:
+        Iterator of DirEntry objects for files
+    """
+    try:
+        with os.scandir(path) as entries:
+            subdirs = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in exclude_dirs:
+                            subdirs.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+                except OSError:
+                    continue
+    except OSError:
+        return
+    
+    for subdir in subdirs:
+        yield from _iter_files(subdir, exclude_dirs)
+
+# Directory-fd-relative walking (scandir on an fd, openat) is available on
+# Linux and most Unixes; each stat then resolves one name, not a full path
+_FD_WALK = os.scandir in os.supports_fd and os.open in os.supports_dir_fd
+_DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0)
+
+def _iter_files_at(dir_fd: int, exclude_dirs: frozenset) -> Iterator[os.DirEntry]:
+    """Recursively yield file entries below an open directory descriptor
+    
+    Same traversal order and pruning as _iter_files. Yielded entries must be
+    used before the generator is resumed, while their directory is open.
+    
+    Args:
+        dir_fd: Open directory file descriptor (not closed here)
+        exclude_dirs: Directory names to skip
+        
+    Returns:
+        Iterator of DirEntry objects for files
+    """
+    try:
+        with os.scandir(dir_fd) as entries:
+            subdirs = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in exclude_dirs:
+                            subdirs.append(entry.name)
+                    elif entry.is_file():
+                        yield entry
+                except OSError:
+                    continue
+    except OSError:
+        return
+    
+    for name in subdirs:
+        try:
+            fd = os.open(name, _DIR_OPEN_FLAGS | getattr(os, 'O_NOFOLLOW', 0), dir_fd=dir_fd)
+        except OSError:
+            continue
+        try:
+            yield from _iter_files_at(fd, exclude_dirs)
+        finally:
+            os.close(fd)
+
+def _walk_files(path: Path, exclude_dirs: frozenset = _SKIP_DIRS) -> Iterator[os.DirEntry]:
+    """Yield file entries under path, walking by directory fd where possible
+    
+    Args:
+        path: Root directory
+        exclude_dirs: Directory names to skip
+        
+    Returns:
+        Iterator of DirEntry objects for files
+    """
+    if not _FD_WALK:
+        yield from _iter_files(path, exclude_dirs)
+        return
+    
+    try:
+        fd = os.open(path, _DIR_OPEN_FLAGS)
+    except OSError:
+        return
+    try:
+        yield from _iter_files_at(fd, exclude_dirs)
+    finally:
+        os.close(fd)
+
+@functools.lru_cache(maxsize=64)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Callable[[str], Any]:
+    """Compile fnmatch patterns into a single alternation regex
+    
+    Matching is case-insensitive on Windows only, as with fnmatch/glob.
+    
+    Args:
+        patterns: fnmatch patterns
+        
+    Returns:
+        Match function testing a file name against every pattern at once
+    """
+    flags = re.IGNORECASE if os.name == 'nt' else 0
+    return re.compile('|'.join(fnmatch.translate(p) for p in patterns), flags).match
+
+@functools.lru_cache(maxsize=16)
+def _compile_keywords(keywords: Tuple[str, ...]) -> Callable[[str], Set[str]]:
+    """Compile keywords into a single-pass multi-keyword finder
+    
+    One regex scan reports the longest keyword starting at each position;
+    keywords contained in a reported one are added afterwards, so the result
+    equals testing every keyword with `in` separately.
+    
+    Args:
+        keywords: Lowercase keywords
+        
+    Returns:
+        Function mapping lowercased text to the set of keywords it contains
+    """
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    finditer = re.compile('(?=(%s))' % '|'.join(map(re.escape, ordered))).finditer
+    implied = {
+        keyword: {other for other in ordered if other in keyword}
+        for keyword in ordered
+    }
+    
+    def find(text: str) -> Set[str]:
+        found = set()
+        for match in finditer(text):
+            keyword = match.group(1)
+            if keyword not in found:
+                found |= implied[keyword]
+        return found
+    
+    return find
+
+# Configuration files whose contents are searched for keywords
+_CONFIG_FILES = (
+    'package.json', 'composer.json', 'requirements.txt',
+    'Cargo.toml', 'go.mod', 'pom.xml', 'build.gradle'
+)
+
+def _read_config(path: str) -> str:
+    """Read a config file with raw os calls and return it lowercased
+    
+    Args:
+        path: File path
+        
+    Returns:
+        Lowercased file contents (undecodable bytes are dropped)
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b''.join(chunks).decode('utf-8', errors='ignore').lower()
+
+class _Indicators(NamedTuple):
+    """One project type's indicator configuration, split up for fast checks
+    
+    Optional fields are None when the type does not use that check; an empty
+    tuple still means "check and find nothing", as in the source dict.
+    """
+    has_files: bool
+    files: Tuple[str, ...]
+    glob_files: Tuple[str, ...]
+    directories: Tuple[str, ...]
+    patterns: Optional[Tuple[str, ...]]
+    content_check: Optional[Tuple[str, ...]]
+    exclude_indicators: Tuple[str, ...]
+
+def _compile_indicators(indicators: Dict[str, Any]) -> _Indicators:
+    """Convert an indicator dict from ProjectDetector.project_indicators
+    
+    Args:
+        indicators: Indicator configuration
+        
+    Returns:
+        Precompiled indicators
+    """
+    files = indicators.get('files', ())
+    patterns = indicators.get('patterns')
+    content_check = indicators.get('content_check')
+    return _Indicators(
+        has_files='files' in indicators,
+        files=tuple(f for f in files if '*' not in f),
+        glob_files=tuple(f for f in files if '*' in f),
+        directories=tuple(indicators.get('directories', ())),
+        patterns=tuple(patterns) if patterns is not None else None,
+        content_check=tuple(k.lower() for k in content_check) if content_check is not None else None,
+        exclude_indicators=tuple(k.lower() for k in indicators.get('exclude_indicators', ()))
+    )
+
+class _DirFingerprint:
+    """Filesystem facts about one candidate directory
+    
+    The top-level listing is read once; the recursive file walk and the
+    config file contents are gathered lazily and shared by every indicator
+    check, so testing all project types costs at most one walk of the tree.
+    """
+    
+    def __init__(self, path: Path, names: Optional[Set[str]] = None):
+        self.path = path
+        if names is None:
+            try:
+                with os.scandir(path) as entries:
+                    names = {entry.name for entry in entries}
+            except OSError:
+                names = set()
+        self.names = names
+        self._nested = {}
+        self._walk = None
+        self._walked_names = []
+        self._content_index = None
+        self._found_keywords = {}
+    
+    def exists(self, relative: str) -> bool:
+        """Check if a file or directory exists relative to the root"""
+        if '/' not in relative:
+            return relative in self.names
+        found = self._nested.get(relative)
+        if found is None:
+            found = self._nested[relative] = (self.path / relative).exists()
+        return found
+    
+    def has_top_level_match(self, pattern: str) -> bool:
+        """Check if a top-level entry matches a glob pattern"""
+        return any(fnmatch.fnmatch(name, pattern) for name in self.names)
+    
+    def has_pattern_file(self, patterns: List[str]) -> bool:
+        """Check if any file in the tree matches one of the patterns
+        
+        Names already walked are checked first; the walk only continues
+        (and stops again at the first match) when they are not enough.
+        """
+        match = _compile_patterns(tuple(patterns))
+        for name in self._walked_names:
+            if match(name):
+                return True
+        
+        if self._walk is None:
+            self._walk = _iter_files(self.path)
+        for entry in self._walk:
+            name = entry.name
+            self._walked_names.append(name)
+            if match(name):
+                return True
+        return False
+    
+    def content_index(self) -> Dict[str, str]:
+        """Lowercased contents of the config files present in the root
+        
+        Each file is read once, on first use, and keyed by file name.
+        """
+        if self._content_index is None:
+            self._content_index = {}
+            root = str(self.path)
+            for config_file in _CONFIG_FILES:
+                if config_file in self.names:
+                    try:
+                        self._content_index[config_file] = _read_config(os.path.join(root, config_file))
+                    except OSError:
+                        continue
+        return self._content_index
+    
+    def found_keywords(self, keywords: Tuple[str, ...]) -> Set[str]:
+        """Keywords (lowercase) occurring in any config file, scanned once"""
+        found = self._found_keywords.get(keywords)
+        if found is None:
+            find = _compile_keywords(keywords)
+            found = set()
+            for content in self.content_index().values():
+                found |= find(content)
+            self._found_keywords[keywords] = found
+        return found
+
+class ProjectIndex:
+    """Inverted indexes over a project list, for repeated filtering
+    
+    Build once from scan_for_projects results and pass it to
+    ProjectDetector.filter_projects in place of the list; each query is then
+    a few set intersections instead of a scan over every project.
+    """
+    
+    def __init__(self, projects: List[Dict[str, Any]]):
+        """Index a list of projects
+        
+        Args:
+            projects: Projects as returned by scan_for_projects
+        """
+        self.projects = list(projects)
+        self.by_language: Dict[str, Set[int]] = {}
+        self.by_framework: Dict[str, Set[int]] = {}
+        self.by_has_git: Dict[Any, Set[int]] = {}
+        self.by_has_context_engineering: Dict[Any, Set[int]] = {}
+        
+        for index, project in enumerate(self.projects):
+            language = project.get('language', '')
+            if isinstance(language, str):
+                self.by_language.setdefault(language.lower(), set()).add(index)
+            framework = project.get('framework', '')
+            if isinstance(framework, str):
+                self.by_framework.setdefault(framework.lower(), set()).add(index)
+            self.by_has_git.setdefault(project.get('has_git', False), set()).add(index)
+            self.by_has_context_engineering.setdefault(
+                project.get('has_context_engineering', False), set()
+            ).add(index)
+        
+        self.by_confidence: List[Tuple[float, int]] = sorted(
+            (project.get('confidence', 0.0), index)
+            for index, project in enumerate(self.projects)
+        )
+        self._confidences = [confidence for confidence, _ in self.by_confidence]
+    
+    def filter(self,
+               language: Optional[str] = None,
+               framework: Optional[str] = None,
+               has_git: Optional[bool] = None,
+               has_context_engineering: Optional[bool] = None,
+               min_confidence: float = 0.0) -> List[Dict[str, Any]]:
+        """Filter the indexed projects, keeping their original order
+        
+        Args:
+            language: Filter by programming language
+            framework: Filter by framework
+            has_git: Filter by Git presence
+            has_context_engineering: Filter by CLAUDE.md presence
+            min_confidence: Minimum confidence score
+            
+        Returns:
+            Filtered list of projects
+        """
+        selections = []
+        if language:
+            selections.append(self.by_language.get(language.lower(), set()))
+        if framework:
+            selections.append(self.by_framework.get(framework.lower(), set()))
+        if has_git is not None:
+            selections.append(self.by_has_git.get(has_git, set()))
+        if has_context_engineering is not None:
+            selections.append(self.by_has_context_engineering.get(has_context_engineering, set()))
+        
+        start = bisect.bisect_left(self._confidences, min_confidence)
+        if start:
+            selections.append({index for _, index in self.by_confidence[start:]})
+        
+        if not selections:
+            return list(self.projects)
+        
+        # Intersect starting from the smallest selection
+        selections.sort(key=len)
+        selected = set(selections[0])
+        for selection in selections[1:]:
+            selected &= selection
+        return [self.projects[index] for index in sorted(selected)]
+
 class ProjectDetector:
     """Advanced project detection and path discovery"""
     
-    def __init__(self, preferences_manager=None):
+    def __init__(self, preferences_manager=None, cache_path: Optional[Path] = None):
         """Initialize project detector
         
         Args:
             preferences_manager: PreferencesManager instance for user paths
+            cache_path: Scan cache file used by scan_for_projects(use_cache=True)
         """
         self.preferences_manager = preferences_manager
+        self.cache_path = cache_path or Path.home() / '.context-engineer' / 'project-scan.json'
         
         # Default search paths
         self.default_paths = [
@@ -135,6 +541,50 @@ class ProjectDetector:
                 'patterns': ['*.html', '*.css', '*.js']
             }
         }
+        
+        # stat() results by path string, kept only while scan_for_projects runs
+        self._stat_cache = None
+        
+        # Per-directory scan results from the previous run and the current
+        # one, set only while a cached scan runs
+        self._scan_cache = None
+        self._scan_cache_new = None
+        
+        # Indicators are precompiled once; changes to project_indicators
+        # made after construction are not picked up
+        self._indicators: List[Tuple[str, _Indicators]] = [
+            (project_type, _compile_indicators(indicators))
+            for project_type, indicators in self.project_indicators.items()
+        ]
+        
+        # Compile every type's patterns up front
+        for _, indicators in self._indicators:
+            if indicators.patterns is not None:
+                _compile_patterns(indicators.patterns)
+        
+        # Inverted index of required files: a type can only match a directory
+        # containing at least one of its files, so the top-level listing
+        # narrows the types worth checking
+        self._file_to_types: Dict[str, Set[str]] = {}
+        self._always_candidates: Set[str] = set()
+        glob_index: Dict[str, Set[str]] = {}
+        for project_type, indicators in self._indicators:
+            if not indicators.has_files or any('/' in f for f in indicators.files):
+                self._always_candidates.add(project_type)
+                continue
+            for file_name in indicators.files:
+                self._file_to_types.setdefault(file_name, set()).add(project_type)
+            for file_pattern in indicators.glob_files:
+                glob_index.setdefault(file_pattern, set()).add(project_type)
+        self._glob_files: List[Tuple[str, Set[str]]] = list(glob_index.items())
+        
+        # Every keyword any type looks for, searched in one pass per directory
+        keywords = set()
+        for _, indicators in self._indicators:
+            keywords.update(indicators.content_check or ())
+            keywords.update(indicators.exclude_indicators)
+        self._content_keywords = tuple(sorted(keywords))
+        _compile_keywords(self._content_keywords)
     
     def get_search_paths(self) -> List[Path]:
         """Get list of paths to search for projects
@@ -160,17 +610,18 @@ class ProjectDetector:
                 else:
                     path = Path(path_str)
                 
-                if path.exists() and path.is_dir():
+                if os.path.isdir(path):
                     resolved_paths.append(path)
             except Exception:
                 continue
         
-        # Remove duplicates while preserving order
+        # Remove duplicates (including symlinked aliases) while preserving order
         seen = set()
         unique_paths = []
         for path in resolved_paths:
-            if path not in seen:
-                seen.add(path)
+            canonical = os.path.realpath(path)
+            if canonical not in seen:
+                seen.add(canonical)
                 unique_paths.append(path)
         
         return unique_paths
@@ -178,231 +629,388 @@ class ProjectDetector:
     def scan_for_projects(self, 
                          max_depth: int = 3,
                          include_hidden: bool = False,
-                         progress_callback: Optional[callable] = None) -> List[Dict[str, Any]]:
+                         progress_callback: Optional[callable] = None,
+                         compute_size: bool = False,
+                         use_cache: bool = False,
+                         top_n: Optional[int] = None,
+                         quiet: bool = False) -> List[Dict[str, Any]]:
         """Scan for projects in configured paths
         
         Args:
             max_depth: Maximum directory depth to scan
             include_hidden: Whether to include hidden directories
             progress_callback: Optional callback for progress updates
+            compute_size: Walk each project to fill in 'size'; when False
+                'size' is None and can be filled later with get_project_size
+            use_cache: Reuse the previous scan's results for directories whose
+                mtime, inode and device are unchanged; a directory's mtime only
+                changes when its own entries do, so edits deeper in an
+                unchanged directory are not picked up
+            top_n: Return only the most recently modified projects
+            quiet: Do not print status messages or the progress bar
             
         Returns:
             List of detected projects
         """
         projects = []
         search_paths = self.get_search_paths()
+        self._stat_cache = {}
+        if use_cache:
+            self._scan_cache = self._load_scan_cache()
+            self._scan_cache_new = {}
         
-        console.print(f"🔍 Scansione progetti in {len(search_paths)} percorsi...", style="blue")
+        if not quiet:
+            console.print(f"🔍 Scansione progetti in {len(search_paths)} percorsi...", style="blue")
+            if search_paths:
+                # One render for the whole list instead of one per path
+                console.print(
+                    "\n".join(f"  📁 Scansione: {search_path}" for search_path in search_paths),
+                    style="dim"
+                )
         
-        with Progress() as progress:
-            task = progress.add_task("Scansione in corso...", total=len(search_paths))
+        # Search paths are independent subtrees and the scan is I/O-bound
+        # (syscalls release the GIL), so they are walked concurrently. The
+        # progress bar is drawn by rich's own refresh thread; updates only
+        # record state
+        results = {}
+        found = 0
+        with (contextlib.nullcontext() if quiet else Progress()) as progress:
+            if progress is not None:
+                task = progress.add_task("Scansione in corso...", total=len(search_paths))
             
-            for search_path in search_paths:
-                console.print(f"  📁 Scansione: {search_path}", style="dim")
-                
-                try:
-                    path_projects = self._scan_path(
-                        search_path, 
+            with ThreadPoolExecutor(max_workers=max(1, min(_SCAN_WORKERS, len(search_paths)))) as executor:
+                futures = {}
+                for search_path in search_paths:
+                    future = executor.submit(
+                        self._scan_path,
+                        search_path,
                         max_depth=max_depth,
-                        include_hidden=include_hidden
+                        include_hidden=include_hidden,
+                        compute_size=compute_size
                     )
-                    projects.extend(path_projects)
-                except Exception as e:
-                    console.print(f"  ⚠️ Errore scansione {search_path}: {str(e)}", style="yellow")
+                    futures[future] = search_path
                 
-                progress.update(task, advance=1)
-                
-                if progress_callback:
-                    progress_callback(len(projects))
+                for future in as_completed(futures):
+                    search_path = futures[future]
+                    try:
+                        results[search_path] = future.result()
+                        found += len(results[search_path])
+                    except Exception as e:
+                        if not quiet:
+                            console.print(f"  ⚠️ Errore scansione {search_path}: {str(e)}", style="yellow")
+                    
+                    if progress is not None:
+                        progress.update(task, advance=1)
+                    
+                    if progress_callback:
+                        progress_callback(found)
+        
+        self._stat_cache = None
+        if use_cache:
+            self._save_scan_cache(self._scan_cache_new)
+            self._scan_cache = self._scan_cache_new = None
+        
+        # Merge in search path order so the output does not depend on timing
+        for search_path in search_paths:
+            projects.extend(results.get(search_path, []))
         
         # Remove duplicates and sort by last modified
         unique_projects = self._deduplicate_projects(projects)
-        sorted_projects = sorted(
-            unique_projects, 
-            key=lambda x: x.get('last_modified', ''), 
-            reverse=True
-        )
+        if top_n is not None:
+            # Same order as sorted(...)[:top_n] without sorting everything
+            sorted_projects = heapq.nlargest(
+                top_n,
+                unique_projects,
+                key=lambda x: x.get('last_modified', '')
+            )
+        else:
+            sorted_projects = sorted(
+                unique_projects, 
+                key=lambda x: x.get('last_modified', ''), 
+                reverse=True
+            )
         
-        console.print(f"✅ Trovati {len(sorted_projects)} progetti", style="green")
+        if not quiet:
+            console.print(f"✅ Trovati {len(sorted_projects)} progetti", style="green")
         
         return sorted_projects
     
+    def _candidate_types(self, fingerprint: _DirFingerprint) -> Set[str]:
+        """Project types whose required files are present in the directory
+        
+        Args:
+            fingerprint: Facts about the project directory
+            
+        Returns:
+            Set of project types worth checking in full
+        """
+        candidates = set(self._always_candidates)
+        file_to_types = self._file_to_types
+        for name in fingerprint.names:
+            types = file_to_types.get(name)
+            if types:
+                candidates |= types
+        for file_pattern, types in self._glob_files:
+            if not types <= candidates and fingerprint.has_top_level_match(file_pattern):
+                candidates |= types
+        return candidates
+    
+    def _cached_stat(self, path: str) -> Optional[os.stat_result]:
+        """stat() a path, reusing the result for the rest of the current scan
+        
+        Args:
+            path: Path string
+            
+        Returns:
+            stat result, or None if the path cannot be stat'ed
+        """
+        cache = self._stat_cache
+        if cache is not None and path in cache:
+            return cache[path]
+        try:
+            result = os.stat(path)
+        except OSError:
+            result = None
+        if cache is not None:
+            cache[path] = result
+        return result
+    
+    def _load_scan_cache(self) -> Dict[str, list]:
+        """Load per-directory results of the previous cached scan
+        
+        Returns:
+            Mapping of directory path to [mtime_ns, ino, dev, subdirs, project]
+        """
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != _SCAN_CACHE_VERSION:
+            return {}
+        return data.get('directories') or {}
+    
+    def _save_scan_cache(self, directories: Dict[str, list]):
+        """Persist per-directory scan results, replacing the file atomically
+        
+        Args:
+            directories: Entries gathered by the scan that just finished
+        """
+        tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': _SCAN_CACHE_VERSION, 'directories': directories}, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+    
     def _scan_path(self, 
                    path: Path, 
                    max_depth: int,
                    include_hidden: bool,
-                   current_depth: int = 0) -> List[Dict[str, Any]]:
-        """Recursively scan a path for projects
+                   compute_size: bool = False) -> List[Dict[str, Any]]:
+        """Scan a directory tree for projects
+        
+        Directories are visited with an explicit stack rather than recursion,
+        in the same pre-order as a recursive walk. Symlinked directories are
+        followed; a directory already visited at the same or a shallower
+        depth (as in a symlink cycle) is not scanned again.
         
         Args:
             path: Path to scan
             max_depth: Maximum scan depth
             include_hidden: Include hidden directories
-            current_depth: Current recursion depth
+            compute_size: Estimate the size of each detected project
             
         Returns:
             List of detected projects in this path
         """
         projects = []
+        pending = deque([(str(path), 0)])
+        cache = self._scan_cache
+        cache_new = self._scan_cache_new
+        # (st_dev, st_ino) of visited directories -> shallowest depth seen
+        visited = {}
         
-        if current_depth > max_depth:
-            return projects
-        
-        try:
-            # Check if current directory is a project
-            project_info = self.detect_project_type(path)
-            if project_info:
-                project_info['path'] = str(path)
-                project_info['last_modified'] = self._get_last_modified(path)
-                project_info['size'] = self._estimate_project_size(path)
-                projects.append(project_info)
-        except Exception:
-            pass
-        
-        # Scan subdirectories
-        try:
-            for item in path.iterdir():
-                if not item.is_dir():
-                    continue
-                
-                # Skip hidden directories unless explicitly included
-                if item.name.startswith('.') and not include_hidden:
+        while pending:
+            current, depth = pending.pop()
+            
+            current_stat = self._cached_stat(current)
+            if current_stat is not None:
+                dir_id = (current_stat.st_dev, current_stat.st_ino)
+                if visited.get(dir_id, depth + 1) <= depth:
                     continue
-                
-                # Skip common non-project directories
-                if item.name.lower() in {
-                    'node_modules', 'vendor', '__pycache__', '.git', 
-                    '.vscode', '.idea', 'dist', 'build', 'target',
-                    'bin', 'obj', '.next', '.nuxt'
-                }:
+                visited[dir_id] = depth
+            
+            # Reuse the previous scan's listing and detection when the
+            # directory is unchanged (stat is taken before any listing)
+            entry = None
+            if cache is not None and current_stat is not None:
+                key = [current_stat.st_mtime_ns, current_stat.st_ino, current_stat.st_dev]
+                entry = cache.get(current)
+                if entry is None or entry[:3] != key:
+                    entry = None
+            
+            if entry is not None:
+                names = None
+                subdir_names, detected = entry[3], entry[4]
+            else:
+                # One listing serves both detection and the subdirectory scan
+                # (DirEntry types come from readdir; only symlinks are stat'ed)
+                names = set()
+                subdir_names = []
+                try:
+                    with os.scandir(current) as entries:
+                        for dir_entry in entries:
+                            name = dir_entry.name
+                            names.add(name)
+                            
+                            if not dir_entry.is_dir():
+                                continue
+                            
+                            # Skip common non-project directories
+                            if name.lower() in _SCAN_SKIP_DIRS:
+                                continue
+                            
+                            subdir_names.append(name)
+                except OSError:
                     continue
                 
-                # Recursive scan
-                subprojects = self._scan_path(
-                    item, max_depth, include_hidden, current_depth + 1
-                )
-                projects.extend(subprojects)
+                try:
+                    # Check if current directory is a project
+                    detected = self.detect_project_type(Path(current), names)
+                except Exception:
+                    detected = None
                 
-        except PermissionError:
-            pass
-        except Exception:
-            pass
+                if cache is not None and current_stat is not None:
+                    entry = key + [subdir_names, detected]
+            
+            if entry is not None and cache_new is not None:
+                cache_new[current] = entry
+            
+            if detected:
+                try:
+                    project_info = dict(detected)
+                    project_info['path'] = current
+                    project_info['last_modified'] = self._get_last_modified(Path(current), names)
+                    project_info['size'] = (
+                        self._estimate_project_size(Path(current)) if compute_size else None
+                    )
+                    projects.append(project_info)
+                except Exception:
+                    pass
+            
+            # Children of the deepest level would never be examined
+            if depth >= max_depth:
+                continue
+            
+            # Pushed in reverse so they are popped in listing order
+            for name in reversed(subdir_names):
+                # Skip hidden directories unless explicitly included
+                if name.startswith('.') and not include_hidden:
+                    continue
+                pending.append((os.path.join(current, name), depth + 1))
         
         return projects
     
-    def detect_project_type(self, path: Path) -> Optional[Dict[str, Any]]:
+    def detect_project_type(self, path: Path, names: Optional[Set[str]] = None) -> Optional[Dict[str, Any]]:
         """Detect project type and gather information
         
         Args:
             path: Project directory path
+            names: Top-level entry names, when the caller has already listed
+                the directory
             
         Returns:
             Project information dictionary or None
         """
-        if not path.is_dir():
+        if names is None:
+            path_stat = self._cached_stat(str(path))
+            if path_stat is None or not stat.S_ISDIR(path_stat.st_mode):
+                return None
+        
+        # Gather the directory's facts once and test every type against them
+        fingerprint = _DirFingerprint(path, names)
+        candidates = self._candidate_types(fingerprint)
+        if not candidates:
             return None
         
-        # Check against each project type
-        for project_type, indicators in self.project_indicators.items():
-            if self._matches_indicators(path, indicators):
+        # Check against each candidate type, in declaration order
+        for project_type, indicators in self._indicators:
+            if project_type not in candidates:
+                continue
+            if self._matches_indicators(fingerprint, indicators):
                 return {
                     'name': path.name,
                     'type': project_type,
                     'language': self._extract_language(project_type),
                     'framework': self._extract_framework(project_type),
-                    'confidence': self._calculate_confidence(path, indicators),
+                    'confidence': self._calculate_confidence(fingerprint, indicators),
                     'description': self._generate_description(path, project_type),
-                    'has_git': (path / '.git').exists(),
-                    'has_context_engineering': (path / 'CLAUDE.md').exists()
+                    'has_git': fingerprint.exists('.git'),
+                    'has_context_engineering': fingerprint.exists('CLAUDE.md')
                 }
         
         return None
     
-    def _matches_indicators(self, path: Path, indicators: Dict[str, Any]) -> bool:
-        """Check if path matches project indicators
+    def _matches_indicators(self, fingerprint: _DirFingerprint, indicators: _Indicators) -> bool:
+        """Check if a directory matches project indicators
         
         Args:
-            path: Project path
-            indicators: Indicator configuration
+            fingerprint: Facts about the project directory
+            indicators: Precompiled indicator configuration
             
         Returns:
-            True if path matches indicators
+            True if the directory matches indicators
         """
-        # Check required files
-        if 'files' in indicators:
-            file_matches = 0
-            for file_pattern in indicators['files']:
-                if '*' in file_pattern:
-                    matches = list(path.glob(file_pattern))
-                    if matches:
-                        file_matches += 1
-                else:
-                    if (path / file_pattern).exists():
-                        file_matches += 1
-            
-            # Require at least one file match
-            if file_matches == 0:
+        # Check required files (at least one must be present)
+        if indicators.has_files:
+            if not (any(fingerprint.exists(f) for f in indicators.files) or
+                    any(fingerprint.has_top_level_match(p) for p in indicators.glob_files)):
                 return False
         
         # Check required directories
-        if 'directories' in indicators:
-            for dir_name in indicators['directories']:
-                if not (path / dir_name).exists():
-                    return False
+        for dir_name in indicators.directories:
+            if not fingerprint.exists(dir_name):
+                return False
         
         # Check pattern files exist
-        if 'patterns' in indicators:
-            pattern_found = False
-            for pattern in indicators['patterns']:
-                if list(path.rglob(pattern)):
-                    pattern_found = True
-                    break
-            
-            if not pattern_found:
+        if indicators.patterns is not None:
+            if not fingerprint.has_pattern_file(indicators.patterns):
                 return False
         
         # Check content for specific keywords
-        if 'content_check' in indicators:
-            content_found = self._check_content_keywords(path, indicators['content_check'])
-            if not content_found:
+        if indicators.content_check is not None:
+            if not self._check_content_keywords(fingerprint, indicators.content_check):
                 return False
         
         # Check exclusion indicators
-        if 'exclude_indicators' in indicators:
-            for exclude_keyword in indicators['exclude_indicators']:
-                if self._check_content_keywords(path, [exclude_keyword]):
-                    return False
+        if indicators.exclude_indicators:
+            if self._check_content_keywords(fingerprint, indicators.exclude_indicators):
+                return False
         
         return True
     
-    def _check_content_keywords(self, path: Path, keywords: List[str]) -> bool:
-        """Check if any file contains specific keywords
+    def _check_content_keywords(self, fingerprint: _DirFingerprint, keywords: List[str]) -> bool:
+        """Check if any config file contains specific keywords
         
         Args:
-            path: Directory path
+            fingerprint: Facts about the project directory
             keywords: Keywords to search for
             
         Returns:
             True if keywords found in files
         """
-        # Check common configuration files
-        config_files = [
-            'package.json', 'composer.json', 'requirements.txt',
-            'Cargo.toml', 'go.mod', 'pom.xml', 'build.gradle'
-        ]
+        lowered = [keyword.lower() for keyword in keywords]
+        known = self._content_keywords
+        if all(keyword in known for keyword in lowered):
+            found = fingerprint.found_keywords(known)
+            return any(keyword in found for keyword in lowered)
         
-        for config_file in config_files:
-            file_path = path / config_file
-            if file_path.exists():
-                try:
-                    content = file_path.read_text(encoding='utf-8', errors='ignore').lower()
-                    for keyword in keywords:
-                        if keyword.lower() in content:
-                            return True
-                except Exception:
-                    continue
-        
-        return False
+        # Keywords outside the indicator table: check the contents directly
+        contents = fingerprint.content_index().values()
+        return any(keyword in content for keyword in lowered for content in contents)
     
     def _extract_language(self, project_type: str) -> str:
         """Extract primary language from project type
@@ -446,44 +1054,27 @@ class ProjectDetector:
             return parts[1]
         return None
     
-    def _calculate_confidence(self, path: Path, indicators: Dict[str, Any]) -> float:
+    def _calculate_confidence(self, fingerprint: _DirFingerprint, indicators: _Indicators) -> float:
         """Calculate confidence score for project detection
         
         Args:
-            path: Project path
-            indicators: Project indicators
+            fingerprint: Facts about the project directory
+            indicators: Precompiled indicator configuration
             
         Returns:
             Confidence score (0.0 to 1.0)
         """
-        score = 0.0
-        total_checks = 0
-        
-        # File indicators
-        if 'files' in indicators:
-            for file_pattern in indicators['files']:
-                total_checks += 1
-                if '*' in file_pattern:
-                    if list(path.glob(file_pattern)):
-                        score += 1
-                else:
-                    if (path / file_pattern).exists():
-                        score += 1
-        
-        # Directory indicators
-        if 'directories' in indicators:
-            for dir_name in indicators['directories']:
-                total_checks += 1
-                if (path / dir_name).exists():
-                    score += 1
+        # File and directory indicators
+        score = sum(1 for f in indicators.files if fingerprint.exists(f))
+        score += sum(1 for p in indicators.glob_files if fingerprint.has_top_level_match(p))
+        score += sum(1 for d in indicators.directories if fingerprint.exists(d))
+        total_checks = len(indicators.files) + len(indicators.glob_files) + len(indicators.directories)
         
         # Pattern indicators
-        if 'patterns' in indicators:
+        if indicators.patterns is not None:
             total_checks += 1
-            for pattern in indicators['patterns']:
-                if list(path.rglob(pattern)):
-                    score += 1
-                    break
+            if fingerprint.has_pattern_file(indicators.patterns):
+                score += 1
         
         return score / total_checks if total_checks > 0 else 0.0
     
@@ -505,34 +1096,58 @@ class ProjectDetector:
         else:
             return f"Progetto {language.title()}"
     
-    def _get_last_modified(self, path: Path) -> str:
+    def _get_last_modified(self, path: Path, names: Optional[Set[str]] = None) -> str:
         """Get last modification time of project
         
         Args:
             path: Project path
+            names: Top-level entry names, used to skip stat() on absent files
             
         Returns:
             ISO format timestamp
         """
         try:
             # Get the most recent modification time from project files
-            latest_time = path.stat().st_mtime
+            root = str(path)
+            path_stat = self._cached_stat(root)
+            if path_stat is None:
+                raise FileNotFoundError(root)
+            latest_time = path_stat.st_mtime
             
-            # Check a few key files for more recent modifications
+            # Check a few key files for more recent modifications; one stat
+            # answers both "exists" and "when"
             check_files = ['CLAUDE.md', 'package.json', 'composer.json', 'requirements.txt']
             for filename in check_files:
-                file_path = path / filename
-                if file_path.exists():
-                    file_time = file_path.stat().st_mtime
-                    latest_time = max(latest_time, file_time)
+                if names is not None and filename not in names:
+                    continue
+                file_stat = self._cached_stat(os.path.join(root, filename))
+                if file_stat is not None:
+                    latest_time = max(latest_time, file_stat.st_mtime)
             
             return datetime.fromtimestamp(latest_time).isoformat()
         except Exception:
             return datetime.now().isoformat()
     
+    def get_project_size(self, project: Dict[str, Any]) -> Dict[str, int]:
+        """Get a project's size metrics, estimating them on first use
+        
+        Args:
+            project: Project dictionary from scan_for_projects
+            
+        Returns:
+            Size metrics dictionary
+        """
+        size = project.get('size')
+        if size is None:
+            size = project['size'] = self._estimate_project_size(Path(project['path']))
+        return size
+    
     def _estimate_project_size(self, path: Path) -> Dict[str, int]:
         """Estimate project size metrics
         
+        Counting stops once the total reaches _SIZE_CAP_BYTES; the result is
+        then a lower bound and is flagged as truncated.
+        
         Args:
             path: Project path
             
@@ -542,33 +1157,34 @@ class ProjectDetector:
         try:
             file_count = 0
             total_size = 0
+            truncated = False
             
-            # Count files and size (excluding common large directories)
-            exclude_dirs = {'.git', 'node_modules', 'vendor', '__pycache__', 'dist', 'build'}
-            
-            for item in path.rglob('*'):
-                # Skip if parent directory is in exclude list
-                if any(part in exclude_dirs for part in item.parts):
-                    continue
-                
-                if item.is_file():
-                    file_count += 1
-                    try:
-                        total_size += item.stat().st_size
-                    except Exception:
-                        pass
+            # Count files and size (excluded directories are never listed)
+            for entry in _walk_files(path):
+                file_count += 1
+                try:
+                    total_size += entry.stat().st_size
+                except OSError:
+                    pass
+                if total_size >= _SIZE_CAP_BYTES:
+                    truncated = True
+                    break
             
             return {
                 'files': file_count,
                 'size_bytes': total_size,
-                'size_mb': round(total_size / (1024 * 1024), 2)
+                'size_mb': round(total_size / (1024 * 1024), 2),
+                'truncated': truncated
             }
         except Exception:
-            return {'files': 0, 'size_bytes': 0, 'size_mb': 0}
+            return {'files': 0, 'size_bytes': 0, 'size_mb': 0, 'truncated': False}
     
     def _deduplicate_projects(self, projects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Remove duplicate projects from list
         
+        Projects are compared by canonical path, so a project reached through
+        a symlink is only listed once.
+        
         Args:
             projects: List of project dictionaries
             
@@ -580,14 +1196,15 @@ class ProjectDetector:
         
         for project in projects:
             path = project.get('path', '')
-            if path not in seen_paths:
-                seen_paths.add(path)
+            canonical = os.path.realpath(path) if path else path
+            if canonical not in seen_paths:
+                seen_paths.add(canonical)
                 unique_projects.append(project)
         
         return unique_projects
     
     def filter_projects(self, 
-                       projects: List[Dict[str, Any]],
+                       projects: Union[List[Dict[str, Any]], ProjectIndex],
                        language: Optional[str] = None,
                        framework: Optional[str] = None,
                        has_git: Optional[bool] = None,
@@ -596,7 +1213,8 @@ class ProjectDetector:
         """Filter projects by criteria
         
         Args:
-            projects: List of projects to filter
+            projects: List of projects to filter, or a ProjectIndex built from
+                it when the same list is filtered repeatedly
             language: Filter by programming language
             framework: Filter by framework
             has_git: Filter by Git presence
@@ -606,6 +1224,15 @@ class ProjectDetector:
         Returns:
             Filtered list of projects
         """
+        if isinstance(projects, ProjectIndex):
+            return projects.filter(
+                language=language,
+                framework=framework,
+                has_git=has_git,
+                has_context_engineering=has_context_engineering,
+                min_confidence=min_confidence
+            )
+        
         filtered = []
         
         for project in projects:
@@ -647,7 +1274,41 @@ class ProjectDetector:
             'total_projects': len(projects)
         }
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            self._write_export(export_data, file_path)
+        else:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, indent=2, ensure_ascii=False)
+        
+        console.print(f"✅ Lista progetti esportata in: {file_path}", style="green")
+    
+    def _write_export(self, export_data: Dict[str, Any], file_path: Path):
+        """Write an export with orjson, one project at a time
+        
+        Produces the same layout as json.dump(indent=2, ensure_ascii=False)
+        without building the whole document in memory.
         
-        console.print(f"✅ Lista progetti esportata in: {file_path}", style="green")
\ No newline at end of file
+        Args:
+            export_data: Export document
+            file_path: Export file path
+        """
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        projects = export_data['projects']
+        
+        with open(file_path, 'wb') as f:
+            if not projects:
+                f.write(orjson.dumps(export_data, option=option))
+                return
+            
+            f.write(b'{\n  "projects": [\n')
+            for index, project in enumerate(projects):
+                if index:
+                    f.write(b',\n')
+                f.write(b'    ' + orjson.dumps(project, option=option).replace(b'\n', b'\n    '))
+            f.write(b'\n  ]')
+            
+            for key, value in export_data.items():
+                if key != 'projects':
+                    f.write(b',\n  ' + orjson.dumps(key) + b': ' +
+                            orjson.dumps(value, option=option).replace(b'\n', b'\n  '))
+            f.write(b'\n}')
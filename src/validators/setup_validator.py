@@ -3,97 +3,281 @@ Validatore setup Context Engineering
 """
 
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Callable, Dict, FrozenSet, NamedTuple, Optional, Pattern, Tuple, Union, Any
+import bisect
+import copy
 import re
-
-import sys
+import threading
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from concurrent.futures import ThreadPoolExecutor
+
+# Caratteri letti per volta dai file scansionati in streaming
+_READ_CHUNK = 64 * 1024
+
+# Lunghezza di CLAUDE.md oltre la quale nessun check cambia esito: la
+# scansione può fermarsi qui se ha già trovato tutto il resto
+_CLAUDE_LENGTH_ENOUGH = 1000
+
+# Livelli di validate_full, nell'ordine in cui vengono eseguiti
+_LEVELS = ('basic', 'advanced', 'quality')
+
+# Punteggio massimo ottenibile dai livelli successivi al base
+_LEVEL_MAX_SCORE = {'advanced': 7, 'quality': 3}
+
+# Voti in ordine crescente e percentuali minime per passare al successivo
+_GRADES = ('D', 'C-', 'C', 'C+', 'B-', 'B', 'B+', 'A-', 'A', 'A+')
+_GRADE_THRESHOLDS = (50, 55, 60, 65, 70, 75, 80, 85, 90)
+
+# Risultati di validazione memorizzati per istanza
+_RESULT_CACHE_SIZE = 128
+
+# Scansioni di singoli file (CLAUDE.md, INITIAL.md) memorizzate per istanza
+_FILE_CACHE_SIZE = 256
+
+# Percorsi (relativi al progetto) il cui mtime invalida i risultati in
+# cache; la root copre l'aggiunta o rimozione dei file di primo livello
+_CACHE_WATCHED = (
+    'CLAUDE.md',
+    'INITIAL.md',
+    '.claude',
+    os.path.join('.claude', 'examples'),
+    '.context-engineer'
+)
+
+# Nomi cercati nella root del progetto, in forma normcase come le chiavi
+# restituite da _scan_root
+_README_FILES = frozenset(map(os.path.normcase, ('README.md', 'readme.md', 'README.txt')))
+_TEST_DIRS = frozenset(map(os.path.normcase, ('test', 'tests', '__tests__', 'spec')))
+_CONFIG_FILES = frozenset(map(os.path.normcase, (
+    'package.json', 'composer.json', 'requirements.txt',
+    'tsconfig.json', 'webpack.config.js', 'vite.config.js'
+)))
+
+
+class _ClaudeContext(NamedTuple):
+    """Esito della scansione di CLAUDE.md, condiviso dai check
+    
+    length è esatta fino a _CLAUDE_LENGTH_ENOUGH; oltre può fermarsi
+    prima della fine del file.
+    """
+    exists: bool
+    length: int
+    matched: FrozenSet[Union[Pattern, tuple]]
+    found: FrozenSet[str]
+
+
+def _fuse_patterns(patterns: Tuple[Pattern, ...]) -> Pattern:
+    """Fonde i pattern in un'unica regex
+    
+    Ogni alternativa è un lookahead con nome, così una sola scansione del
+    testo segnala quali pattern compaiono senza consumare caratteri.
+    """
+    return re.compile(
+        '(?=' + '|'.join(
+            f'(?P<p{index}>{pattern.pattern})'
+            for index, pattern in enumerate(patterns)
+        ) + ')',
+        re.IGNORECASE
+    )
+
 
-from utils import read_file, calculate_file_stats
+def _needle_tables(needles: Tuple[str, ...]) -> Tuple[Pattern, Dict[str, FrozenSet[str]]]:
+    """Regex che trova tutte le sottostringhe in una sola passata, dalla più lunga
+    
+    Restituisce anche, per ogni sottostringa, quelle che contiene: se una
+    viene trovata, sono presenti anch'esse.
+    """
+    ordered = sorted(needles, key=len, reverse=True)
+    needle_re = re.compile('(?=(%s))' % '|'.join(map(re.escape, ordered)))
+    implied = {
+        needle: frozenset(other for other in ordered if other in needle)
+        for needle in ordered
+    }
+    return needle_re, implied
 
 
 class SetupValidator:
     """Valida configurazione Context Engineering"""
     
-    def __init__(self):
-        self.required_sections = [
-            'Descrizione Progetto',
-            'Regole Context Engineering',
-            'Best Practices',
-            'Workflow'
-        ]
-        
-        self.claude_md_checks = [
-            self._check_file_exists,
-            self._check_file_length,
-            self._check_required_sections,
-            self._check_project_info,
-            self._check_setup_instructions,
-            self._check_best_practices,
-            self._check_workflow_defined
-        ]
+    # Tabelle dei check, costruite una sola volta e condivise dalle istanze
+    REQUIRED_SECTIONS = (
+        'Descrizione Progetto',
+        'Regole Context Engineering',
+        'Best Practices',
+        'Workflow'
+    )
+    _sections_lower = tuple(section.lower() for section in REQUIRED_SECTIONS)
+    
+    # Sezioni di INITIAL.md, già minuscole come il testo in cui si cercano
+    _initial_sections = ('descrizione', 'obiettivi', 'implementazione', 'criteri')
+    _initial_overlap = max(len(section) for section in _initial_sections) - 1
+    
+    # Criteri dei check su CLAUDE.md: una tupla di parole chiave è
+    # soddisfatta se una di esse compare nel testo minuscolo; restano
+    # regex compilate solo i pattern che ne hanno davvero bisogno
+    _project_info_groups = (
+        re.compile(r'(tipo.*progetto|project.*type)', re.IGNORECASE),
+        ('framework', 'tecnologie'),
+        ('linguaggi', 'languages'),
+        ('descrizione', 'description')
+    )
+    _setup_groups = (
+        ('setup', 'installazione', 'installation'),
+        ('comando', 'command', 'run'),
+        ('ambiente', 'environment'),
+        ('dipendenze', 'dependencies')
+    )
+    _workflow_groups = (
+        re.compile(r'(workflow|flusso.*lavoro)', re.IGNORECASE),
+        ('step', 'passi', 'processo'),
+        ('1.', '2.', '3.'),  # Numerazione
+        ('prima', 'poi', 'dopo', 'infine')
+    )
+    _claude_groups = _project_info_groups + _setup_groups + _workflow_groups
+    _claude_res = tuple(group for group in _claude_groups if not isinstance(group, tuple))
+    _claude_keywords = tuple(group for group in _claude_groups if isinstance(group, tuple))
+    _fused_re = _fuse_patterns(_claude_res)
+    
+    # Sottostringhe cercate nel testo minuscolo di CLAUDE.md: sezioni,
+    # best practices e parole chiave dei check
+    _needles = tuple(dict.fromkeys(_sections_lower + (
+        'best practices', 'buone pratiche', 'convenzioni', 'conventions'
+    ) + tuple(keyword for group in _claude_keywords for keyword in group)))
+    _needle_re, _needle_implied = _needle_tables(_needles)
+    
+    def __init__(self, parallel: bool = True):
+        # Con parallel i livelli di validate_full indipendenti tra loro
+        # vengono eseguiti in thread separati, sovrapponendo l'I/O
+        self._parallel = parallel
+        self._executor = None
+        
+        self._result_cache: Dict[tuple, Dict[str, Any]] = {}
+        self._file_cache: Dict[tuple, Any] = {}
+        self._file_cache_lock = threading.Lock()
     
     def validate_setup(self, project_path: Path) -> Dict[str, Any]:
         """Valida setup basic Context Engineering"""
+        return self._cached_result(
+            'setup', project_path,
+            lambda: self._validate_setup(project_path, *self._prepare(project_path))
+        )
+    
+    def _prepare(self, project_path: Path) -> Tuple[Dict[str, os.DirEntry], _ClaudeContext]:
+        """Elenca la root e legge CLAUDE.md una sola volta per tutti i livelli"""
+        entries = self._scan_root(project_path)
+        return entries, self._claude_context(project_path, entries)
+    
+    def _validate_setup(self, project_path: Path, entries: Dict[str, os.DirEntry],
+                        ctx: _ClaudeContext) -> Dict[str, Any]:
+        """Validazione base sull'elenco già letto della root del progetto"""
         score = 0
         max_score = 10
-        errors = []
-        warnings = []
+        # Dizionari usati come insiemi ordinati: lo stesso messaggio
+        # segnalato da più check compare una sola volta
+        errors: Dict[str, None] = {}
+        warnings: Dict[str, None] = {}
         
         # Verifica CLAUDE.md
-        claude_result = self._validate_claude_md(project_path)
+        claude_result = self._validate_claude_md(ctx)
         score += claude_result['score']
-        errors.extend(claude_result['errors'])
-        warnings.extend(claude_result['warnings'])
+        errors.update(dict.fromkeys(claude_result['errors']))
+        warnings.update(dict.fromkeys(claude_result['warnings']))
         
         # Verifica struttura directory
-        structure_result = self._validate_directory_structure(project_path)
+        structure_result = self._validate_directory_structure(project_path, entries)
         score += structure_result['score']
-        errors.extend(structure_result['errors'])
-        warnings.extend(structure_result['warnings'])
+        errors.update(dict.fromkeys(structure_result['errors']))
+        warnings.update(dict.fromkeys(structure_result['warnings']))
         
         return {
             'score': min(10, score),
             'max_score': max_score,
-            'errors': errors,
-            'warnings': warnings,
+            'errors': list(errors),
+            'warnings': list(warnings),
             'grade': self._calculate_grade(score, max_score)
         }
     
-    def validate_full(self, project_path: Path) -> Dict[str, Any]:
-        """Validazione completa del progetto"""
+    def validate_full(self, project_path: Path,
+                      min_grade: Optional[str] = None,
+                      max_level: str = 'quality') -> Dict[str, Any]:
+        """Validazione completa del progetto
+        
+        Con max_level ('basic', 'advanced' o 'quality') si limitano i livelli
+        eseguiti; con min_grade i livelli restanti vengono saltati appena il
+        voto richiesto non è più raggiungibile. I livelli saltati valgono
+        None in 'details' e non contribuiscono a score e grade.
+        """
+        if max_level not in _LEVELS:
+            raise ValueError(f"Livello di validazione non valido: {max_level}")
+        if min_grade is not None and min_grade not in _GRADES:
+            raise ValueError(f"Voto non valido: {min_grade}")
+        
+        return self._cached_result(
+            ('full', min_grade, max_level), project_path,
+            lambda: self._validate_full(project_path, min_grade, max_level)
+        )
+    
+    def _validate_full(self, project_path: Path,
+                       min_grade: Optional[str] = None,
+                       max_level: str = 'quality') -> Dict[str, Any]:
+        """Esegue la validazione completa senza passare dalla cache"""
         score = 0
         max_score = 20
-        errors = []
-        warnings = []
-        suggestions = []
+        errors: Dict[str, None] = {}
+        warnings: Dict[str, None] = {}
+        suggestions: Dict[str, None] = {}
+        
+        # La root del progetto e CLAUDE.md vengono letti una sola volta
+        entries, ctx = self._prepare(project_path)
+        
+        advanced_result = None
+        quality_result = None
+        if self._parallel and min_grade is None and max_level != 'basic':
+            # Senza min_grade i livelli non dipendono l'uno dall'altro
+            executor = self._get_executor()
+            basic_future = executor.submit(self._validate_setup, project_path, entries, ctx)
+            advanced_future = executor.submit(self._validate_advanced_setup, project_path, entries)
+            quality_future = None
+            if max_level == 'quality':
+                quality_future = executor.submit(self._validate_quality, project_path, entries, ctx)
+            
+            basic_result = basic_future.result()
+            advanced_result = advanced_future.result()
+            if quality_future is not None:
+                quality_result = quality_future.result()
+        else:
+            basic_result = self._validate_setup(project_path, entries, ctx)
+            partial_score = basic_result['score']
+            if self._should_run('advanced', partial_score, max_score, min_grade, max_level):
+                advanced_result = self._validate_advanced_setup(project_path, entries)
+                partial_score += advanced_result['score']
+                if self._should_run('quality', partial_score, max_score, min_grade, max_level):
+                    quality_result = self._validate_quality(project_path, entries, ctx)
         
         # Validazione base
-        basic_result = self.validate_setup(project_path)
         score += basic_result['score']
-        errors.extend(basic_result['errors'])
-        warnings.extend(basic_result['warnings'])
+        errors.update(dict.fromkeys(basic_result['errors']))
+        warnings.update(dict.fromkeys(basic_result['warnings']))
         
         # Validazione avanzata
-        advanced_result = self._validate_advanced_setup(project_path)
-        score += advanced_result['score']
-        errors.extend(advanced_result['errors'])
-        warnings.extend(advanced_result['warnings'])
-        suggestions.extend(advanced_result['suggestions'])
+        if advanced_result is not None:
+            score += advanced_result['score']
+            errors.update(dict.fromkeys(advanced_result['errors']))
+            warnings.update(dict.fromkeys(advanced_result['warnings']))
+            suggestions.update(dict.fromkeys(advanced_result['suggestions']))
         
         # Validazione qualità
-        quality_result = self._validate_quality(project_path)
-        score += quality_result['score']
-        warnings.extend(quality_result['warnings'])
-        suggestions.extend(quality_result['suggestions'])
+        if quality_result is not None:
+            score += quality_result['score']
+            warnings.update(dict.fromkeys(quality_result['warnings']))
+            suggestions.update(dict.fromkeys(quality_result['suggestions']))
         
         return {
             'score': min(10, int((score / max_score) * 10)),
             'max_score': 10,
-            'errors': errors,
-            'warnings': warnings,
-            'suggestions': suggestions,
+            'errors': list(errors),
+            'warnings': list(warnings),
+            'suggestions': list(suggestions),
             'grade': self._calculate_grade(score, max_score),
             'details': {
                 'basic': basic_result,
@@ -102,16 +286,170 @@ class SetupValidator:
             }
         }
     
-    def _validate_claude_md(self, project_path: Path) -> Dict[str, Any]:
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Pool di thread condiviso dalle validazioni, creato al primo uso"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(_LEVELS),
+                thread_name_prefix='setup-validator'
+            )
+        return self._executor
+    
+    def _should_run(self, level: str, score: float, max_score: float,
+                    min_grade: Optional[str], max_level: str) -> bool:
+        """Indica se eseguire un livello di validazione
+        
+        Un livello si salta se è oltre max_level o se, anche con il massimo
+        dei punti in questo e nei livelli successivi, min_grade resterebbe
+        irraggiungibile.
+        """
+        index = _LEVELS.index(level)
+        if index > _LEVELS.index(max_level):
+            return False
+        if min_grade is None:
+            return True
+        
+        best_score = score + sum(_LEVEL_MAX_SCORE[name] for name in _LEVELS[index:])
+        best_grade = self._calculate_grade(best_score, max_score)
+        return _GRADES.index(best_grade) >= _GRADES.index(min_grade)
+    
+    def _cached_result(self, kind: Any, project_path: Path,
+                       compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Restituisce il risultato in cache se i file letti non sono cambiati
+        
+        Il chiamante riceve sempre una copia: modificarla non altera la cache.
+        """
+        key = self._cache_key(kind, project_path)
+        if key is not None:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+        
+        result = compute()
+        
+        if key is not None:
+            if len(self._result_cache) >= _RESULT_CACHE_SIZE:
+                self._result_cache.pop(next(iter(self._result_cache)))
+            self._result_cache[key] = copy.deepcopy(result)
+        return result
+    
+    def _cache_key(self, kind: Any, project_path: Path) -> Optional[tuple]:
+        """Chiave di cache: percorso più mtime/dimensione dei file che la validazione legge"""
+        base = os.fspath(project_path)
+        try:
+            root_mtime = os.stat(base).st_mtime_ns
+        except OSError:
+            return None
+        
+        stamps = [root_mtime]
+        for name in _CACHE_WATCHED:
+            try:
+                st = os.stat(os.path.join(base, name))
+            except OSError:
+                stamps.append(None)
+            else:
+                stamps.append((st.st_mtime_ns, st.st_size))
+        
+        return (kind, os.path.abspath(base), tuple(stamps))
+    
+    def _cached_scan(self, path: str, scan: Callable[[str], Any]) -> Any:
+        """Esito di scan(path), riusato finché mtime e dimensione del file non cambiano"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return scan(path)
+        
+        key = (scan.__name__, os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        cached = self._file_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        result = scan(path)
+        with self._file_cache_lock:
+            if len(self._file_cache) >= _FILE_CACHE_SIZE:
+                self._file_cache.pop(next(iter(self._file_cache)))
+            self._file_cache[key] = result
+        return result
+    
+    def _scan_root(self, project_path: Path) -> Dict[str, os.DirEntry]:
+        """Elenca la root del progetto con un solo scandir"""
+        try:
+            with os.scandir(project_path) as it:
+                return {os.path.normcase(entry.name): entry for entry in it}
+        except OSError:
+            return {}
+    
+    def _has_entry(self, entries: Dict[str, os.DirEntry], name: str) -> bool:
+        """Equivalente di (project_path / name).exists() sull'elenco della root"""
+        entry = entries.get(os.path.normcase(name))
+        if entry is None:
+            return False
+        # I link simbolici contano solo se la destinazione esiste
+        if entry.is_symlink():
+            return os.path.exists(entry.path)
+        return True
+    
+    def _count_entries(self, entries: Dict[str, os.DirEntry], names: FrozenSet[str]) -> int:
+        """Quante voci di names esistono nella root, per intersezione con l'elenco"""
+        return sum(1 for name in entries.keys() & names if self._has_entry(entries, name))
+    
+    def _claude_context(self, project_path: Path, entries: Dict[str, os.DirEntry]) -> _ClaudeContext:
+        """Scansiona CLAUDE.md una sola volta per tutti i check"""
+        if not self._has_entry(entries, 'CLAUDE.md'):
+            return _ClaudeContext(False, 0, frozenset(), frozenset())
+        
+        length, matched, found = self._cached_scan(os.path.join(project_path, 'CLAUDE.md'), self._scan_claude_md)
+        matched |= frozenset(
+            group for group in self._claude_keywords if not found.isdisjoint(group)
+        )
+        return _ClaudeContext(True, length, matched, found)
+    
+    def _scan_claude_md(self, claude_path: str) -> Tuple[int, FrozenSet[Pattern], FrozenSet[str]]:
+        """Legge CLAUDE.md a blocchi e lo analizza in un'unica passata
+        
+        Nessun pattern o sottostringa attraversa un a capo: ogni blocco
+        viene analizzato fino all'ultima riga completa e il resto passa al
+        blocco successivo, senza tenere in memoria l'intero file.
+        """
+        length = 0
+        matched: FrozenSet[Pattern] = frozenset()
+        found: FrozenSet[str] = frozenset()
+        carry = ''
+        
+        with open(claude_path, 'r', encoding='utf-8') as f:
+            while True:
+                chunk = f.read(_READ_CHUNK)
+                length += len(chunk)
+                text = carry + chunk
+                if chunk:
+                    cut = text.rfind('\n') + 1
+                    text, carry = text[:cut], text[cut:]
+                
+                if text:
+                    if len(matched) < len(self._claude_res):
+                        matched = self._match_patterns(text, matched)
+                    if len(found) < len(self._needles):
+                        found = self._find_needles(text.lower(), found)
+                
+                if not chunk:
+                    break
+                # Tutto trovato e lunghezza oltre ogni soglia: il resto del
+                # file non può cambiare l'esito dei check
+                if (length > _CLAUDE_LENGTH_ENOUGH
+                        and len(matched) == len(self._claude_res)
+                        and len(found) == len(self._needles)):
+                    break
+        
+        return length, matched, found
+    
+    def _validate_claude_md(self, ctx: _ClaudeContext) -> Dict[str, Any]:
         """Valida file CLAUDE.md"""
         score = 0
         errors = []
         warnings = []
         
-        claude_path = project_path / 'CLAUDE.md'
-        
-        for check in self.claude_md_checks:
-            result = check(claude_path)
+        for check in self._CLAUDE_MD_CHECKS:
+            result = check(self, ctx)
             score += result['score']
             errors.extend(result['errors'])
             warnings.extend(result['warnings'])
@@ -122,20 +460,18 @@ class SetupValidator:
             'warnings': warnings
         }
     
-    def _validate_directory_structure(self, project_path: Path) -> Dict[str, Any]:
+    def _validate_directory_structure(self, project_path: Path, entries: Dict[str, os.DirEntry]) -> Dict[str, Any]:
         """Valida struttura directory"""
         score = 0
         errors = []
         warnings = []
         
         # Verifica directory .claude
-        claude_dir = project_path / '.claude'
-        if claude_dir.exists():
+        if self._has_entry(entries, '.claude'):
             score += 1
             
             # Verifica examples
-            examples_dir = claude_dir / 'examples'
-            if examples_dir.exists():
+            if os.path.exists(os.path.join(project_path, '.claude', 'examples')):
                 score += 1
             else:
                 warnings.append("Directory .claude/examples/ non trovata")
@@ -143,13 +479,11 @@ class SetupValidator:
             warnings.append("Directory .claude/ non trovata")
         
         # Verifica .context-engineer
-        ce_dir = project_path / '.context-engineer'
-        if ce_dir.exists():
+        if self._has_entry(entries, '.context-engineer'):
             score += 1
             
             # Verifica config.json
-            config_file = ce_dir / 'config.json'
-            if config_file.exists():
+            if os.path.exists(os.path.join(project_path, '.context-engineer', 'config.json')):
                 score += 0.5
             else:
                 warnings.append("File .context-engineer/config.json non trovato")
@@ -162,7 +496,7 @@ class SetupValidator:
             'warnings': warnings
         }
     
-    def _validate_advanced_setup(self, project_path: Path) -> Dict[str, Any]:
+    def _validate_advanced_setup(self, project_path: Path, entries: Dict[str, os.DirEntry]) -> Dict[str, Any]:
         """Validazione setup avanzato"""
         score = 0
         errors = []
@@ -170,23 +504,23 @@ class SetupValidator:
         suggestions = []
         
         # Verifica INITIAL.md
-        initial_path = project_path / 'INITIAL.md'
-        if initial_path.exists():
+        if self._has_entry(entries, 'INITIAL.md'):
             score += 2
-            initial_result = self._validate_initial_md(initial_path)
+            initial_path = os.path.join(project_path, 'INITIAL.md')
+            initial_result = self._cached_scan(initial_path, self._validate_initial_md)
             score += initial_result['score']
             warnings.extend(initial_result['warnings'])
         else:
             suggestions.append("Creare INITIAL.md per documentare feature corrente")
         
         # Verifica esempi
-        examples_result = self._validate_examples(project_path)
+        examples_result = self._validate_examples(project_path, entries)
         score += examples_result['score']
         warnings.extend(examples_result['warnings'])
         suggestions.extend(examples_result['suggestions'])
         
         # Verifica configurazioni framework-specifiche
-        framework_result = self._validate_framework_config(project_path)
+        framework_result = self._validate_framework_config(project_path, entries)
         score += framework_result['score']
         suggestions.extend(framework_result['suggestions'])
         
@@ -197,24 +531,25 @@ class SetupValidator:
             'suggestions': suggestions
         }
     
-    def _validate_quality(self, project_path: Path) -> Dict[str, Any]:
+    def _validate_quality(self, project_path: Path, entries: Dict[str, os.DirEntry],
+                          ctx: _ClaudeContext) -> Dict[str, Any]:
         """Valida qualità configurazione"""
         score = 0
         warnings = []
         suggestions = []
         
         # Verifica completezza documentazione
-        doc_result = self._validate_documentation_completeness(project_path)
+        doc_result = self._validate_documentation_completeness(project_path, entries)
         score += doc_result['score']
         suggestions.extend(doc_result['suggestions'])
         
         # Verifica consistenza
-        consistency_result = self._validate_consistency(project_path)
+        consistency_result = self._validate_consistency(ctx)
         score += consistency_result['score']
         warnings.extend(consistency_result['warnings'])
         
         # Verifica best practices
-        practices_result = self._validate_best_practices(project_path)
+        practices_result = self._validate_best_practices(project_path, entries)
         score += practices_result['score']
         suggestions.extend(practices_result['suggestions'])
         
@@ -224,21 +559,49 @@ class SetupValidator:
             'suggestions': suggestions
         }
     
+    def _find_needles(self, lower: str, found: FrozenSet[str] = frozenset()) -> FrozenSet[str]:
+        """Aggiunge a found le sottostringhe di self._needles presenti nel testo minuscolo"""
+        found = set(found)
+        for match in self._needle_re.finditer(lower):
+            needle = match.group(1)
+            if needle not in found:
+                found |= self._needle_implied[needle]
+                if len(found) == len(self._needles):
+                    break
+        return frozenset(found)
+    
+    def _match_patterns(self, content: str, matched: FrozenSet[Pattern] = frozenset()) -> FrozenSet[Pattern]:
+        """Aggiunge a matched i pattern di CLAUDE.md presenti nel testo, con una sola scansione"""
+        patterns = self._claude_res
+        matched = set(matched)
+        
+        for match in self._fused_re.finditer(content):
+            matched.add(patterns[int(match.lastgroup[1:])])
+            if len(matched) == len(patterns):
+                break
+        
+        # Nella stessa posizione vince solo la prima alternativa: i pattern
+        # non segnalati vengono ricontrollati singolarmente
+        for pattern in patterns:
+            if pattern not in matched and pattern.search(content):
+                matched.add(pattern)
+        
+        return frozenset(matched)
+    
     # Check functions per CLAUDE.md
-    def _check_file_exists(self, claude_path: Path) -> Dict[str, Any]:
+    def _check_file_exists(self, ctx: _ClaudeContext) -> Dict[str, Any]:
         """Verifica esistenza CLAUDE.md"""
-        if claude_path.exists():
+        if ctx.exists:
             return {'score': 1, 'errors': [], 'warnings': []}
         else:
             return {'score': 0, 'errors': ['CLAUDE.md non trovato'], 'warnings': []}
     
-    def _check_file_length(self, claude_path: Path) -> Dict[str, Any]:
+    def _check_file_length(self, ctx: _ClaudeContext) -> Dict[str, Any]:
         """Verifica lunghezza file"""
-        if not claude_path.exists():
+        if not ctx.exists:
             return {'score': 0, 'errors': [], 'warnings': []}
         
-        content = read_file(claude_path)
-        length = len(content)
+        length = ctx.length
         
         if length > 1000:
             return {'score': 1, 'errors': [], 'warnings': []}
@@ -247,149 +610,162 @@ class SetupValidator:
         else:
             return {'score': 0, 'errors': [], 'warnings': ['CLAUDE.md troppo breve']}
     
-    def _check_required_sections(self, claude_path: Path) -> Dict[str, Any]:
+    def _check_required_sections(self, ctx: _ClaudeContext) -> Dict[str, Any]:
         """Verifica sezioni richieste"""
-        if not claude_path.exists():
+        if not ctx.exists:
             return {'score': 0, 'errors': [], 'warnings': []}
         
-        content = read_file(claude_path)
         score = 0
         warnings = []
         
-        for section in self.required_sections:
-            if section.lower() in content.lower():
+        for section, section_lower in zip(self.REQUIRED_SECTIONS, self._sections_lower):
+            if section_lower in ctx.found:
                 score += 0.5
             else:
                 warnings.append(f"Sezione '{section}' mancante in CLAUDE.md")
         
         return {'score': min(2, score), 'errors': [], 'warnings': warnings}
     
-    def _check_project_info(self, claude_path: Path) -> Dict[str, Any]:
+    def _check_project_info(self, ctx: _ClaudeContext) -> Dict[str, Any]:
         """Verifica informazioni progetto"""
-        if not claude_path.exists():
+        if not ctx.exists:
             return {'score': 0, 'errors': [], 'warnings': []}
         
-        content = read_file(claude_path)
         score = 0
         warnings = []
         
         # Verifica presenza di informazioni chiave
-        info_patterns = [
-            r'(tipo.*progetto|project.*type)',
-            r'(framework|tecnologie)',
-            r'(linguaggi|languages)',
-            r'(descrizione|description)'
-        ]
-        
-        for pattern in info_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+        for group in self._project_info_groups:
+            if group in ctx.matched:
                 score += 0.25
+                if score >= 1:
+                    break
         
         if score < 0.5:
             warnings.append("CLAUDE.md dovrebbe includere più informazioni sul progetto")
         
         return {'score': min(1, score), 'errors': [], 'warnings': warnings}
     
-    def _check_setup_instructions(self, claude_path: Path) -> Dict[str, Any]:
+    def _check_setup_instructions(self, ctx: _ClaudeContext) -> Dict[str, Any]:
         """Verifica istruzioni setup"""
-        if not claude_path.exists():
+        if not ctx.exists:
             return {'score': 0, 'errors': [], 'warnings': []}
         
-        content = read_file(claude_path)
         score = 0
         warnings = []
         
-        setup_patterns = [
-            r'(setup|installazione|installation)',
-            r'(comando|command|run)',
-            r'(ambiente|environment)',
-            r'(dipendenze|dependencies)'
-        ]
-        
-        for pattern in setup_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+        for group in self._setup_groups:
+            if group in ctx.matched:
                 score += 0.25
+                if score >= 1:
+                    break
         
         if score < 0.5:
             warnings.append("CLAUDE.md dovrebbe includere istruzioni di setup")
         
         return {'score': min(1, score), 'errors': [], 'warnings': warnings}
     
-    def _check_best_practices(self, claude_path: Path) -> Dict[str, Any]:
+    def _check_best_practices(self, ctx: _ClaudeContext) -> Dict[str, Any]:
         """Verifica best practices"""
-        if not claude_path.exists():
+        if not ctx.exists:
             return {'score': 0, 'errors': [], 'warnings': []}
         
-        content = read_file(claude_path)
+        found = ctx.found
         score = 0
         warnings = []
         
-        if 'best practices' in content.lower() or 'buone pratiche' in content.lower():
+        if 'best practices' in found or 'buone pratiche' in found:
             score += 0.5
         else:
             warnings.append("CLAUDE.md dovrebbe includere best practices")
         
-        if 'convenzioni' in content.lower() or 'conventions' in content.lower():
+        if 'convenzioni' in found or 'conventions' in found:
             score += 0.5
         else:
             warnings.append("CLAUDE.md dovrebbe definire convenzioni di codice")
         
         return {'score': min(1, score), 'errors': [], 'warnings': warnings}
     
-    def _check_workflow_defined(self, claude_path: Path) -> Dict[str, Any]:
+    def _check_workflow_defined(self, ctx: _ClaudeContext) -> Dict[str, Any]:
         """Verifica definizione workflow"""
-        if not claude_path.exists():
+        if not ctx.exists:
             return {'score': 0, 'errors': [], 'warnings': []}
         
-        content = read_file(claude_path)
         score = 0
         warnings = []
         
-        workflow_patterns = [
-            r'(workflow|flusso.*lavoro)',
-            r'(step|passi|processo)',
-            r'(1\.|2\.|3\.)',  # Numerazione
-            r'(prima|poi|dopo|infine)'
-        ]
-        
-        for pattern in workflow_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+        for group in self._workflow_groups:
+            if group in ctx.matched:
                 score += 0.25
+                if score >= 1:
+                    break
         
         if score < 0.5:
             warnings.append("CLAUDE.md dovrebbe definire un workflow di sviluppo")
         
         return {'score': min(1, score), 'errors': [], 'warnings': warnings}
     
-    def _validate_initial_md(self, initial_path: Path) -> Dict[str, Any]:
+    _CLAUDE_MD_CHECKS = (
+        _check_file_exists,
+        _check_file_length,
+        _check_required_sections,
+        _check_project_info,
+        _check_setup_instructions,
+        _check_best_practices,
+        _check_workflow_defined
+    )
+    
+    def _validate_initial_md(self, initial_path: str) -> Dict[str, Any]:
         """Valida INITIAL.md"""
-        content = read_file(initial_path)
         score = 0
         warnings = []
         
-        required_sections = ['descrizione', 'obiettivi', 'implementazione', 'criteri']
+        required_sections = self._initial_sections
+        
+        # Lettura a blocchi: ci si ferma appena trovate tutte le sezioni e
+        # superata la lunghezza minima, senza caricare l'intero file
+        found = set()
+        length = 0
+        overlap = self._initial_overlap
+        tail = ''
+        try:
+            with open(initial_path, 'r', encoding='utf-8') as f:
+                while True:
+                    chunk = f.read(_READ_CHUNK)
+                    if not chunk:
+                        break
+                    length += len(chunk)
+                    window = tail + chunk.lower()
+                    for section in required_sections:
+                        if section not in found and section in window:
+                            found.add(section)
+                    if len(found) == len(required_sections) and length >= 500:
+                        break
+                    tail = window[-overlap:]
+        except FileNotFoundError:
+            pass
         
         for section in required_sections:
-            if section in content.lower():
+            if section in found:
                 score += 0.25
         
-        if len(content) < 500:
+        if length < 500:
             warnings.append("INITIAL.md dovrebbe essere più dettagliato")
         
         return {'score': min(1, score), 'warnings': warnings}
     
-    def _validate_examples(self, project_path: Path) -> Dict[str, Any]:
+    def _validate_examples(self, project_path: Path, entries: Dict[str, os.DirEntry]) -> Dict[str, Any]:
         """Valida esempi nel progetto"""
         score = 0
         warnings = []
         suggestions = []
         
-        examples_dir = project_path / '.claude' / 'examples'
-        if examples_dir.exists():
-            examples = list(examples_dir.glob('*.md'))
+        examples_dir = os.path.join(project_path, '.claude', 'examples')
+        if self._has_entry(entries, '.claude') and os.path.exists(examples_dir):
+            examples = self._count_markdown(examples_dir, limit=3)
             if examples:
                 score += 1
-                if len(examples) > 2:
+                if examples > 2:
                     score += 0.5
             else:
                 warnings.append("Directory examples/ vuota")
@@ -398,21 +774,30 @@ class SetupValidator:
         
         return {'score': min(1.5, score), 'warnings': warnings, 'suggestions': suggestions}
     
-    def _validate_framework_config(self, project_path: Path) -> Dict[str, Any]:
+    def _count_markdown(self, directory: str, limit: int) -> int:
+        """Conta le voci *.md di una directory, fermandosi a limit
+        
+        Stesse voci di directory.glob('*.md'), senza creare oggetti Path.
+        """
+        count = 0
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if os.path.normcase(entry.name).endswith('.md'):
+                        count += 1
+                        if count >= limit:
+                            break
+        except OSError:
+            pass
+        return count
+    
+    def _validate_framework_config(self, project_path: Path, entries: Dict[str, os.DirEntry]) -> Dict[str, Any]:
         """Valida configurazioni framework-specifiche"""
         score = 0
         suggestions = []
         
         # Verifica configurazioni comuni
-        config_files = [
-            'package.json', 'composer.json', 'requirements.txt',
-            'tsconfig.json', 'webpack.config.js', 'vite.config.js'
-        ]
-        
-        found_configs = 0
-        for config_file in config_files:
-            if (project_path / config_file).exists():
-                found_configs += 1
+        found_configs = self._count_entries(entries, _CONFIG_FILES)
         
         if found_configs > 0:
             score += 1
@@ -422,56 +807,51 @@ class SetupValidator:
         
         return {'score': min(1, score), 'suggestions': suggestions}
     
-    def _validate_documentation_completeness(self, project_path: Path) -> Dict[str, Any]:
+    def _validate_documentation_completeness(self, project_path: Path, entries: Dict[str, os.DirEntry]) -> Dict[str, Any]:
         """Valida completezza documentazione"""
         score = 0
         suggestions = []
         
         # Verifica presenza README
-        readme_files = ['README.md', 'readme.md', 'README.txt']
-        if any((project_path / readme).exists() for readme in readme_files):
+        if self._count_entries(entries, _README_FILES):
             score += 0.5
         else:
             suggestions.append("Creare README.md con informazioni base del progetto")
         
         # Verifica documentazione API
-        if (project_path / 'docs').exists():
+        if self._has_entry(entries, 'docs'):
             score += 0.5
         else:
             suggestions.append("Considerare creare directory docs/ per documentazione")
         
         return {'score': min(1, score), 'suggestions': suggestions}
     
-    def _validate_consistency(self, project_path: Path) -> Dict[str, Any]:
+    def _validate_consistency(self, ctx: _ClaudeContext) -> Dict[str, Any]:
         """Valida consistenza configurazione"""
         score = 1  # Base score
         warnings = []
         
-        claude_path = project_path / 'CLAUDE.md'
-        if claude_path.exists():
-            claude_content = read_file(claude_path)
-            
+        if ctx.exists:
             # Verifica che le informazioni siano consistenti
             # (implementazione semplificata)
-            if len(claude_content) > 100:
+            if ctx.length > 100:
                 score += 0.5
         
         return {'score': min(1, score), 'warnings': warnings}
     
-    def _validate_best_practices(self, project_path: Path) -> Dict[str, Any]:
+    def _validate_best_practices(self, project_path: Path, entries: Dict[str, os.DirEntry]) -> Dict[str, Any]:
         """Valida implementazione best practices"""
         score = 0
         suggestions = []
         
         # Verifica .gitignore
-        if (project_path / '.gitignore').exists():
+        if self._has_entry(entries, '.gitignore'):
             score += 0.5
         else:
             suggestions.append("Creare .gitignore appropriato")
         
         # Verifica presenza test
-        test_dirs = ['test', 'tests', '__tests__', 'spec']
-        if any((project_path / test_dir).exists() for test_dir in test_dirs):
+        if self._count_entries(entries, _TEST_DIRS):
             score += 0.5
         else:
             suggestions.append("Implementare test suite per il progetto")
@@ -481,24 +861,4 @@ class SetupValidator:
     def _calculate_grade(self, score: float, max_score: float) -> str:
         """Calcola voto in lettere"""
         percentage = (score / max_score) * 100
-        
-        if percentage >= 90:
-            return 'A+'
-        elif percentage >= 85:
-            return 'A'
-        elif percentage >= 80:
-            return 'A-'
-        elif percentage >= 75:
-            return 'B+'
-        elif percentage >= 70:
-            return 'B'
-        elif percentage >= 65:
-            return 'B-'
-        elif percentage >= 60:
-            return 'C+'
-        elif percentage >= 55:
-            return 'C'
-        elif percentage >= 50:
-            return 'C-'
-        else:
-            return 'D'
\ No newline at end of file
+        return _GRADES[bisect.bisect_right(_GRADE_THRESHOLDS, percentage)]
@@ -0,0 +1,82 @@
+"""
+Parity tests for the simulated MCP responses of BestPracticesClient
+"""
+
+import asyncio
+import itertools
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from mcp_integration.best_practices_client import BestPracticesClient
+
+QUERIES = [
+    '', 'cybersecurity', 'struttur', 'architectures', 'documentation practice',
+    'security', 'performance best practice', 'structure', 'bestructure',
+    'Struttura MVC', 'react hooks', 'laravel', 'django architecture', 'testing',
+    'php best practices laravel patterns web architecture security'
+]
+
+CONTEXTS = [
+    None,
+    {'language': 'php', 'framework': 'laravel', 'project_type': 'web'},
+    {'language': 'javascript', 'framework': 'react', 'project_type': 'spa'},
+    {'language': 'python', 'framework': 'django', 'project_type': 'api'},
+    {'language': 'go', 'framework': '', 'project_type': ''}
+]
+
+KEYWORDS = ['structure', 'security', 'performance', 'architecture', 'best', 'practice']
+
+
+def reference_scores(practices, query):
+    """Original substring scorer: (id, score) of the top 5 and the total found"""
+    query_lower = query.lower()
+    scored = []
+    
+    for practice in practices:
+        score = 0
+        if query_lower in practice['title'].lower():
+            score += 3
+        if query_lower in practice['description'].lower():
+            score += 2
+        if practice['category'] in query_lower:
+            score += 2
+        for keyword in KEYWORDS:
+            if keyword in query_lower and keyword in practice['description'].lower():
+                score += 1
+        if score > 0:
+            scored.append((practice['id'], score))
+    
+    scored.sort(key=lambda item: item[1], reverse=True)
+    return scored[:5], len(scored)
+
+
+class SimulatedResponseParityTest(unittest.TestCase):
+    
+    def test_matches_substring_scorer(self):
+        client = BestPracticesClient()
+        
+        for query, context in itertools.product(QUERIES, CONTEXTS):
+            with self.subTest(query=query, context=context):
+                response = asyncio.run(
+                    client._simulate_mcp_response('context_engineering', query, context)
+                )
+                
+                language = (context or {}).get('language', '')
+                framework = (context or {}).get('framework', '')
+                data_key = {
+                    ('php', 'laravel'): 'php_laravel',
+                    ('javascript', 'react'): 'javascript_react',
+                    ('python', 'django'): 'python_django'
+                }.get((language, framework), 'general')
+                expected, total = reference_scores(client.fallback_practices.get(data_key, []), query)
+                
+                got = [(practice['id'], practice['relevance_score']) for practice in response['practices']]
+                self.assertEqual(got, expected)
+                self.assertEqual(response['total_found'], total)
+
+
+if __name__ == '__main__':
+    unittest.main()